@@ -26,14 +26,24 @@ SCRAPE_DELAY_SECONDS: float = 2.0  # Delay between page loads (be respectful)
 PAGE_LOAD_TIMEOUT_MS: int = 45000  # 45 seconds for page to load (increased for slow SPAs)
 MAX_PAGES_PER_COMPANY: int = 50  # Maximum pages to scrape per company
 MAX_RETRIES: int = 3  # Retries on failure
+MAX_CONCURRENT_PER_HOST: int = 4  # Concurrent requests allowed per hostname
+HTTP_CACHE_DIR: str = os.getenv("HTTP_CACHE_DIR", ".cache/http")  # Conditional-GET cache for API responses
+HTTP_CACHE_TTL_SECONDS: int = int(os.getenv("HTTP_CACHE_TTL_SECONDS", "0"))  # Reuse cached API responses this young without a request (0 = always revalidate)
+
+# Browser pool settings (shared Chromium instances handing out contexts)
+BROWSER_POOL_SIZE: int = int(os.getenv("BROWSER_POOL_SIZE", "2"))  # Browsers kept running
+BROWSER_POOL_RECYCLE_AFTER: int = int(os.getenv("BROWSER_POOL_RECYCLE_AFTER", "100"))  # Relaunch after N contexts
+CDP_ENDPOINT: str = os.getenv("CDP_ENDPOINT", "")  # e.g. http://localhost:9222 to share an already-running Chromium
 
 # Batch settings (for large-scale scraping)
 COMPANIES_PER_BATCH: int = 10  # Process companies in batches
+MAX_CONCURRENT_COMPANIES: int = 8  # Companies in a batch scraped at the same time
 BATCH_DELAY_SECONDS: float = 5.0  # Delay between batches
 
 # Google Sheets settings
 COMPANIES_SHEET_ID: str = os.getenv("COMPANIES_SHEET_ID", "")
 JOBS_SHEET_ID: str = os.getenv("JOBS_SHEET_ID", "")
+JOBS_SNAPSHOT_DIR: str = os.getenv("JOBS_SNAPSHOT_DIR", ".cache/sheets")  # Local copy of the jobs sheet's job-ID column
 
 # Sheet names (tabs within the spreadsheet)
 COMPANIES_SHEET_NAME: str = "Sheet1"
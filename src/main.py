@@ -10,9 +10,12 @@ This script orchestrates the job scraping process:
 """
 import argparse
 import asyncio
+import atexit
+import logging
+import logging.handlers
+import queue
 import os
 import sys
-from datetime import datetime
 from typing import List, Dict, Any
 
 # Add src to path for imports
@@ -23,17 +26,52 @@ from dotenv import load_dotenv
 from config import (
     COMPANIES_PER_BATCH,
     BATCH_DELAY_SECONDS,
+    MAX_CONCURRENT_COMPANIES,
     STATUS_ACTIVE,
     STATUS_ERROR,
 )
-from sheets_client import SheetsClient
+from sheets_client import SheetsClient, utc_now
 from scraper.dispatcher import ScraperDispatcher
 from scraper.base_scraper import Job
-from utils.deduplication import filter_new_jobs, find_existing_jobs
+from scraper.browser_pool import browser_pool
+from utils.deduplication import (
+    adopt_stored_job_ids, content_keys_from_rows, filter_near_duplicates, partition_jobs,
+)
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+def configure_logging(verbose: bool = False) -> logging.handlers.QueueListener:
+    """
+    Route every module logger through a queue drained by a background thread.
+
+    Scrapers log from the event loop; with a QueueHandler they only enqueue
+    the record, and the stdout write happens on the listener thread instead
+    of blocking the loop on the stream lock.
+
+    Args:
+        verbose: Log at DEBUG instead of INFO.
+
+    Returns:
+        The started listener (stopped, and flushed, at interpreter exit).
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
 
 async def scrape_company(company: Dict[str, str]) -> List[Job]:
     """
@@ -49,10 +87,10 @@ async def scrape_company(company: Dict[str, str]) -> List[Job]:
     career_url = company["career_url"]
     platform_type = company.get("platform_type", "")
 
-    print(f"\n{'='*60}")
-    print(f"Scraping: {company_name}")
-    print(f"URL: {career_url}")
-    print(f"{'='*60}")
+    logger.info("\n" + "=" * 60)
+    logger.info("Scraping: %s", company_name)
+    logger.info("URL: %s", career_url)
+    logger.info("=" * 60)
 
     try:
         scraper = ScraperDispatcher.get_scraper(
@@ -64,10 +102,65 @@ async def scrape_company(company: Dict[str, str]) -> List[Job]:
         return jobs
 
     except Exception as e:
-        print(f"Error scraping {company_name}: {e}")
+        logger.error("Error scraping %s: %s", company_name, e)
         return []
 
 
+async def scrape_all(companies: List[Dict[str, str]]) -> List[Any]:
+    """
+    Scrape several companies concurrently.
+
+    At most MAX_CONCURRENT_COMPANIES scrapers run at once; each gets its own
+    browser context, so their page loads overlap instead of queueing.
+
+    Args:
+        companies: List of company dicts.
+
+    Returns:
+        One entry per company, in order: its list of Jobs, or the exception
+        the scrape raised.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMPANIES)
+
+    async def run(company: Dict[str, str]) -> List[Job]:
+        async with semaphore:
+            return await scrape_company(company)
+
+    return await asyncio.gather(*(run(company) for company in companies), return_exceptions=True)
+
+
+def write_batch_results(
+    sheets_client: SheetsClient,
+    pending_jobs: Dict[str, List[Job]],
+    initial_load_companies: set,
+    last_seen_ids: List[str],
+    status_updates: List[tuple],
+):
+    """
+    Write one batch's results to Google Sheets.
+
+    Blocking; process_companies runs it in a worker thread.
+
+    Args:
+        sheets_client: Google Sheets client.
+        pending_jobs: Company name -> new Jobs to append.
+        initial_load_companies: Companies scraped for the first time.
+        last_seen_ids: IDs of already-known jobs seen again.
+        status_updates: (company_name, status) pairs.
+    """
+    # One timestamp covers every row written for the batch
+    now = utc_now()
+
+    if pending_jobs:
+        sheets_client.append_jobs_bulk(pending_jobs, initial_load_companies, now=now)
+
+    if last_seen_ids:
+        sheets_client.update_job_last_seen(last_seen_ids, now=now)
+
+    if status_updates:
+        sheets_client.update_company_statuses(status_updates, now=now)
+
+
 async def process_companies(
     companies: List[Dict[str, str]],
     sheets_client: SheetsClient,
@@ -91,98 +184,132 @@ async def process_companies(
         "new_jobs_added": 0,
         "existing_jobs_updated": 0,
         "initial_load_jobs": 0,
+        "near_duplicates_skipped": 0,
     }
 
     # Get existing job IDs for deduplication
     if not dry_run:
-        print("\nFetching existing jobs for deduplication...")
+        logger.info("\nFetching existing jobs for deduplication...")
         existing_ids = sheets_client.get_existing_job_ids()
-        print(f"Found {len(existing_ids)} existing jobs in database")
+        logger.info("Found %s existing jobs in database", len(existing_ids))
         
         # Get companies that have already been scraped (have jobs in sheet)
         scraped_companies = sheets_client.get_scraped_companies()
-        print(f"Found {len(scraped_companies)} companies with existing jobs")
+        logger.info("Found %s companies with existing jobs", len(scraped_companies))
+
+        # Content keys of the stored jobs (and, below, of the new jobs queued this
+        # run), so the same posting reached through another career URL is only added once
+        seen_content_keys = content_keys_from_rows(sheets_client.get_existing_job_contents())
+
+        # Workday job IDs now come from the posting's requisition suffix; rows stored
+        # under the older location-slug IDs are matched to their postings by URL
+        stored_workday_ids = sheets_client.get_job_ids_by_url("WD_")
     else:
         existing_ids = set()
         scraped_companies = set()
+        seen_content_keys = {}
+        stored_workday_ids = {}
 
     # Process companies in batches
+    write_task = None
     for i in range(0, len(companies), COMPANIES_PER_BATCH):
         batch = companies[i:i + COMPANIES_PER_BATCH]
         batch_num = (i // COMPANIES_PER_BATCH) + 1
         total_batches = (len(companies) + COMPANIES_PER_BATCH - 1) // COMPANIES_PER_BATCH
 
-        print(f"\n{'#'*60}")
-        print(f"Processing batch {batch_num}/{total_batches}")
-        print(f"{'#'*60}")
+        logger.info("\n" + "#" * 60)
+        logger.info("Processing batch %s/%s", batch_num, total_batches)
+        logger.info("#" * 60)
+
+        # Scrape the whole batch concurrently (overlapping the previous
+        # batch's sheet writes), then record results in order
+        batch_results = await scrape_all(batch)
 
-        for company in batch:
+        # Sheet writes for the whole batch, made in one go
+        pending_jobs: Dict[str, List[Job]] = {}
+        initial_load_companies = set()
+        last_seen_ids: List[str] = []
+        status_updates: List[tuple] = []
+
+        for company, jobs in zip(batch, batch_results):
             company_name = company["company_name"]
             
             try:
-                jobs = await scrape_company(company)
+                if isinstance(jobs, Exception):
+                    raise jobs
                 stats["companies_processed"] += 1
 
                 if jobs:
-                    job_dicts = [job.to_dict() for job in jobs]
-                    stats["total_jobs_found"] += len(job_dicts)
+                    stats["total_jobs_found"] += len(jobs)
 
                     # Deduplicate
-                    new_jobs = filter_new_jobs(job_dicts, existing_ids)
-                    existing_job_ids = find_existing_jobs(job_dicts, existing_ids)
+                    if stored_workday_ids:
+                        adopt_stored_job_ids(jobs, stored_workday_ids)
+                    new_jobs, existing_job_ids = partition_jobs(jobs, existing_ids)
+                    unique_jobs = filter_near_duplicates(new_jobs, seen_content_keys)
+                    stats["near_duplicates_skipped"] += len(new_jobs) - len(unique_jobs)
+                    new_jobs = unique_jobs
 
                     # Check if this is the first time scraping this company
                     is_initial_load = company_name not in scraped_companies
 
                     if is_initial_load:
                         stats["initial_load_jobs"] += len(new_jobs)
-                        print(f"  [INITIAL LOAD] First time scraping {company_name}")
+                        logger.info("  [INITIAL LOAD] First time scraping %s", company_name)
                     else:
                         stats["new_jobs_added"] += len(new_jobs)
                     
                     stats["existing_jobs_updated"] += len(existing_job_ids)
 
                     if not dry_run:
-                        # Add new jobs
+                        # Queue new jobs for the batch write
                         if new_jobs:
-                            sheets_client.append_jobs(
-                                new_jobs,
-                                is_initial_load=is_initial_load,
-                                company_name=company_name,
-                            )
+                            pending_jobs[company_name] = new_jobs
+                            if is_initial_load:
+                                initial_load_companies.add(company_name)
                             # Add to existing_ids to prevent duplicates within this run
                             for job in new_jobs:
-                                existing_ids.add(job["job_id"])
+                                existing_ids.add(job.job_id)
                             # Mark company as scraped
                             scraped_companies.add(company_name)
 
                         # Update last_seen for existing jobs
-                        if existing_job_ids:
-                            sheets_client.update_job_last_seen(existing_job_ids)
+                        last_seen_ids.extend(existing_job_ids)
 
                         # Update company status
-                        sheets_client.update_company_status(
-                            company_name,
-                            STATUS_ACTIVE,
-                        )
+                        status_updates.append((company_name, STATUS_ACTIVE))
 
-                    print(f"  → {len(new_jobs)} new jobs, {len(existing_job_ids)} existing")
+                    logger.info("  → %s new jobs, %s existing", len(new_jobs), len(existing_job_ids))
 
             except Exception as e:
-                print(f"Error processing {company['company_name']}: {e}")
+                logger.error("Error processing %s: %s", company['company_name'], e)
                 stats["companies_with_errors"] += 1
 
                 if not dry_run:
-                    sheets_client.update_company_status(
-                        company["company_name"],
-                        STATUS_ERROR,
-                    )
+                    status_updates.append((company["company_name"], STATUS_ERROR))
+
+        if not dry_run:
+            # The Sheets client is blocking; run the writes in a worker thread
+            # while the next batch scrapes, one batch's writes at a time
+            if write_task:
+                await write_task
+            write_task = asyncio.create_task(asyncio.to_thread(
+                write_batch_results,
+                sheets_client,
+                pending_jobs,
+                initial_load_companies,
+                last_seen_ids,
+                status_updates,
+            ))
 
         # Delay between batches
         if i + COMPANIES_PER_BATCH < len(companies):
-            print(f"\nWaiting {BATCH_DELAY_SECONDS}s before next batch...")
+            logger.info("\nWaiting %ss before next batch...", BATCH_DELAY_SECONDS)
             await asyncio.sleep(BATCH_DELAY_SECONDS)
 
+    if write_task:
+        await write_task
+
     return stats
 
 
@@ -209,62 +336,75 @@ async def main():
         type=str,
         help="Use local CSV file instead of Google Sheets",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging",
+    )
     args = parser.parse_args()
 
-    print("=" * 60)
-    print("Fortune Job Scraper")
-    print(f"Started at: {datetime.utcnow().isoformat()}")
-    print("=" * 60)
+    configure_logging(args.verbose)
+
+    logger.info("=" * 60)
+    logger.info("Fortune Job Scraper")
+    logger.info("Started at: %s", utc_now().isoformat())
+    logger.info("=" * 60)
 
     # Initialize sheets client
     if args.local_csv:
-        print(f"\nUsing local CSV: {args.local_csv}")
+        logger.info("\nUsing local CSV: %s", args.local_csv)
         companies = load_companies_from_csv(args.local_csv)
         sheets_client = None
         args.dry_run = True  # Force dry run with local CSV
     else:
         try:
             sheets_client = SheetsClient(credentials_path="credentials.json")
-            print("\nConnected to Google Sheets")
+            logger.info("\nConnected to Google Sheets")
             companies = sheets_client.get_companies()
         except Exception as e:
-            print(f"\nError connecting to Google Sheets: {e}")
-            print("Use --local-csv to test with a local CSV file")
+            logger.error("\nError connecting to Google Sheets: %s", e)
+            logger.info("Use --local-csv to test with a local CSV file")
             return
 
     # Filter companies
     if args.company:
         companies = [c for c in companies if c["company_name"].lower() == args.company.lower()]
         if not companies:
-            print(f"Company '{args.company}' not found")
+            logger.error("Company '%s' not found", args.company)
             return
 
     # Test mode: only process first 3
     if args.test and len(companies) > 3:
         companies = companies[:3]
-        print(f"\n[TEST MODE] Processing only {len(companies)} companies")
+        logger.info("\n[TEST MODE] Processing only %s companies", len(companies))
 
-    print(f"\nFound {len(companies)} companies to process")
+    logger.info("\nFound %s companies to process", len(companies))
 
     # Process companies
-    stats = await process_companies(
-        companies=companies,
-        sheets_client=sheets_client,
-        dry_run=args.dry_run,
-    )
+    try:
+        stats = await process_companies(
+            companies=companies,
+            sheets_client=sheets_client,
+            dry_run=args.dry_run,
+        )
+    finally:
+        await browser_pool.close()
+        if sheets_client:
+            sheets_client.close()
 
     # Print summary
-    print("\n" + "=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
-    print(f"Companies processed: {stats['companies_processed']}")
-    print(f"Companies with errors: {stats['companies_with_errors']}")
-    print(f"Total jobs found: {stats['total_jobs_found']}")
-    print(f"Initial load jobs (new companies): {stats.get('initial_load_jobs', 0)}")
-    print(f"New job postings (existing companies): {stats['new_jobs_added']}")
-    print(f"Existing jobs updated: {stats['existing_jobs_updated']}")
-    print(f"Completed at: {datetime.utcnow().isoformat()}")
-    print("=" * 60)
+    logger.info("\n" + "=" * 60)
+    logger.info("SUMMARY")
+    logger.info("=" * 60)
+    logger.info("Companies processed: %s", stats['companies_processed'])
+    logger.info("Companies with errors: %s", stats['companies_with_errors'])
+    logger.info("Total jobs found: %s", stats['total_jobs_found'])
+    logger.info("Initial load jobs (new companies): %s", stats.get('initial_load_jobs', 0))
+    logger.info("New job postings (existing companies): %s", stats['new_jobs_added'])
+    logger.info("Existing jobs updated: %s", stats['existing_jobs_updated'])
+    logger.info("Near-duplicate jobs skipped: %s", stats['near_duplicates_skipped'])
+    logger.info("Completed at: %s", utc_now().isoformat())
+    logger.info("=" * 60)
 
 
 def load_companies_from_csv(csv_path: str) -> List[Dict[str, str]]:
@@ -2,16 +2,31 @@
 Base scraper class defining the interface for all platform-specific scrapers.
 """
 import hashlib
-import re
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional
 from urllib.parse import urljoin, urlparse
 
-from config import KEYWORDS
+from playwright.async_api import BrowserContext, Page
 
+from scraper.browser_pool import browser_pool
+from utils.job_filter import matches_any_keyword
 
-@dataclass
+# Job pages repeat the same relative hrefs many times; cache the joins
+_cached_urljoin = lru_cache(maxsize=4096)(urljoin)
+
+# Runs a list of CSS selectors in one round-trip, returning the [href, text]
+# rows of each selector in the list's order so callers keep selector priority;
+# use with page.evaluate(HREF_AND_TEXT_BY_SELECTOR_JS, selectors)
+HREF_AND_TEXT_BY_SELECTOR_JS = '''selectors => selectors.map(sel => Array.from(
+    document.querySelectorAll(sel),
+    el => [el.getAttribute("href"), el.textContent]
+))'''
+
+
+@dataclass(slots=True)
 class Job:
     """Represents a scraped job listing."""
 
@@ -41,17 +56,55 @@ class Job:
 class BaseScraper(ABC):
     """Abstract base class for job scrapers."""
 
-    def __init__(self, company_name: str, career_url: str):
+    def __init__(
+        self,
+        company_name: str,
+        career_url: str,
+        context: Optional[BrowserContext] = None,
+    ):
         """
         Initialize the scraper.
 
         Args:
             company_name: Name of the company being scraped.
             career_url: Base career page URL.
+            context: Optional shared BrowserContext to open pages in. When not
+                given, browser-based scrapers get their own pooled context.
         """
         self.company_name = company_name
         self.career_url = career_url
         self.base_domain = self._extract_base_domain(career_url)
+        self.context = context
+
+    @asynccontextmanager
+    async def open_page(self, **context_options) -> AsyncIterator[Page]:
+        """
+        Open a page for this scrape and clean it up afterwards.
+
+        Uses the injected context if there is one (closing only the page),
+        otherwise a fresh context from the shared browser pool (closing the
+        context).
+
+        Args:
+            **context_options: Options for a pooled context (viewport, user_agent...).
+                Ignored when a context was injected.
+
+        Yields:
+            A new Page.
+        """
+        if self.context is not None:
+            page = await self.context.new_page()
+            try:
+                yield page
+            finally:
+                await page.close()
+            return
+
+        context = await browser_pool.acquire_context(**context_options)
+        try:
+            yield await context.new_page()
+        finally:
+            await context.close()
 
     @staticmethod
     def _extract_base_domain(url: str) -> str:
@@ -75,7 +128,9 @@ class BaseScraper(ABC):
         """
         Generate a unique job ID from URL and title.
 
-        Uses a hash to create a consistent, unique identifier.
+        Uses a hash to create a consistent, unique identifier. The IDs are
+        stored in the jobs sheet, so the derivation (first 16 hex chars of
+        the MD5) must not change or stored jobs would be re-added.
         """
         # Normalize the URL (remove query params that might change)
         parsed = urlparse(job_url)
@@ -95,16 +150,8 @@ class BaseScraper(ABC):
         Returns:
             List of matched keywords (empty if no match).
         """
-        title_lower = job_title.lower()
-        matched = []
-
-        for keyword in KEYWORDS:
-            # Use word boundary matching to avoid partial matches
-            pattern = r"\b" + re.escape(keyword.lower()) + r"\b"
-            if re.search(pattern, title_lower):
-                matched.append(keyword)
-
-        return matched
+        # Single-pass whole-word matching against config.KEYWORDS
+        return matches_any_keyword(job_title)
 
     def normalize_url(self, url: str, base_url: Optional[str] = None) -> str:
         """
@@ -126,11 +173,12 @@ class BaseScraper(ABC):
 
         # Relative URL - make absolute
         base = base_url or self.base_domain
-        return urljoin(base, url)
+        return _cached_urljoin(base, url)
 
     def clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
         if not text:
             return ""
-        # Remove extra whitespace
-        return " ".join(text.split()).strip()
+        # Collapse whitespace runs; split() drops leading/trailing whitespace
+        # so no strip() is needed
+        return " ".join(text.split())
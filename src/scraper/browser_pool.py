@@ -0,0 +1,182 @@
+"""
+Process-wide pool of Chromium browsers shared by the scrapers.
+
+Launching Chromium costs seconds and several processes, while a new
+BrowserContext is cheap and still gives each scrape isolated cookies and
+storage. The pool keeps a few browsers running, hands out fresh contexts
+round-robin, and relaunches a browser after it has served enough contexts
+to keep its memory in check.
+
+If CDP_ENDPOINT is set, the pool attaches to an already-running Chromium
+(started with --remote-debugging-port) instead of launching its own, so
+several scraper processes can share one browser.
+"""
+import asyncio
+import logging
+from typing import Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright, Route
+
+from config import BROWSER_POOL_SIZE, BROWSER_POOL_RECYCLE_AFTER, CDP_ENDPOINT
+
+logger = logging.getLogger(__name__)
+
+LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+]
+
+# Requests that never affect job listings; skipped by block_heavy_resources
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "segment.io",
+    "hotjar.com",
+)
+
+
+class _BrowserSlot:
+    """A pooled browser plus the bookkeeping needed to recycle it."""
+
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.contexts_served = 0
+        self.active_contexts = 0
+
+    def release(self, _context=None):
+        """Mark one context handed out by this slot as closed."""
+        self.active_contexts -= 1
+
+
+class BrowserPool:
+    """Hands out BrowserContexts backed by a small set of shared browsers."""
+
+    def __init__(
+        self,
+        size: int = BROWSER_POOL_SIZE,
+        recycle_after: int = BROWSER_POOL_RECYCLE_AFTER,
+    ):
+        """
+        Initialize the pool. Browsers are launched lazily on first use.
+
+        Args:
+            size: Number of browsers to keep running.
+            recycle_after: Relaunch a browser after it served this many contexts.
+        """
+        self.size = max(1, size)
+        self.recycle_after = recycle_after
+        self._playwright: Optional[Playwright] = None
+        self._slots: Optional[asyncio.Queue] = None
+        self._start_lock = asyncio.Lock()
+
+    async def start(self):
+        """Start Playwright and launch the pooled browsers (idempotent)."""
+        async with self._start_lock:
+            if self._slots is not None:
+                return
+
+            self._playwright = await async_playwright().start()
+            slots: asyncio.Queue = asyncio.Queue()
+            for _ in range(self.size):
+                slots.put_nowait(_BrowserSlot(await self._launch()))
+            self._slots = slots
+            logger.debug("Browser pool started with %s browsers", self.size)
+
+    async def _launch(self) -> Browser:
+        """Connect to the shared CDP browser if configured, else launch Chromium."""
+        if CDP_ENDPOINT:
+            try:
+                return await self._playwright.chromium.connect_over_cdp(CDP_ENDPOINT)
+            except Exception as e:
+                logger.warning("Could not connect to CDP endpoint %s, launching Chromium: %s", CDP_ENDPOINT, e)
+
+        return await self._playwright.chromium.launch(
+            headless=True,
+            chromium_sandbox=False,
+            args=LAUNCH_ARGS,
+        )
+
+    async def acquire_context(self, **context_options) -> BrowserContext:
+        """
+        Get a fresh BrowserContext from the next browser in the pool.
+
+        The caller owns the context and must close it when done.
+
+        Args:
+            **context_options: Passed to Browser.new_context (viewport, user_agent...).
+
+        Returns:
+            A new, isolated BrowserContext.
+        """
+        await self.start()
+
+        slot: _BrowserSlot = await self._slots.get()
+        try:
+            # Recycle browsers that served many contexts once they are idle
+            if slot.contexts_served >= self.recycle_after and slot.active_contexts == 0:
+                logger.debug("Recycling pooled browser after %s contexts", slot.contexts_served)
+                await slot.browser.close()
+                slot.browser = await self._launch()
+                slot.contexts_served = 0
+
+            context = await slot.browser.new_context(**context_options)
+            slot.contexts_served += 1
+            slot.active_contexts += 1
+        finally:
+            # Hand the slot straight back so other scrapers can share the browser
+            self._slots.put_nowait(slot)
+
+        context.once("close", slot.release)
+        return context
+
+    async def close(self):
+        """Close every pooled browser and stop Playwright."""
+        async with self._start_lock:
+            if self._slots is None:
+                return
+
+            while not self._slots.empty():
+                slot = self._slots.get_nowait()
+                try:
+                    await slot.browser.close()
+                except Exception as e:
+                    logger.debug("Error closing pooled browser: %s", e)
+
+            await self._playwright.stop()
+            self._playwright = None
+            self._slots = None
+
+
+async def _route_request(route: Route):
+    """Abort images, fonts, media and analytics beacons; let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+
+    host = urlparse(request.url).hostname or ""
+    if host.endswith(BLOCKED_HOSTS):
+        await route.abort()
+        return
+
+    await route.continue_()
+
+
+async def block_heavy_resources(page: Page):
+    """
+    Skip downloads that don't affect the rendered job listings.
+
+    Stylesheets are kept since they decide which elements are visible.
+
+    Args:
+        page: The page to install the request filter on.
+    """
+    await page.route("**/*", _route_request)
+
+
+# Shared pool used by all scrapers in this process
+browser_pool = BrowserPool()
@@ -2,9 +2,12 @@
 Dispatcher that routes URLs to the appropriate scraper based on platform detection.
 Supports 8+ major ATS platforms with fallback to generic scraper.
 """
+import logging
 from typing import Optional
 from urllib.parse import urlparse
 
+from playwright.async_api import BrowserContext
+
 from config import (
     WORKDAY_PATTERNS,
     EIGHTFOLD_PATTERNS,
@@ -26,6 +29,8 @@ from scraper.taleo_scraper import TaleoScraper
 from scraper.smartrecruiters_scraper import SmartRecruitersScraper
 from scraper.plaid_scraper import PlaidScraper
 
+logger = logging.getLogger(__name__)
+
 
 class ScraperDispatcher:
     """Routes career URLs to the appropriate platform-specific scraper."""
@@ -66,6 +71,7 @@ class ScraperDispatcher:
         company_name: str,
         career_url: str,
         platform_hint: Optional[str] = None,
+        context: Optional[BrowserContext] = None,
     ) -> BaseScraper:
         """
         Get the appropriate scraper for a given career URL.
@@ -74,6 +80,8 @@ class ScraperDispatcher:
             company_name: Company name for context.
             career_url: The career page URL to scrape.
             platform_hint: Optional hint about the platform type (from sheet).
+            context: Optional shared BrowserContext for browser-based scraping;
+                by default each scraper gets its own context from the browser pool.
 
         Returns:
             Appropriate scraper instance.
@@ -84,15 +92,15 @@ class ScraperDispatcher:
         if not platform:
             platform = ScraperDispatcher.detect_platform(career_url)
 
-        print(f"Using {platform} scraper for {company_name}")
+        logger.info("Using %s scraper for %s", platform, company_name)
 
         # Find matching scraper class
         for platform_name, _, scraper_class in ScraperDispatcher.PLATFORM_MATCHERS:
             if platform == platform_name:
-                return scraper_class(company_name, career_url)
+                return scraper_class(company_name, career_url, context)
 
         # Default to generic scraper
-        return GenericScraper(company_name, career_url)
+        return GenericScraper(company_name, career_url, context)
 
     @staticmethod
     def get_supported_platforms() -> list:
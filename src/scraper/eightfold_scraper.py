@@ -9,11 +9,12 @@ Based on DOM inspection (AmEx):
 - Location is in class="position-location"
 """
 import asyncio
+import logging
 import re
 from typing import List, Optional
 from urllib.parse import urljoin, urlparse
 
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import BrowserContext, Page
 
 from config import (
     SCRAPE_DELAY_SECONDS,
@@ -21,6 +22,52 @@ from config import (
     MAX_PAGES_PER_COMPANY,
 )
 from scraper.base_scraper import BaseScraper, Job
+from scraper.browser_pool import block_heavy_resources
+from utils.host_limiter import host_semaphore
+
+logger = logging.getLogger(__name__)
+
+# Reads everything _parse_position_card needs from one card element. The card
+# text is only sent back when there is no title element to fall back on.
+_READ_CARD_JS = '''card => {
+    const text = sel => { const el = card.querySelector(sel); return el ? el.textContent : null; };
+    const title = text('.position-title, [class*="position-title"], h2, h3');
+    const link = card.querySelector('a[href]');
+    return {
+        title: title,
+        text: title && title.trim() ? null : card.textContent,
+        location: text('.position-location, [class*="position-location"], [class*="location"]'),
+        href: card.getAttribute('href') || (link ? link.getAttribute('href') : null),
+    };
+}'''
+
+# position-card-0, position-card-1, ... in index order, stopping at the first gap
+_NUMBERED_CARDS_JS = '''cards => {
+    const readCard = %s;
+    const byId = new Map();
+    for (const card of cards) {
+        const id = card.getAttribute('data-test-id');
+        if (!byId.has(id)) byId.set(id, card);
+    }
+    const out = [];
+    for (let i = 0; i < 500 && byId.has('position-card-' + i); i++) {
+        out.push(readCard(byId.get('position-card-' + i)));
+    }
+    return out;
+}''' % _READ_CARD_JS
+
+# Runs each fallback selector in one round-trip, returning the read cards per
+# selector in priority order
+_CARDS_BY_SELECTOR_JS = 'selectors => selectors.map(sel => Array.from(document.querySelectorAll(sel), %s))' % _READ_CARD_JS
+
+# Class-based selectors for sites without numbered position cards, best first
+FALLBACK_CARD_SELECTORS = [
+    '.position-card',
+    '[class*="position-card"]',
+    'div[role="link"][class*="position"]',
+    '[class*="job-card"]',
+    'a[href*="/position/"]',
+]
 
 
 class EightfoldScraper(BaseScraper):
@@ -29,9 +76,8 @@ class EightfoldScraper(BaseScraper):
     Uses data-test-id and class selectors from actual DOM structure.
     """
 
-    def __init__(self, company_name: str, career_url: str):
-        super().__init__(company_name, career_url)
-        self.browser: Optional[Browser] = None
+    def __init__(self, company_name: str, career_url: str, context: Optional[BrowserContext] = None):
+        super().__init__(company_name, career_url, context)
         self.page: Optional[Page] = None
         self.seen_ids: set = set()
 
@@ -39,34 +85,25 @@ class EightfoldScraper(BaseScraper):
         """Scrape all job listings from Eightfold career page."""
         all_jobs: List[Job] = []
 
-        async with async_playwright() as p:
-            self.browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                ]
-            )
-
-            context = await self.browser.new_context(
+        try:
+            async with self.open_page(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            )
-
-            self.page = await context.new_page()
+            ) as page:
+                self.page = page
+                await block_heavy_resources(self.page)
 
-            try:
-                print(f"  [Eightfold] Navigating to {self.career_url}")
+                logger.info("  [Eightfold] Navigating to %s", self.career_url)
                 
-                await self.page.goto(
-                    self.career_url,
-                    wait_until='networkidle',
-                    timeout=PAGE_LOAD_TIMEOUT_MS * 2,
-                )
+                async with host_semaphore(self.career_url):
+                    await self.page.goto(
+                        self.career_url,
+                        wait_until='networkidle',
+                        timeout=PAGE_LOAD_TIMEOUT_MS * 2,
+                    )
                 
                 # Wait for React to render
-                print(f"  [Eightfold] Waiting 10s for React to render...")
+                logger.info("  [Eightfold] Waiting 10s for React to render...")
                 await asyncio.sleep(10)
                 
                 # Click "Show more" to expand job list if available
@@ -76,24 +113,19 @@ class EightfoldScraper(BaseScraper):
                 await self._scroll_job_list()
 
                 # Extract jobs using the correct selectors
-                print(f"  [Eightfold] Extracting jobs...")
+                logger.info("  [Eightfold] Extracting jobs...")
                 all_jobs = await self._extract_position_cards()
                 
-                print(f"  [Eightfold] Total jobs extracted: {len(all_jobs)}")
+                logger.info("  [Eightfold] Total jobs extracted: %s", len(all_jobs))
 
-            except Exception as e:
-                print(f"  [Eightfold] Error: {e}")
-                import traceback
-                traceback.print_exc()
-
-            finally:
-                await self.browser.close()
+        except Exception as e:
+            logger.warning("  [Eightfold] Error: %s", e, exc_info=True)
 
         # Debug: Print extracted titles
-        if all_jobs:
-            print(f"  [Eightfold] First 5 extracted titles:")
+        if all_jobs and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  [Eightfold] First 5 extracted titles:")
             for job in all_jobs[:5]:
-                print(f"    - '{job.job_title}'")
+                logger.debug("    - '%s'", job.job_title)
         
         # Filter by keywords
         filtered_jobs = []
@@ -103,7 +135,7 @@ class EightfoldScraper(BaseScraper):
                 job.keywords_matched = matched_keywords
                 filtered_jobs.append(job)
 
-        print(f"  [Eightfold] Found {len(filtered_jobs)} matching jobs (out of {len(all_jobs)} total)")
+        logger.info("  [Eightfold] Found %s matching jobs (out of %s total)", len(filtered_jobs), len(all_jobs))
         return filtered_jobs
 
     async def _click_show_more(self):
@@ -121,7 +153,7 @@ class EightfoldScraper(BaseScraper):
                 try:
                     btn = await self.page.query_selector(selector)
                     if btn and await btn.is_visible():
-                        print(f"  [Eightfold] Clicking show more button...")
+                        logger.debug("  [Eightfold] Clicking show more button...")
                         await btn.click()
                         await asyncio.sleep(3)
                 except Exception:
@@ -132,7 +164,7 @@ class EightfoldScraper(BaseScraper):
     async def _scroll_job_list(self):
         """Scroll within the job list container to load all jobs."""
         try:
-            print(f"  [Eightfold] Scrolling job list...")
+            logger.debug("  [Eightfold] Scrolling job list...")
             
             # Find the job list container
             container_selectors = [
@@ -162,7 +194,7 @@ class EightfoldScraper(BaseScraper):
             await asyncio.sleep(2)
             
         except Exception as e:
-            print(f"  [Eightfold] Scroll error: {e}")
+            logger.warning("  [Eightfold] Scroll error: %s", e)
 
     async def _extract_position_cards(self) -> List[Job]:
         """Extract jobs from position cards using data-test-id."""
@@ -170,40 +202,33 @@ class EightfoldScraper(BaseScraper):
         
         # Primary approach: Find cards by data-test-id pattern
         # Cards are numbered: position-card-0, position-card-1, etc.
-        card_index = 0
-        while card_index < 500:  # Max 500 to prevent infinite loop
-            selector = f'[data-test-id="position-card-{card_index}"]'
-            card = await self.page.query_selector(selector)
-            
-            if not card:
-                if card_index == 0:
-                    # No cards found with data-test-id, try fallback
-                    print(f"    No data-test-id cards found, trying fallback selectors...")
-                    return await self._extract_fallback()
-                break
-            
-            job = await self._parse_position_card(card, card_index)
+        # All cards are read in one evaluate instead of several RPCs per card
+        cards = await self.page.eval_on_selector_all(
+            '[data-test-id^="position-card-"]', _NUMBERED_CARDS_JS
+        )
+        
+        if not cards:
+            # No cards found with data-test-id, try fallback
+            logger.info("    No data-test-id cards found, trying fallback selectors...")
+            return await self._extract_fallback()
+        
+        for index, card in enumerate(cards):
+            job = self._parse_position_card(card, index)
             if job:
                 jobs.append(job)
-            
-            card_index += 1
         
-        print(f"    Found {len(jobs)} position cards using data-test-id")
+        logger.info("    Found %s position cards using data-test-id", len(jobs))
         return jobs
 
-    async def _parse_position_card(self, card, index: int) -> Optional[Job]:
-        """Parse a single position card."""
+    def _parse_position_card(self, card: dict, index: int) -> Optional[Job]:
+        """Parse a single position card record read by _READ_CARD_JS."""
         try:
             # Get title from position-title class
-            title_el = await card.query_selector('.position-title, [class*="position-title"], h2, h3')
-            title = ""
-            if title_el:
-                title = await title_el.text_content()
-                title = self.clean_text(title) if title else ""
+            title = self.clean_text(card["title"]) if card["title"] else ""
             
             if not title:
                 # Try getting text from card itself
-                card_text = await card.text_content()
+                card_text = card["text"]
                 if card_text:
                     # Get first line as title
                     lines = [l.strip() for l in card_text.split('\n') if l.strip()]
@@ -213,21 +238,12 @@ class EightfoldScraper(BaseScraper):
                 return None
             
             # Get location
-            location_el = await card.query_selector('.position-location, [class*="position-location"], [class*="location"]')
-            location = ""
-            if location_el:
-                location = await location_el.text_content()
-                location = self.clean_text(location) if location else ""
+            location = self.clean_text(card["location"]) if card["location"] else ""
             
             # Get the link/URL - card itself might be clickable
             # On Eightfold, clicking the card navigates to job detail
             # The URL format is usually based on position ID
-            href = await card.get_attribute('href')
-            if not href:
-                # Try finding a link inside
-                link = await card.query_selector('a[href]')
-                if link:
-                    href = await link.get_attribute('href')
+            href = card["href"]
             
             if href:
                 job_url = self.normalize_url(href)
@@ -259,32 +275,24 @@ class EightfoldScraper(BaseScraper):
         """Fallback extraction using class-based selectors."""
         jobs: List[Job] = []
         
-        fallback_selectors = [
-            '.position-card',
-            '[class*="position-card"]',
-            'div[role="link"][class*="position"]',
-            '[class*="job-card"]',
-            'a[href*="/position/"]',
-        ]
+        try:
+            results = await self.page.evaluate(_CARDS_BY_SELECTOR_JS, FALLBACK_CARD_SELECTORS)
+        except Exception:
+            return jobs
         
-        for selector in fallback_selectors:
-            try:
-                cards = await self.page.query_selector_all(selector)
-                if not cards:
-                    continue
-                
-                print(f"    Fallback selector '{selector}' found {len(cards)} elements")
-                
-                for i, card in enumerate(cards):
-                    job = await self._parse_position_card(card, i)
-                    if job:
-                        jobs.append(job)
-                
-                if jobs:
-                    break
-                    
-            except Exception:
+        for selector, cards in zip(FALLBACK_CARD_SELECTORS, results):
+            if not cards:
                 continue
+            
+            logger.debug("    Fallback selector '%s' found %s elements", selector, len(cards))
+            
+            for i, card in enumerate(cards):
+                job = self._parse_position_card(card, i)
+                if job:
+                    jobs.append(job)
+            
+            if jobs:
+                break
         
         return jobs
 
@@ -3,11 +3,12 @@ Generic Playwright-based scraper that works with most career pages.
 Uses heuristics to find job listings and handles JavaScript-rendered content.
 """
 import asyncio
+import logging
 import re
 from typing import List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode
 
-from playwright.async_api import async_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
+from playwright.async_api import BrowserContext, Page, TimeoutError as PlaywrightTimeout
 
 from config import (
     SCRAPE_DELAY_SECONDS,
@@ -16,6 +17,10 @@ from config import (
     MAX_RETRIES,
 )
 from scraper.base_scraper import BaseScraper, Job
+from scraper.browser_pool import block_heavy_resources
+from utils.host_limiter import host_semaphore
+
+logger = logging.getLogger(__name__)
 
 
 class GenericScraper(BaseScraper):
@@ -154,9 +159,40 @@ class GenericScraper(BaseScraper):
         r'mailto:',
     ]
 
-    def __init__(self, company_name: str, career_url: str):
-        super().__init__(company_name, career_url)
-        self.browser: Optional[Browser] = None
+    # URL patterns that indicate a job posting link
+    JOB_URL_PATTERNS = [
+        r'/job[s]?/',
+        r'/job[s]?$',
+        r'/position[s]?/',
+        r'/career[s]?/',
+        r'/opening[s]?/',
+        r'/requisition/',
+        r'/vacancy/',
+        r'/posting/',
+        r'/opportunity/',
+        r'/role[s]?/',
+        r'job[-_]?id=',
+        r'requisition[-_]?id=',
+        r'position[-_]?id=',
+        r'/apply/',
+        r'#job',  # Hash-based URLs like Plaid
+        r'#role',
+        r'#opening',
+        r'/details/',
+        r'/view/',
+    ]
+
+    # Each pattern list compiled into a single alternation so every href is
+    # scanned once instead of once per pattern
+    _EXCLUDE_RE = re.compile('|'.join(EXCLUDE_PATTERNS), re.IGNORECASE)
+    _JOB_URL_RE = re.compile('|'.join(JOB_URL_PATTERNS), re.IGNORECASE)
+
+    # Query parameters commonly used for page numbers / offsets
+    PAGE_PARAMS = ('page', 'p', 'pg', 'pageNumber', 'start', 'offset')
+    _PAGE_PARAM_SET = frozenset(PAGE_PARAMS)
+
+    def __init__(self, company_name: str, career_url: str, context: Optional[BrowserContext] = None):
+        super().__init__(company_name, career_url, context)
         self.page: Optional[Page] = None
         self.seen_urls: set = set()
 
@@ -169,25 +205,14 @@ class GenericScraper(BaseScraper):
         """
         all_jobs: List[Job] = []
 
-        async with async_playwright() as p:
-            # Launch browser with realistic settings
-            self.browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                ]
-            )
-
-            context = await self.browser.new_context(
+        try:
+            async with self.open_page(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            )
-
-            self.page = await context.new_page()
+            ) as page:
+                self.page = page
+                await block_heavy_resources(self.page)
 
-            try:
                 # Navigate to career page
                 await self._navigate_with_retry(self.career_url)
                 
@@ -201,7 +226,7 @@ class GenericScraper(BaseScraper):
                 page_count = 0
                 while page_count < MAX_PAGES_PER_COMPANY:
                     page_count += 1
-                    print(f"  Scraping page {page_count} for {self.company_name}...")
+                    logger.info("  Scraping page %s for %s...", page_count, self.company_name)
 
                     # Extract jobs from current page
                     page_jobs = await self._extract_jobs_from_page()
@@ -210,18 +235,14 @@ class GenericScraper(BaseScraper):
                     # Try to go to next page
                     has_more = await self._handle_pagination()
                     if not has_more:
-                        print(f"  No more pages found for {self.company_name}")
+                        logger.info("  No more pages found for %s", self.company_name)
                         break
 
                     # Delay between pages
                     await asyncio.sleep(SCRAPE_DELAY_SECONDS)
 
-            except Exception as e:
-                print(f"  Error scraping {self.company_name}: {e}")
-
-            finally:
-                await self.browser.close()
-
+        except Exception as e:
+            logger.warning("  Error scraping %s: %s", self.company_name, e)
 
         # Filter jobs by keywords
         filtered_jobs = []
@@ -231,27 +252,28 @@ class GenericScraper(BaseScraper):
                 job.keywords_matched = matched_keywords
                 filtered_jobs.append(job)
 
-        print(f"  Found {len(filtered_jobs)} matching jobs for {self.company_name} (out of {len(all_jobs)} total)")
+        logger.info("  Found %s matching jobs for %s (out of %s total)", len(filtered_jobs), self.company_name, len(all_jobs))
         return filtered_jobs
 
     async def _navigate_with_retry(self, url: str) -> bool:
         """Navigate to URL with retry logic."""
         for attempt in range(MAX_RETRIES):
             try:
-                await self.page.goto(
-                    url,
-                    wait_until='networkidle',
-                    timeout=PAGE_LOAD_TIMEOUT_MS,
-                )
+                async with host_semaphore(url):
+                    await self.page.goto(
+                        url,
+                        wait_until='networkidle',
+                        timeout=PAGE_LOAD_TIMEOUT_MS,
+                    )
                 # Wait a bit for any dynamic content
                 await asyncio.sleep(1)
                 return True
             except PlaywrightTimeout:
                 if attempt < MAX_RETRIES - 1:
-                    print(f"  Timeout on attempt {attempt + 1}, retrying...")
+                    logger.warning("  Timeout on attempt %s, retrying...", attempt + 1)
                     await asyncio.sleep(2)
                 else:
-                    print(f"  Failed to load {url} after {MAX_RETRIES} attempts")
+                    logger.warning("  Failed to load %s after %s attempts", url, MAX_RETRIES)
                     raise
         return False
 
@@ -276,7 +298,7 @@ class GenericScraper(BaseScraper):
             # Check if new content loaded
             final_height = await self.page.evaluate('document.body.scrollHeight')
             if final_height > initial_height:
-                print(f"    Triggered lazy loading: {final_height - initial_height}px new content")
+                logger.debug("    Triggered lazy loading: %spx new content", final_height - initial_height)
         except Exception as e:
             # Not critical, continue anyway
             pass
@@ -426,43 +448,17 @@ class GenericScraper(BaseScraper):
                 ))
 
         except Exception as e:
-            print(f"    Generic extraction error: {e}")
+            logger.warning("    Generic extraction error: %s", e)
 
         return jobs
 
     def _should_exclude_url(self, url: str) -> bool:
         """Check if URL should be excluded based on patterns."""
-        url_lower = url.lower()
-        for pattern in self.EXCLUDE_PATTERNS:
-            if re.search(pattern, url_lower):
-                return True
-        return False
+        return self._EXCLUDE_RE.search(url) is not None
 
     def _looks_like_job_url(self, url: str) -> bool:
         """Check if URL looks like a job posting URL."""
-        url_lower = url.lower()
-        job_patterns = [
-            r'/job[s]?/',
-            r'/job[s]?$',
-            r'/position[s]?/',
-            r'/career[s]?/',
-            r'/opening[s]?/',
-            r'/requisition/',
-            r'/vacancy/',
-            r'/posting/',
-            r'/opportunity/',
-            r'/role[s]?/',
-            r'job[-_]?id=',
-            r'requisition[-_]?id=',
-            r'position[-_]?id=',
-            r'/apply/',
-            r'#job',  # Hash-based URLs like Plaid
-            r'#role',
-            r'#opening',
-            r'/details/',
-            r'/view/',
-        ]
-        return any(re.search(p, url_lower) for p in job_patterns)
+        return self._JOB_URL_RE.search(url) is not None
 
 
     async def _handle_pagination(self) -> bool:
@@ -510,12 +506,16 @@ class GenericScraper(BaseScraper):
         """Try to paginate by modifying the URL."""
         current_url = self.page.url
         parsed = urlparse(current_url)
+        if not parsed.query:
+            return False
+
         query_params = parse_qs(parsed.query)
 
-        # Common pagination parameter names
-        page_params = ['page', 'p', 'pg', 'pageNumber', 'start', 'offset']
+        # Bail out early when none of the known pagination params are present
+        if not self._PAGE_PARAM_SET & query_params.keys():
+            return False
 
-        for param in page_params:
+        for param in self.PAGE_PARAMS:
             if param in query_params:
                 try:
                     current_page = int(query_params[param][0])
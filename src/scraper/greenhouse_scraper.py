@@ -8,15 +8,20 @@ Greenhouse URL patterns:
 - API: boards-api.greenhouse.io/v1/boards/{company}/jobs
 """
 import asyncio
+import logging
 import re
 from typing import List, Optional
 from urllib.parse import urlparse, urljoin
 
-import requests
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import BrowserContext
 
 from config import PAGE_LOAD_TIMEOUT_MS, MAX_PAGES_PER_COMPANY
-from scraper.base_scraper import BaseScraper, Job
+from scraper.base_scraper import BaseScraper, HREF_AND_TEXT_BY_SELECTOR_JS, Job
+from scraper.browser_pool import block_heavy_resources
+from utils.host_limiter import host_semaphore
+from utils.http_session import get_session, parse_json
+
+logger = logging.getLogger(__name__)
 
 
 class GreenhouseScraper(BaseScraper):
@@ -38,9 +43,10 @@ class GreenhouseScraper(BaseScraper):
         'tr.job-post a',
     ]
 
-    def __init__(self, company_name: str, career_url: str):
-        super().__init__(company_name, career_url)
+    def __init__(self, company_name: str, career_url: str, context: Optional[BrowserContext] = None):
+        super().__init__(company_name, career_url, context)
         self.board_token = self._extract_board_token(career_url)
+        self._session = get_session()
 
     def _extract_board_token(self, url: str) -> Optional[str]:
         """Extract the Greenhouse board token from URL."""
@@ -62,7 +68,7 @@ class GreenhouseScraper(BaseScraper):
             jobs = await self._scrape_via_api()
             if jobs:
                 return jobs
-            print(f"  [Greenhouse] API failed, falling back to browser for {self.company_name}")
+            logger.warning("  [Greenhouse] API failed, falling back to browser for %s", self.company_name)
 
         # Fallback to browser scraping
         return await self._scrape_via_browser()
@@ -73,17 +79,20 @@ class GreenhouseScraper(BaseScraper):
         
         try:
             url = f"{self.API_BASE}/{self.board_token}/jobs"
-            print(f"  [Greenhouse] Fetching from API: {url}")
+            logger.info("  [Greenhouse] Fetching from API: %s", url)
             
-            response = requests.get(url, timeout=30)
+            # Run the blocking request in a worker thread so other scrapers
+            # keep making progress on the event loop
+            async with host_semaphore(url):
+                response = await asyncio.to_thread(self._session.get, url, timeout=30)
             if response.status_code != 200:
-                print(f"  [Greenhouse] API returned {response.status_code}")
+                logger.warning("  [Greenhouse] API returned %s", response.status_code)
                 return []
             
-            data = response.json()
+            data = await asyncio.to_thread(parse_json, response.content)
             jobs_data = data.get("jobs", [])
             
-            print(f"  [Greenhouse] API returned {len(jobs_data)} jobs")
+            logger.info("  [Greenhouse] API returned %s jobs", len(jobs_data))
             
             for job_data in jobs_data:
                 title = job_data.get("title", "")
@@ -121,11 +130,11 @@ class GreenhouseScraper(BaseScraper):
                     keywords_matched=matched_keywords,
                 ))
             
-            print(f"  [Greenhouse] Found {len(all_jobs)} matching jobs via API")
+            logger.info("  [Greenhouse] Found %s matching jobs via API", len(all_jobs))
             return all_jobs
             
         except Exception as e:
-            print(f"  [Greenhouse] API error: {e}")
+            logger.warning("  [Greenhouse] API error: %s", e)
             return []
 
     async def _scrape_via_browser(self) -> List[Job]:
@@ -133,31 +142,23 @@ class GreenhouseScraper(BaseScraper):
         all_jobs: List[Job] = []
         seen_urls: set = set()
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--disable-blink-features=AutomationControlled']
-            )
-            
-            context = await browser.new_context(
+        try:
+            async with self.open_page(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            
-            page = await context.new_page()
+            ) as page:
+                await block_heavy_resources(page)
 
-            try:
-                await page.goto(self.career_url, wait_until='networkidle', timeout=PAGE_LOAD_TIMEOUT_MS)
+                async with host_semaphore(self.career_url):
+                    await page.goto(self.career_url, wait_until='networkidle', timeout=PAGE_LOAD_TIMEOUT_MS)
                 await asyncio.sleep(3)
 
-                # Try each selector
-                for selector in self.JOB_SELECTORS:
-                    elements = await page.query_selector_all(selector)
-                    if not elements:
-                        continue
-                    
-                    for element in elements:
-                        href = await element.get_attribute('href')
+                # Run every selector in one round-trip, each returning
+                # [href, text] rows; results keep selector priority
+                results = await page.evaluate(HREF_AND_TEXT_BY_SELECTOR_JS, self.JOB_SELECTORS)
+
+                for rows in results:
+                    for href, title in rows:
                         if not href or href in seen_urls:
                             continue
                         
@@ -167,7 +168,6 @@ class GreenhouseScraper(BaseScraper):
                         
                         seen_urls.add(job_url)
                         
-                        title = await element.text_content()
                         title = self.clean_text(title) if title else ""
                         
                         if not title or len(title) < 3:
@@ -188,12 +188,10 @@ class GreenhouseScraper(BaseScraper):
                     if all_jobs:
                         break
 
-            except Exception as e:
-                print(f"  [Greenhouse] Browser error: {e}")
-            finally:
-                await browser.close()
+        except Exception as e:
+            logger.warning("  [Greenhouse] Browser error: %s", e)
 
-        print(f"  [Greenhouse] Found {len(all_jobs)} matching jobs via browser")
+        logger.info("  [Greenhouse] Found %s matching jobs via browser", len(all_jobs))
         return all_jobs
 
     def _extract_job_id(self, url: str) -> str:
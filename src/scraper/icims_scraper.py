@@ -7,14 +7,19 @@ iCIMS URL patterns:
 - careers-{company}.icims.com/jobs/search
 """
 import asyncio
+import logging
 import re
-from typing import List
+from typing import List, Optional
 from urllib.parse import urljoin
 
-from playwright.async_api import async_playwright
+from playwright.async_api import BrowserContext
 
 from config import PAGE_LOAD_TIMEOUT_MS, MAX_PAGES_PER_COMPANY, SCRAPE_DELAY_SECONDS
 from scraper.base_scraper import BaseScraper, Job
+from scraper.browser_pool import block_heavy_resources
+from utils.host_limiter import host_semaphore
+
+logger = logging.getLogger(__name__)
 
 
 class ICIMSScraper(BaseScraper):
@@ -44,36 +49,30 @@ class ICIMSScraper(BaseScraper):
         '.iCIMS_Paging a.iCIMS_Next',
     ]
 
-    def __init__(self, company_name: str, career_url: str):
-        super().__init__(company_name, career_url)
+    def __init__(self, company_name: str, career_url: str, context: Optional[BrowserContext] = None):
+        super().__init__(company_name, career_url, context)
         self.seen_urls: set = set()
 
     async def scrape(self) -> List[Job]:
         """Scrape jobs from iCIMS career site."""
         all_jobs: List[Job] = []
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--disable-blink-features=AutomationControlled', '--no-sandbox']
-            )
-
-            context = await browser.new_context(
+        try:
+            async with self.open_page(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
+            ) as page:
+                await block_heavy_resources(page)
 
-            page = await context.new_page()
-
-            try:
-                print(f"  [iCIMS] Navigating to {self.career_url}")
-                await page.goto(self.career_url, wait_until='networkidle', timeout=PAGE_LOAD_TIMEOUT_MS)
+                logger.info("  [iCIMS] Navigating to %s", self.career_url)
+                async with host_semaphore(self.career_url):
+                    await page.goto(self.career_url, wait_until='networkidle', timeout=PAGE_LOAD_TIMEOUT_MS)
                 await asyncio.sleep(3)
 
                 page_count = 0
                 while page_count < MAX_PAGES_PER_COMPANY:
                     page_count += 1
-                    print(f"  [iCIMS] Scraping page {page_count}...")
+                    logger.info("  [iCIMS] Scraping page %s...", page_count)
 
                     # Extract jobs from current page
                     page_jobs = await self._extract_jobs(page)
@@ -95,10 +94,8 @@ class ICIMSScraper(BaseScraper):
 
                     await asyncio.sleep(SCRAPE_DELAY_SECONDS)
 
-            except Exception as e:
-                print(f"  [iCIMS] Error: {e}")
-            finally:
-                await browser.close()
+        except Exception as e:
+            logger.warning("  [iCIMS] Error: %s", e)
 
         # Filter by keywords
         filtered_jobs = []
@@ -108,7 +105,7 @@ class ICIMSScraper(BaseScraper):
                 job.keywords_matched = matched_keywords
                 filtered_jobs.append(job)
 
-        print(f"  [iCIMS] Found {len(filtered_jobs)} matching jobs (out of {len(all_jobs)} total)")
+        logger.info("  [iCIMS] Found %s matching jobs (out of %s total)", len(filtered_jobs), len(all_jobs))
         return filtered_jobs
 
     async def _extract_jobs(self, page) -> List[Job]:
@@ -8,15 +8,37 @@ Lever URL patterns:
 - API: api.lever.co/v0/postings/{company}
 """
 import asyncio
+import logging
 import re
 from typing import List, Optional
 from urllib.parse import urlparse
 
-import requests
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import BrowserContext
 
 from config import PAGE_LOAD_TIMEOUT_MS
 from scraper.base_scraper import BaseScraper, Job
+from scraper.browser_pool import block_heavy_resources
+from utils import http_cache
+from utils.host_limiter import host_semaphore
+from utils.http_session import get_session, parse_json
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for the wait on the first rendered posting
+RENDER_WAIT_TIMEOUT_MS = 15000
+
+# Reads [title, href, location] for every .posting in one round-trip; each
+# field comes from a grouped selector, so the first match in DOM order wins
+_READ_POSTINGS_JS = '''postings => postings.map(posting => {
+    const title = posting.querySelector('h5, .posting-name, [data-qa="posting-name"]');
+    const link = posting.querySelector('a.posting-btn-submit, a');
+    const location = posting.querySelector('.location, .posting-categories');
+    return [
+        title ? title.textContent : null,
+        link ? link.getAttribute('href') : null,
+        location ? location.textContent : null,
+    ];
+})'''
 
 
 class LeverScraper(BaseScraper):
@@ -26,6 +48,14 @@ class LeverScraper(BaseScraper):
     """
 
     API_BASE = "https://api.lever.co/v0/postings"
+
+    # Precompiled URL patterns
+    _SLUG_PATTERNS = [
+        re.compile(r'jobs\.lever\.co/([^/\?]+)'),
+        re.compile(r'lever\.co/([^/\?]+)'),
+    ]
+    _JOB_ID_UUID = re.compile(r'/([a-f0-9-]{36})')
+    _JOB_ID_SLUG = re.compile(r'lever\.co/[^/]+/([^/\?]+)')
     
     # Lever-specific selectors for fallback
     JOB_SELECTORS = [
@@ -37,18 +67,15 @@ class LeverScraper(BaseScraper):
         'div[data-qa="posting-name"]',
     ]
 
-    def __init__(self, company_name: str, career_url: str):
-        super().__init__(company_name, career_url)
+    def __init__(self, company_name: str, career_url: str, context: Optional[BrowserContext] = None):
+        super().__init__(company_name, career_url, context)
         self.company_slug = self._extract_company_slug(career_url)
+        self._session = get_session()
 
     def _extract_company_slug(self, url: str) -> Optional[str]:
         """Extract the Lever company slug from URL."""
-        patterns = [
-            r'jobs\.lever\.co/([^/\?]+)',
-            r'lever\.co/([^/\?]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in self._SLUG_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         return None
@@ -60,7 +87,7 @@ class LeverScraper(BaseScraper):
             jobs = await self._scrape_via_api()
             if jobs:
                 return jobs
-            print(f"  [Lever] API failed, falling back to browser for {self.company_name}")
+            logger.warning("  [Lever] API failed, falling back to browser for %s", self.company_name)
 
         # Fallback to browser scraping
         return await self._scrape_via_browser()
@@ -71,20 +98,43 @@ class LeverScraper(BaseScraper):
         
         try:
             url = f"{self.API_BASE}/{self.company_slug}"
-            print(f"  [Lever] Fetching from API: {url}")
+            logger.info("  [Lever] Fetching from API: %s", url)
+            
+            # Reuse recent postings outright, otherwise revalidate them
+            cache_key = f"lever_{self.company_slug}"
+            cached = http_cache.load(cache_key)
             
-            response = requests.get(url, timeout=30)
-            if response.status_code != 200:
-                print(f"  [Lever] API returned {response.status_code}")
-                return []
+            if http_cache.is_fresh(cached):
+                logger.info("  [Lever] Using cached postings")
+                content = cached["body"]
+            else:
+                # Run the blocking request in a worker thread so other scrapers
+                # keep making progress on the event loop
+                async with host_semaphore(url):
+                    response = await asyncio.to_thread(
+                        self._session.get,
+                        url,
+                        headers=http_cache.conditional_headers(cached),
+                        timeout=30,
+                    )
+                if response.status_code == 304 and cached:
+                    logger.info("  [Lever] Postings unchanged, using cached response")
+                    content = cached["body"]
+                elif response.status_code == 200:
+                    http_cache.save(cache_key, response)
+                    content = response.content
+                else:
+                    logger.warning("  [Lever] API returned %s", response.status_code)
+                    return []
             
-            postings = response.json()
+            # Large tenants return thousands of postings; parse off the event loop
+            postings = await asyncio.to_thread(parse_json, content)
             
             # Lever API returns a direct list
             if not isinstance(postings, list):
                 postings = postings.get("postings", []) if isinstance(postings, dict) else []
             
-            print(f"  [Lever] API returned {len(postings)} postings")
+            logger.info("  [Lever] API returned %s postings", len(postings))
             
             for posting in postings:
                 title = posting.get("text", "")
@@ -124,11 +174,11 @@ class LeverScraper(BaseScraper):
                     keywords_matched=matched_keywords,
                 ))
             
-            print(f"  [Lever] Found {len(all_jobs)} matching jobs via API")
+            logger.info("  [Lever] Found %s matching jobs via API", len(all_jobs))
             return all_jobs
             
         except Exception as e:
-            print(f"  [Lever] API error: {e}")
+            logger.warning("  [Lever] API error: %s", e)
             return []
 
     async def _scrape_via_browser(self) -> List[Job]:
@@ -136,86 +186,80 @@ class LeverScraper(BaseScraper):
         all_jobs: List[Job] = []
         seen_urls: set = set()
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--disable-blink-features=AutomationControlled']
-            )
-            
-            context = await browser.new_context(
+        try:
+            async with self.open_page(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            
-            page = await context.new_page()
+            ) as page:
+                await block_heavy_resources(page)
 
-            try:
-                await page.goto(self.career_url, wait_until='networkidle', timeout=PAGE_LOAD_TIMEOUT_MS)
-                await asyncio.sleep(3)
+                async with host_semaphore(self.career_url):
+                    await page.goto(self.career_url, wait_until='domcontentloaded', timeout=PAGE_LOAD_TIMEOUT_MS)
+                try:
+                    await page.wait_for_selector('.posting', timeout=RENDER_WAIT_TIMEOUT_MS)
+                except Exception:
+                    logger.debug("  [Lever] No postings after %sms, continuing", RENDER_WAIT_TIMEOUT_MS)
 
                 # Look for job postings using content wrapper
-                postings = await page.query_selector_all('.posting')
-                
-                for posting in postings:
-                    # Get title
-                    title_el = await posting.query_selector('h5, .posting-name, [data-qa="posting-name"]')
-                    if not title_el:
-                        continue
-                    
-                    title = await title_el.text_content()
-                    title = self.clean_text(title) if title else ""
-                    
-                    if not title:
-                        continue
-                    
-                    # Check keywords
-                    matched_keywords = self.matches_keywords(title)
-                    if not matched_keywords:
-                        continue
-                    
-                    # Get URL
-                    link = await posting.query_selector('a.posting-btn-submit, a')
-                    if link:
-                        href = await link.get_attribute('href')
-                        if href and href not in seen_urls:
-                            job_url = self.normalize_url(href)
-                            seen_urls.add(job_url)
-                            
-                            job_id = self._extract_job_id(job_url)
-                            
-                            # Get location
-                            loc_el = await posting.query_selector('.location, .posting-categories')
-                            location = ""
-                            if loc_el:
-                                location = await loc_el.text_content()
-                                location = self.clean_text(location) if location else ""
-                            
-                            all_jobs.append(Job(
-                                job_id=job_id,
-                                job_title=title,
-                                job_url=job_url,
-                                company_name=self.company_name,
-                                company_career_url=self.career_url,
-                                location=location,
-                                keywords_matched=matched_keywords,
-                            ))
-
-            except Exception as e:
-                print(f"  [Lever] Browser error: {e}")
-            finally:
-                await browser.close()
-
-        print(f"  [Lever] Found {len(all_jobs)} matching jobs via browser")
+                rows = await page.eval_on_selector_all('.posting', _READ_POSTINGS_JS)
+                results = [self._extract_posting(*row) for row in rows]
+            
+                for job in results:
+                    if job and job.job_url not in seen_urls:
+                        seen_urls.add(job.job_url)
+                        all_jobs.append(job)
+
+        except Exception as e:
+            logger.warning("  [Lever] Browser error: %s", e)
+
+        logger.info("  [Lever] Found %s matching jobs via browser", len(all_jobs))
         return all_jobs
 
+    def _extract_posting(
+        self,
+        title: Optional[str],
+        href: Optional[str],
+        location: Optional[str],
+    ) -> Optional[Job]:
+        """Build a Job from one row read by _READ_POSTINGS_JS, or None if it doesn't match."""
+        title = self.clean_text(title) if title else ""
+        
+        if not title:
+            return None
+        
+        # Check keywords
+        matched_keywords = self.matches_keywords(title)
+        if not matched_keywords:
+            return None
+        
+        # Get URL
+        if not href:
+            return None
+        
+        job_url = self.normalize_url(href)
+        job_id = self._extract_job_id(job_url)
+        
+        # Get location
+        location = self.clean_text(location) if location else ""
+        
+        return Job(
+            job_id=job_id,
+            job_title=title,
+            job_url=job_url,
+            company_name=self.company_name,
+            company_career_url=self.career_url,
+            location=location,
+            keywords_matched=matched_keywords,
+        )
+
     def _extract_job_id(self, url: str) -> str:
         """Extract Lever job ID from URL."""
         # Lever uses UUID-style IDs
-        match = re.search(r'/([a-f0-9-]{36})', url)
+        match = self._JOB_ID_UUID.search(url)
         if match:
             return f"LV_{match.group(1)}"
         # Or slug-based
-        match = re.search(r'lever\.co/[^/]+/([^/\?]+)', url)
+        match = self._JOB_ID_SLUG.search(url)
         if match:
             return f"LV_{match.group(1)}"
         return self.generate_job_id(url, "")
@@ -10,15 +10,126 @@ Based on screenshot analysis:
 
 DEBUG VERSION - Enhanced logging to troubleshoot extraction issues.
 """
-import asyncio
+import logging
 import re
+from functools import lru_cache
 from typing import List, Optional
-from urllib.parse import urlparse
 
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import BrowserContext, Page
 
 from config import PAGE_LOAD_TIMEOUT_MS, SCRAPE_DELAY_SECONDS
 from scraper.base_scraper import BaseScraper, Job
+from scraper.browser_pool import block_heavy_resources
+from utils.host_limiter import host_semaphore
+
+logger = logging.getLogger(__name__)
+
+# Precompiled job ID patterns
+_JOB_ID_CAREERS = re.compile(r'/careers/[^/]+/([^/?#]+)')
+_JOB_ID_OPENINGS = re.compile(r'/openings/([^/?#]+)')
+
+# Link filters: a job link contains /careers/ but is not the careers index
+# itself, and is not an anchor, script, apply or share link.
+_CAREERS_SUBPAGE = re.compile(r'^(?!.*/careers/*$).*/careers/', re.IGNORECASE | re.DOTALL)
+_BAD_HREF = re.compile(r'#|javascript:|/apply|/share', re.IGNORECASE)
+
+# Number of links on the page, used to tell when scrolling stops loading more
+_LINK_COUNT_JS = 'document.querySelectorAll("a[href]").length'
+
+# Card lookups: title from an ancestor six levels up, location from the
+# closest container. The browser returns the text of the first match for each
+# selector and the choice is made in Python.
+CARD_TITLE_SELECTORS = ['h2', 'h3', 'h4', 'strong', '[class*="title"]', '[class*="name"]']
+CARD_LOCATION_SELECTORS = ['[class*="location"]', 'span', 'p']
+_LOCATION_INDICATOR = re.compile(r'\b(?:new york|san francisco|remote|us|united states)\b', re.IGNORECASE)
+
+# Reads every link in one evaluate as [href, text, card title texts, card
+# location texts]. With careersOnly, links that can't be job pages (no
+# /careers/ path, the careers index, anchors, javascript:) are dropped in the
+# browser so they are never sent back.
+_LINK_ROWS_JS = r'''(links, [titleSelectors, locationSelectors, careersOnly]) => {
+    const careersSubpage = /^(?!.*\/careers\/*$).*\/careers\//is;
+    const anchorOrScript = /#|javascript:/i;
+    const firstTexts = (root, selectors) => root
+        ? selectors.map(sel => { const n = root.querySelector(sel); return n ? n.textContent : null; })
+        : [];
+    const rows = [];
+    for (const el of links) {
+        const href = el.getAttribute("href");
+        if (careersOnly && (!href || !careersSubpage.test(href) || anchorOrScript.test(href))) {
+            continue;
+        }
+        let p = el.parentElement;
+        for (let i = 0; i < 5 && p; i++) {
+            p = p.parentElement;
+        }
+        rows.push([
+            href,
+            el.textContent,
+            firstTexts(p, titleSelectors),
+            firstTexts(el.closest("div, article, li"), locationSelectors),
+        ]);
+    }
+    return rows;
+}'''
+
+# Cookie consent buttons, restricted to visible ones
+_COOKIE_BUTTON_UNION = ', '.join(f'{sel}:visible' for sel in [
+    'button:has-text("Ok")',
+    'button:has-text("Accept")',
+    'button:has-text("Got it")',
+    '[class*="cookie"] button',
+    '[class*="consent"] button',
+])
+
+# Upper bounds for the event-driven waits (they return as soon as content is there)
+RENDER_WAIT_TIMEOUT_MS = 15000
+SCROLL_SETTLE_TIMEOUT_MS = 2000
+COOKIE_CLICK_TIMEOUT_MS = 1500
+
+# Once this many job links are rendered up front the listing is not being
+# lazy-loaded, so the scroll pass is skipped
+SCROLL_SKIP_JOB_LINKS = 20
+
+
+# The same hrefs show up many times per page (nav, cards, deep search), so the
+# pure URL helpers are cached at module level.
+@lru_cache(maxsize=4096)
+def _title_from_url(url: str) -> str:
+    """Extract a readable title from URL path."""
+    # Slice the path out by hand; urlparse builds a full ParseResult just to
+    # read .path
+    scheme_end = url.find('://')
+    host_start = scheme_end + 3 if scheme_end != -1 else 0
+    end = len(url)
+    for sep in ('?', '#'):
+        pos = url.find(sep, host_start)
+        if pos != -1 and pos < end:
+            end = pos
+    start = url.find('/', host_start, end) if scheme_end != -1 else 0
+    if start == -1:
+        return ""
+
+    # Last path segment that isn't a listing directory
+    for slug in reversed(url[start:end].split('/')):
+        if slug and slug not in ('careers', 'openings'):
+            # Convert slug to title
+            return slug.replace('-', ' ').replace('_', ' ').title()
+    return ""
+
+
+@lru_cache(maxsize=4096)
+def _job_id_from_url(url: str) -> Optional[str]:
+    """Get the Plaid job ID from the URL path, or None if it has none."""
+    match = _JOB_ID_CAREERS.search(url)
+    if match:
+        return f"PL_{match.group(1)[:30]}"
+
+    match = _JOB_ID_OPENINGS.search(url)
+    if match:
+        return f"PL_{match.group(1)[:30]}"
+
+    return None
 
 
 class PlaidScraper(BaseScraper):
@@ -42,118 +153,121 @@ class PlaidScraper(BaseScraper):
         'a[href*="/careers/"][href*="-"]',
     ]
 
-    def __init__(self, company_name: str, career_url: str):
-        super().__init__(company_name, career_url)
-        self.browser: Optional[Browser] = None
+    # Playwright's selector engine accepts :has-text() inside selector lists,
+    # so all link selectors can run as one query
+    _JOB_LINK_UNION = ', '.join(JOB_LINK_SELECTORS)
+
+    def __init__(self, company_name: str, career_url: str, context: Optional[BrowserContext] = None):
+        super().__init__(company_name, career_url, context)
         self.page: Optional[Page] = None
         self.seen_urls: set = set()
-        self.seen_titles: set = set()
 
     async def scrape(self) -> List[Job]:
         """Scrape all job listings from Plaid's careers page."""
         all_jobs: List[Job] = []
 
-        async with async_playwright() as p:
-            self.browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                ]
-            )
-
-            context = await self.browser.new_context(
+        try:
+            async with self.open_page(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            )
+            ) as page:
+                self.page = page
+                await block_heavy_resources(self.page)
 
-            self.page = await context.new_page()
-
-            try:
-                print(f"  [Plaid] Navigating to {self.career_url}")
-                
-                await self.page.goto(
-                    self.career_url,
-                    wait_until='networkidle',
-                    timeout=PAGE_LOAD_TIMEOUT_MS,
-                )
-                
-                # Wait for React to render
-                print(f"  [Plaid] Waiting 8s for React to render...")
-                await asyncio.sleep(8)
-                
+                logger.info("  [Plaid] Navigating to %s", self.career_url)
+            
+                async with host_semaphore(self.career_url):
+                    await self.page.goto(
+                        self.career_url,
+                        wait_until='domcontentloaded',
+                        timeout=PAGE_LOAD_TIMEOUT_MS,
+                    )
+            
+                # Wait for React to render the first job links
+                logger.info("  [Plaid] Waiting for job links to render...")
+                try:
+                    await self.page.wait_for_selector(
+                        self.JOB_LINK_SELECTORS[0],
+                        state='attached',
+                        timeout=RENDER_WAIT_TIMEOUT_MS,
+                    )
+                except Exception:
+                    logger.debug("  [Plaid] No job links after %sms, continuing", RENDER_WAIT_TIMEOUT_MS)
+            
                 # Handle cookie consent if present
                 await self._dismiss_cookie_banner()
-                
-                # Scroll to load all content
-                await self._scroll_to_load_all()
+            
+                # Scroll to load all content, unless the listing is already there
+                rendered = await self.page.locator(self._JOB_LINK_UNION).count()
+                if rendered >= SCROLL_SKIP_JOB_LINKS:
+                    logger.debug("  [Plaid] %s job links rendered, skipping scroll", rendered)
+                else:
+                    await self._scroll_to_load_all()
 
                 # Extract jobs
-                print(f"  [Plaid] Extracting jobs...")
+                logger.info("  [Plaid] Extracting jobs...")
                 jobs = await self._extract_job_links()
-                
+            
                 if not jobs:
-                    print(f"  [Plaid] Primary extraction failed, trying deep search...")
+                    logger.info("  [Plaid] Primary extraction failed, trying deep search...")
                     jobs = await self._deep_search_for_jobs()
-                
+            
                 all_jobs.extend(jobs)
 
-            except Exception as e:
-                print(f"  [Plaid] Error: {e}")
-
-            finally:
-                await self.browser.close()
+        except Exception as e:
+            logger.warning("  [Plaid] Error: %s", e)
 
         # Debug: Print extracted titles
-        if all_jobs:
-            print(f"  [Plaid] First 5 extracted titles:")
+        if all_jobs and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  [Plaid] First 5 extracted titles:")
             for job in all_jobs[:5]:
-                print(f"    - '{job.job_title}'")
+                logger.debug("    - '%s'", job.job_title)
         
-        # Filter by keywords
+        # Filter by keywords, matching every title in one pass with the
+        # bound method hoisted out of the loop
+        matches_keywords = self.matches_keywords
+        keyword_matches = [matches_keywords(job.job_title) for job in all_jobs]
         filtered_jobs = []
-        for job in all_jobs:
-            matched_keywords = self.matches_keywords(job.job_title)
+        for job, matched_keywords in zip(all_jobs, keyword_matches):
             if matched_keywords:
                 job.keywords_matched = matched_keywords
                 filtered_jobs.append(job)
 
-        print(f"  [Plaid] Found {len(filtered_jobs)} matching jobs (out of {len(all_jobs)} total)")
+        logger.info("  [Plaid] Found %s matching jobs (out of %s total)", len(filtered_jobs), len(all_jobs))
         return filtered_jobs
 
     async def _dismiss_cookie_banner(self):
         """Try to dismiss any cookie banners."""
         try:
-            cookie_selectors = [
-                'button:has-text("Ok")',
-                'button:has-text("Accept")',
-                'button:has-text("Got it")',
-                '[class*="cookie"] button',
-                '[class*="consent"] button',
-            ]
-            for sel in cookie_selectors:
-                btn = await self.page.query_selector(sel)
-                if btn and await btn.is_visible():
-                    await btn.click()
-                    await asyncio.sleep(1)
-                    print(f"    Dismissed cookie banner")
-                    break
+            # One union query for a visible consent button; no waiting when
+            # there is no banner
+            button = self.page.locator(_COOKIE_BUTTON_UNION).first
+            if await button.count():
+                await button.click(timeout=COOKIE_CLICK_TIMEOUT_MS)
+                logger.debug("    Dismissed cookie banner")
         except Exception:
             pass
 
     async def _scroll_to_load_all(self):
         """Scroll to load all job content."""
         try:
-            print(f"  [Plaid] Scrolling to load content...")
+            logger.debug("  [Plaid] Scrolling to load content...")
             
+            # Keep scrolling while new links show up, stop once the count settles
+            count = await self.page.evaluate(_LINK_COUNT_JS)
             for _ in range(15):
-                await self.page.evaluate('window.scrollBy(0, 500)')
-                await asyncio.sleep(0.3)
+                await self.page.evaluate('window.scrollBy(0, document.body.scrollHeight)')
+                try:
+                    await self.page.wait_for_function(
+                        f"{_LINK_COUNT_JS} > {count}",
+                        timeout=SCROLL_SETTLE_TIMEOUT_MS,
+                    )
+                except Exception:
+                    break
+                count = await self.page.evaluate(_LINK_COUNT_JS)
             
             # Scroll back to top
             await self.page.evaluate('window.scrollTo(0, 0)')
-            await asyncio.sleep(1)
         except Exception:
             pass
 
@@ -161,61 +275,65 @@ class PlaidScraper(BaseScraper):
         """Extract jobs by finding career links."""
         jobs: List[Job] = []
         
-        for selector in self.JOB_LINK_SELECTORS:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                
-                if elements:
-                    print(f"    Trying selector: {selector} -> {len(elements)} elements")
-                
-                for element in elements:
-                    job = await self._parse_job_link(element, selector)
-                    if job and job.job_url not in self.seen_urls:
-                        self.seen_urls.add(job.job_url)
-                        jobs.append(job)
-                
-            except Exception as e:
-                continue
+        try:
+            # One union query read in a single evaluate: each link comes back
+            # once, in document order, even if several selectors match it
+            rows = await self.page.eval_on_selector_all(
+                self._JOB_LINK_UNION,
+                _LINK_ROWS_JS,
+                [CARD_TITLE_SELECTORS, CARD_LOCATION_SELECTORS, False],
+            )
+            logger.debug("    Job link selectors matched %s elements", len(rows))
+            
+            for row in rows:
+                job = self._parse_job_link(*row)
+                if job:
+                    jobs.append(job)
+            
+        except Exception as e:
+            logger.debug("    Job link extraction error: %s", e)
         
-        # Deduplicate
-        unique_jobs = []
-        seen = set()
+        # Deduplicate in one pass, keeping the first job seen for each URL
+        by_url = {}
         for job in jobs:
-            if job.job_url not in seen:
-                seen.add(job.job_url)
-                unique_jobs.append(job)
+            if job.job_url not in self.seen_urls:
+                by_url.setdefault(job.job_url, job)
+        unique_jobs = list(by_url.values())
+        self.seen_urls.update(by_url)
         
-        print(f"    Total unique jobs extracted: {len(unique_jobs)}")
+        logger.info("    Total unique jobs extracted: %s", len(unique_jobs))
         return unique_jobs
 
-    async def _parse_job_link(self, element, selector: str) -> Optional[Job]:
-        """Parse a link element to extract job info."""
+    def _parse_job_link(
+        self,
+        href: Optional[str],
+        link_text: Optional[str],
+        title_texts: List[Optional[str]],
+        location_texts: List[Optional[str]],
+    ) -> Optional[Job]:
+        """Build a Job from one link row read by _LINK_ROWS_JS."""
         try:
-            href = await element.get_attribute('href')
             if not href:
                 return None
             
             job_url = self.normalize_url(href)
             
-            # Must be a careers URL
-            if '/careers/' not in job_url:
+            # Must be a careers URL other than the main careers page
+            if not _CAREERS_SUBPAGE.search(job_url):
                 return None
             
-            # Skip main careers page and non-job links
-            if job_url.rstrip('/').endswith('/careers'):
-                return None
-            if any(x in job_url.lower() for x in ['#', 'javascript:', '/apply', '/share']):
+            # Skip non-job links
+            if _BAD_HREF.search(job_url):
                 return None
             
             # Get title - depends on what kind of link this is
             title = ""
             
-            link_text = await element.text_content()
             link_text = self.clean_text(link_text) if link_text else ""
             
             # If this is a "See role" button, get title from parent/sibling
             if link_text.lower() in ['see role', 'view role', 'apply']:
-                title = await self._get_title_from_card(element)
+                title = self._card_title(title_texts)
             else:
                 # Link text is the title
                 title = link_text
@@ -228,7 +346,7 @@ class PlaidScraper(BaseScraper):
                 return None
             
             # Get location
-            location = await self._get_location_from_card(element)
+            location = self._card_location(location_texts)
             
             job_id = self._extract_job_id(job_url)
             
@@ -244,121 +362,53 @@ class PlaidScraper(BaseScraper):
         except Exception:
             return None
 
-    async def _get_title_from_card(self, element) -> str:
-        """Get job title from the card containing this element."""
-        try:
-            # Navigate up to find card/container
-            parent = await element.evaluate_handle('''el => {
-                let p = el.parentElement;
-                for (let i = 0; i < 5 && p; i++) {
-                    p = p.parentElement;
-                }
-                return p;
-            }''')
-            
-            if parent:
-                # Look for title-like elements
-                title_selectors = ['h2', 'h3', 'h4', 'strong', '[class*="title"]', '[class*="name"]']
-                for sel in title_selectors:
-                    try:
-                        title_el = await parent.query_selector(sel)
-                        if title_el:
-                            text = await title_el.text_content()
-                            text = self.clean_text(text) if text else ""
-                            if text and len(text) > 3 and text.lower() not in ['see role', 'apply']:
-                                return text
-                    except Exception:
-                        continue
-        except Exception:
-            pass
+    def _card_title(self, title_texts: List[Optional[str]]) -> str:
+        """Pick the job title from the card's title-selector texts."""
+        for text in title_texts:
+            text = self.clean_text(text) if text else ""
+            if text and len(text) > 3 and text.lower() not in ['see role', 'apply']:
+                return text
         return ""
 
-    async def _get_location_from_card(self, element) -> str:
-        """Get location from the card containing this element."""
-        try:
-            parent = await element.evaluate_handle('el => el.closest("div, article, li")')
-            if parent:
-                location_indicators = ['new york', 'san francisco', 'remote', 'us', 'united states']
-                
-                # Try specific selectors
-                for sel in ['[class*="location"]', 'span', 'p']:
-                    try:
-                        loc_el = await parent.query_selector(sel)
-                        if loc_el:
-                            text = await loc_el.text_content()
-                            text = self.clean_text(text).lower() if text else ""
-                            for indicator in location_indicators:
-                                if indicator in text:
-                                    return self.clean_text(await loc_el.text_content())
-                    except Exception:
-                        continue
-        except Exception:
-            pass
+    def _card_location(self, location_texts: List[Optional[str]]) -> str:
+        """Pick the location from the card's location-selector texts."""
+        for raw in location_texts:
+            text = self.clean_text(raw) if raw else ""
+            if text and _LOCATION_INDICATOR.search(text):
+                return text
         return ""
 
     def _title_from_url(self, url: str) -> str:
         """Extract a readable title from URL path."""
-        try:
-            # Get path segments
-            path = urlparse(url).path
-            segments = [s for s in path.split('/') if s and s not in ['careers', 'openings']]
-            if segments:
-                # Convert slug to title
-                slug = segments[-1]
-                title = slug.replace('-', ' ').replace('_', ' ').title()
-                return title
-        except Exception:
-            pass
-        return ""
+        return _title_from_url(url)
 
     def _extract_job_id(self, url: str) -> str:
         """Extract or generate job ID for Plaid."""
-        # Try to get from URL path
-        match = re.search(r'/careers/[^/]+/([^/?#]+)', url)
-        if match:
-            return f"PL_{match.group(1)[:30]}"
-        
-        match = re.search(r'/openings/([^/?#]+)', url)
-        if match:
-            return f"PL_{match.group(1)[:30]}"
-        
-        return self.generate_job_id(url, "")
+        return _job_id_from_url(url) or self.generate_job_id(url, "")
 
     async def _deep_search_for_jobs(self) -> List[Job]:
         """Deep search: get all links and filter for career-like ones."""
         jobs: List[Job] = []
         
         try:
-            # Get ALL links on page
-            all_links = await self.page.query_selector_all('a[href]')
-            print(f"    Deep search: Found {len(all_links)} total links")
+            # Get ALL links on page; the browser drops non-career links and
+            # reads the rest in the same evaluate
+            rows = await self.page.eval_on_selector_all(
+                'a[href]',
+                _LINK_ROWS_JS,
+                [CARD_TITLE_SELECTORS, CARD_LOCATION_SELECTORS, True],
+            )
             
-            career_link_count = 0
-            for link in all_links:
-                href = await link.get_attribute('href')
-                if not href:
-                    continue
-                
-                href_lower = href.lower()
-                
-                # Only process career-like URLs
-                if '/careers/' not in href_lower:
-                    continue
-                if href.rstrip('/').endswith('/careers'):
-                    continue
-                if any(x in href_lower for x in ['#', 'javascript:']):
-                    continue
-                
-                career_link_count += 1
-                
-                job = await self._parse_job_link(link, "deep_search")
+            career_link_count = len(rows)
+            for row in rows:
+                job = self._parse_job_link(*row)
                 if job and job.job_url not in self.seen_urls:
                     self.seen_urls.add(job.job_url)
                     jobs.append(job)
             
-            print(f"    Deep search: Found {career_link_count} career links, extracted {len(jobs)} jobs")
+            logger.info("    Deep search: Found %s career links, extracted %s jobs", career_link_count, len(jobs))
             
         except Exception as e:
-            print(f"    Deep search error: {e}")
+            logger.warning("    Deep search error: %s", e)
         
         return jobs
@@ -8,14 +8,20 @@ SmartRecruiters URL patterns:
 - API: api.smartrecruiters.com/v1/companies/{company}/postings
 """
 import asyncio
+import logging
 import re
 from typing import List, Optional
 
-import requests
-from playwright.async_api import async_playwright
+from playwright.async_api import BrowserContext
 
 from config import PAGE_LOAD_TIMEOUT_MS
-from scraper.base_scraper import BaseScraper, Job
+from scraper.base_scraper import BaseScraper, HREF_AND_TEXT_BY_SELECTOR_JS, Job
+from scraper.browser_pool import block_heavy_resources
+from utils import http_cache
+from utils.host_limiter import host_semaphore
+from utils.http_session import get_session, parse_json
+
+logger = logging.getLogger(__name__)
 
 
 class SmartRecruitersScraper(BaseScraper):
@@ -25,6 +31,7 @@ class SmartRecruitersScraper(BaseScraper):
     """
 
     API_BASE = "https://api.smartrecruiters.com/v1/companies"
+    API_HEADERS = {"Accept": "application/json"}
     
     # SmartRecruiters-specific selectors
     JOB_SELECTORS = [
@@ -36,18 +43,22 @@ class SmartRecruitersScraper(BaseScraper):
         'article.job a',
     ]
 
-    def __init__(self, company_name: str, career_url: str):
-        super().__init__(company_name, career_url)
+    # Precompiled URL patterns
+    _COMPANY_ID_PATTERNS = [
+        re.compile(r'jobs\.smartrecruiters\.com/([^/\?]+)'),
+        re.compile(r'careers\.smartrecruiters\.com/([^/\?]+)'),
+    ]
+    _JOB_ID_PATTERN = re.compile(r'/job/([a-zA-Z0-9-]+)')
+
+    def __init__(self, company_name: str, career_url: str, context: Optional[BrowserContext] = None):
+        super().__init__(company_name, career_url, context)
         self.company_id = self._extract_company_id(career_url)
+        self._session = get_session()
 
     def _extract_company_id(self, url: str) -> Optional[str]:
         """Extract the SmartRecruiters company ID from URL."""
-        patterns = [
-            r'jobs\.smartrecruiters\.com/([^/\?]+)',
-            r'careers\.smartrecruiters\.com/([^/\?]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in self._COMPANY_ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         return None
@@ -59,7 +70,7 @@ class SmartRecruitersScraper(BaseScraper):
             jobs = await self._scrape_via_api()
             if jobs:
                 return jobs
-            print(f"  [SmartRecruiters] API failed, falling back to browser")
+            logger.warning("  [SmartRecruiters] API failed, falling back to browser")
 
         # Fallback to browser scraping
         return await self._scrape_via_browser()
@@ -67,95 +78,145 @@ class SmartRecruitersScraper(BaseScraper):
     async def _scrape_via_api(self) -> List[Job]:
         """Scrape using SmartRecruiters API."""
         all_jobs: List[Job] = []
-        offset = 0
         limit = 100
         
         try:
-            while True:
-                url = f"{self.API_BASE}/{self.company_id}/postings?limit={limit}&offset={offset}"
-                print(f"  [SmartRecruiters] Fetching from API (offset={offset})")
-                
-                response = requests.get(url, timeout=30)
-                if response.status_code != 200:
-                    print(f"  [SmartRecruiters] API returned {response.status_code}")
+            # The first page tells us how many postings there are; the rest
+            # of the pages are then fetched concurrently
+            first_page = await self._fetch_postings_page(0, limit)
+            pages = [first_page]
+            
+            if first_page:
+                total = first_page.get("totalFound", 0)
+                pages += await asyncio.gather(
+                    *(self._fetch_postings_page(offset, limit) for offset in range(limit, total, limit))
+                )
+            
+            for data in pages:
+                if not data:
                     break
                 
-                data = response.json()
                 content = data.get("content", [])
                 
                 if not content:
                     break
                 
-                print(f"  [SmartRecruiters] Got {len(content)} postings")
-                
-                for posting in content:
-                    title = posting.get("name", "")
-                    
-                    # Check if matches keywords
-                    matched_keywords = self.matches_keywords(title)
-                    if not matched_keywords:
-                        continue
-                    
-                    job_id = f"SR_{posting.get('id', '')}"
-                    
-                    # Build job URL
-                    ref = posting.get("ref", "")
-                    job_url = f"https://jobs.smartrecruiters.com/{self.company_id}/{ref}" if ref else ""
-                    
-                    # Extract location
-                    location_data = posting.get("location", {})
-                    location = location_data.get("city", "") if isinstance(location_data, dict) else ""
-                    
-                    all_jobs.append(Job(
-                        job_id=job_id,
-                        job_title=title,
-                        job_url=job_url,
-                        company_name=self.company_name,
-                        company_career_url=self.career_url,
-                        location=location,
-                        keywords_matched=matched_keywords,
-                    ))
+                logger.info("  [SmartRecruiters] Got %s postings", len(content))
                 
-                # Check for more pages
-                total = data.get("totalFound", 0)
-                offset += limit
-                if offset >= total:
-                    break
+                all_jobs.extend(self._jobs_from_postings(content))
             
-            print(f"  [SmartRecruiters] Found {len(all_jobs)} matching jobs via API")
+            logger.info("  [SmartRecruiters] Found %s matching jobs via API", len(all_jobs))
             return all_jobs
             
         except Exception as e:
-            print(f"  [SmartRecruiters] API error: {e}")
+            logger.warning("  [SmartRecruiters] API error: %s", e)
             return []
 
+    def _jobs_from_postings(self, postings: List[dict]) -> List[Job]:
+        """
+        Map one page of API postings to Jobs, keeping only keyword matches.
+
+        Loop invariants (bound methods, URL prefix, company fields) are hoisted
+        into locals since large companies return thousands of postings.
+        """
+        jobs: List[Job] = []
+        append = jobs.append
+        matches_keywords = self.matches_keywords
+        url_prefix = f"https://jobs.smartrecruiters.com/{self.company_id}/"
+        company_name = self.company_name
+        career_url = self.career_url
+        
+        for posting in postings:
+            title = posting.get("name", "")
+            
+            # Check if matches keywords
+            matched_keywords = matches_keywords(title)
+            if not matched_keywords:
+                continue
+            
+            job_id = f"SR_{posting.get('id', '')}"
+            
+            # Build job URL
+            ref = posting.get("ref", "")
+            job_url = f"{url_prefix}{ref}" if ref else ""
+            
+            # Extract location
+            location_data = posting.get("location", {})
+            location = location_data.get("city", "") if isinstance(location_data, dict) else ""
+            
+            append(Job(
+                job_id=job_id,
+                job_title=title,
+                job_url=job_url,
+                company_name=company_name,
+                company_career_url=career_url,
+                location=location,
+                keywords_matched=matched_keywords,
+            ))
+        
+        return jobs
+
+    async def _fetch_postings_page(self, offset: int, limit: int) -> Optional[dict]:
+        """
+        Fetch one page of postings from the SmartRecruiters API.
+
+        Args:
+            offset: Index of the first posting to return.
+            limit: Page size.
+
+        Returns:
+            The decoded page, or None if the API did not return 200.
+        """
+        url = f"{self.API_BASE}/{self.company_id}/postings?limit={limit}&offset={offset}"
+        
+        # Reuse a recent copy of this page outright, otherwise revalidate it
+        cache_key = f"smartrecruiters_{self.company_id}_{offset}_{limit}"
+        cached = http_cache.load(cache_key)
+        if http_cache.is_fresh(cached):
+            logger.info("  [SmartRecruiters] Using cached page (offset=%s)", offset)
+            return parse_json(cached["body"])
+        
+        logger.info("  [SmartRecruiters] Fetching from API (offset=%s)", offset)
+        
+        # Blocking request runs in a worker thread; the host semaphore caps
+        # how many pages are in flight at once
+        async with host_semaphore(url):
+            response = await asyncio.to_thread(
+                self._session.get,
+                url,
+                headers={**self.API_HEADERS, **http_cache.conditional_headers(cached)},
+                timeout=30,
+            )
+        if response.status_code == 304 and cached:
+            return parse_json(cached["body"])
+        if response.status_code != 200:
+            logger.warning("  [SmartRecruiters] API returned %s", response.status_code)
+            return None
+        
+        http_cache.save(cache_key, response)
+        return parse_json(response.content)
+
     async def _scrape_via_browser(self) -> List[Job]:
         """Fallback browser scraping for SmartRecruiters."""
         all_jobs: List[Job] = []
         seen_urls: set = set()
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--disable-blink-features=AutomationControlled']
-            )
-            
-            context = await browser.new_context(
+        try:
+            async with self.open_page(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            
-            page = await context.new_page()
-
-            try:
-                await page.goto(self.career_url, wait_until='networkidle', timeout=PAGE_LOAD_TIMEOUT_MS)
+            ) as page:
+                await block_heavy_resources(page)
+                async with host_semaphore(self.career_url):
+                    await page.goto(self.career_url, wait_until='networkidle', timeout=PAGE_LOAD_TIMEOUT_MS)
                 await asyncio.sleep(3)
 
-                for selector in self.JOB_SELECTORS:
-                    elements = await page.query_selector_all(selector)
-                    
-                    for element in elements:
-                        href = await element.get_attribute('href')
+                # Run every selector in one round-trip, each returning
+                # [href, text] rows; results keep selector priority
+                results = await page.evaluate(HREF_AND_TEXT_BY_SELECTOR_JS, self.JOB_SELECTORS)
+
+                for rows in results:
+                    for href, title in rows:
                         if not href or href in seen_urls:
                             continue
                         
@@ -165,7 +226,6 @@ class SmartRecruitersScraper(BaseScraper):
                         
                         seen_urls.add(job_url)
                         
-                        title = await element.text_content()
                         title = self.clean_text(title) if title else ""
                         
                         if not title or len(title) < 3:
@@ -185,18 +245,15 @@ class SmartRecruitersScraper(BaseScraper):
                     
                     if all_jobs:
                         break
+        except Exception as e:
+            logger.warning("  [SmartRecruiters] Browser error: %s", e)
 
-            except Exception as e:
-                print(f"  [SmartRecruiters] Browser error: {e}")
-            finally:
-                await browser.close()
-
-        print(f"  [SmartRecruiters] Found {len(all_jobs)} matching jobs via browser")
+        logger.info("  [SmartRecruiters] Found %s matching jobs via browser", len(all_jobs))
         return all_jobs
 
     def _extract_job_id(self, url: str) -> str:
         """Extract SmartRecruiters job ID from URL."""
-        match = re.search(r'/job/([a-zA-Z0-9-]+)', url)
+        match = self._JOB_ID_PATTERN.search(url)
         if match:
             return f"SR_{match.group(1)}"
         return self.generate_job_id(url, "")
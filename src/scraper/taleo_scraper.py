@@ -5,22 +5,45 @@ Handles legacy Taleo sites with *.taleo.net domains.
 Taleo URL patterns:
 - {company}.taleo.net/careersection/{section}/joblist.ftl
 - {company}.taleo.net/careersection/{section}/jobdetail.ftl?job={id}
+- API: {company}.taleo.net/careersection/rest/jobboard/searchjobs?portal={id} (POST)
 """
 import asyncio
+import logging
 import re
-from typing import List
-from urllib.parse import urljoin, parse_qs, urlparse
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, unquote_plus, urlparse
 
-from playwright.async_api import async_playwright
+from playwright.async_api import BrowserContext
 
 from config import PAGE_LOAD_TIMEOUT_MS, MAX_PAGES_PER_COMPANY, SCRAPE_DELAY_SECONDS
-from scraper.base_scraper import BaseScraper, Job
+from scraper.base_scraper import BaseScraper, HREF_AND_TEXT_BY_SELECTOR_JS, Job
+from scraper.browser_pool import block_heavy_resources
+from utils.host_limiter import host_semaphore
+from utils.http_session import get_session, parse_json
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for the wait on the first rendered job link
+RENDER_WAIT_TIMEOUT_MS = 20000
+
+# Reads [href, title, location] for every listing row with a job link in one
+# round-trip
+_READ_ROWS_JS = '''rows => rows.map(row => {
+    const link = row.querySelector('a[href*="job"], a.jobTitle-link, td.colTitle a');
+    if (!link) return null;
+    const location = row.querySelector('td.colLocation, td:nth-child(3), .locationColumn');
+    return [link.getAttribute("href"), link.textContent, location ? location.textContent : null];
+}).filter(Boolean)'''
+
+# Detected searchjobs endpoint per career section URL, so the portal lookup
+# (a page fetch) happens once per site per run
+_API_URLS: Dict[str, Optional[str]] = {}
 
 
 class TaleoScraper(BaseScraper):
     """
     Scraper for Oracle Taleo career sites.
-    Uses browser automation to handle legacy dynamic content.
+    Prioritizes the jobboard REST API, falls back to browser automation.
     """
 
     # Taleo-specific selectors
@@ -35,6 +58,8 @@ class TaleoScraper(BaseScraper):
         'table.tablelist a[href*="requisitionListInterface"]',
     ]
 
+    _JOB_LINK_UNION = ', '.join(JOB_SELECTORS)
+
     PAGINATION_SELECTORS = [
         'a#next',
         'a[id*="next" i]',
@@ -44,48 +69,215 @@ class TaleoScraper(BaseScraper):
         '[onclick*="next"]',
     ]
 
-    def __init__(self, company_name: str, career_url: str):
-        super().__init__(company_name, career_url)
+    API_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
+
+    # Precompiled URL / page patterns
+    _SECTION_PATTERN = re.compile(r'/careersection/([^/?#]+)/')
+    _PORTAL_PATTERN = re.compile(r'portal[=:"\s]+(\d+)')
+    _REQUISITION_PATTERN = re.compile(r'requisition[=/](\d+)', re.IGNORECASE)
+    _JOB_PARAM_PATTERN = re.compile(r'[?&]job=([^&#]+)')
+
+    def __init__(self, company_name: str, career_url: str, context: Optional[BrowserContext] = None):
+        super().__init__(company_name, career_url, context)
         self.seen_urls: set = set()
+        self.listings_read = 0
+        self._session = get_session()
+        
+        match = self._SECTION_PATTERN.search(career_url)
+        self.section = match.group(1) if match else None
+        parsed = urlparse(career_url)
+        self.site_root = f"{parsed.scheme}://{parsed.netloc}"
 
     async def scrape(self) -> List[Job]:
-        """Scrape jobs from Taleo career site."""
-        all_jobs: List[Job] = []
+        """Scrape jobs using the REST API first, then fallback to browser."""
+        all_jobs: Optional[List[Job]] = None
+        
+        # Try API first (no browser needed)
+        if self.section:
+            all_jobs = await self._scrape_via_api()
+            if all_jobs is None:
+                logger.warning("  [Taleo] API failed, falling back to browser for %s", self.company_name)
+        
+        # Fallback to browser scraping
+        if all_jobs is None:
+            all_jobs = await self._scrape_via_browser()
+
+        logger.info("  [Taleo] Found %s matching jobs (out of %s total)", len(all_jobs), self.listings_read)
+        return all_jobs
+
+    async def _get_api_url(self) -> Optional[str]:
+        """
+        Find the searchjobs endpoint for this career section.
+
+        The endpoint needs the site's numeric portal ID, which only appears in
+        the career page itself; the result is cached per career URL.
+        """
+        if self.career_url in _API_URLS:
+            return _API_URLS[self.career_url]
+        
+        api_url = None
+        async with host_semaphore(self.career_url):
+            response = await asyncio.to_thread(self._session.get, self.career_url, timeout=30)
+        if response.status_code == 200:
+            match = self._PORTAL_PATTERN.search(response.text)
+            if match:
+                api_url = f"{self.site_root}/careersection/rest/jobboard/searchjobs?lang=en&portal={match.group(1)}"
+        
+        _API_URLS[self.career_url] = api_url
+        return api_url
+
+    async def _scrape_via_api(self) -> Optional[List[Job]]:
+        """
+        Scrape using the Taleo jobboard REST API.
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--disable-blink-features=AutomationControlled', '--no-sandbox']
+        Returns:
+            Requisitions matching our keywords, or None if the API failed.
+        """
+        all_jobs: List[Job] = []
+        
+        try:
+            api_url = await self._get_api_url()
+            if not api_url:
+                return None
+            
+            # The first page reports the total and page size; the rest of the
+            # pages are then fetched concurrently
+            first_page = await self._fetch_jobs_page(api_url, 1)
+            if first_page is None:
+                return None
+            
+            paging = first_page.get("pagingData", {})
+            page_size = paging.get("pageSize") or 1
+            page_total = min(-(-paging.get("totalCount", 0) // page_size), MAX_PAGES_PER_COMPANY)
+            pages = [first_page]
+            pages += await asyncio.gather(
+                *(self._fetch_jobs_page(api_url, page_no) for page_no in range(2, page_total + 1))
             )
+            
+            for data in pages:
+                if not data:
+                    continue
+                for requisition in data.get("requisitionList", []):
+                    job = self._job_from_requisition(requisition)
+                    if job and job.job_url not in self.seen_urls:
+                        self.seen_urls.add(job.job_url)
+                        all_jobs.append(job)
+            
+            logger.info("  [Taleo] Got %s requisitions via API", self.listings_read)
+            return all_jobs
+            
+        except Exception as e:
+            logger.warning("  [Taleo] API error: %s", e)
+            return None
+
+    async def _fetch_jobs_page(self, api_url: str, page_no: int) -> Optional[dict]:
+        """
+        Fetch one page of requisitions from the searchjobs API.
+
+        Args:
+            api_url: Endpoint from _get_api_url.
+            page_no: 1-based page number.
+
+        Returns:
+            The decoded page, or None if the API did not return 200.
+        """
+        payload = {
+            "multilineEnabled": False,
+            "sortingSelection": {"sortBySelectionParam": "3", "ascendingSortingOrder": "false"},
+            "fieldData": {"fields": {"KEYWORD": "", "LOCATION": ""}, "valid": True},
+            "pageNo": page_no,
+        }
+        logger.debug("  [Taleo] Fetching from API (page=%s)", page_no)
+        
+        async with host_semaphore(api_url):
+            response = await asyncio.to_thread(
+                self._session.post,
+                api_url,
+                json=payload,
+                headers=self.API_HEADERS,
+                timeout=30,
+            )
+        if response.status_code != 200:
+            logger.warning("  [Taleo] API returned %s", response.status_code)
+            return None
+        
+        return parse_json(response.content)
+
+    def _job_from_requisition(self, requisition: dict) -> Optional[Job]:
+        """Build a Job from one requisitionList entry (None if incomplete or not a keyword match)."""
+        columns = requisition.get("column") or []
+        title = self.clean_text(columns[0]) if columns and columns[0] else ""
+        job_no = requisition.get("contestNo") or requisition.get("jobId")
+        if not title or not job_no:
+            return None
+        
+        self.listings_read += 1
+        matched_keywords = self.matches_keywords(title)
+        if not matched_keywords:
+            return None
+        
+        # The location column is a JSON-encoded list of locations
+        location = columns[1] if len(columns) > 1 and columns[1] else ""
+        if location.startswith("["):
+            try:
+                location = "; ".join(parse_json(location))
+            except ValueError:
+                pass
+        
+        return Job(
+            job_id=f"TL_{job_no}",
+            job_title=title,
+            job_url=f"{self.site_root}/careersection/{self.section}/jobdetail.ftl?job={job_no}",
+            company_name=self.company_name,
+            company_career_url=self.career_url,
+            location=self.clean_text(location),
+            keywords_matched=matched_keywords,
+        )
+
+    async def _scrape_via_browser(self) -> List[Job]:
+        """Fallback browser scraping for Taleo."""
+        all_jobs: List[Job] = []
 
-            context = await browser.new_context(
+        try:
+            async with self.open_page(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-
-            page = await context.new_page()
-
-            try:
-                print(f"  [Taleo] Navigating to {self.career_url}")
-                await page.goto(self.career_url, wait_until='networkidle', timeout=PAGE_LOAD_TIMEOUT_MS)
-                await asyncio.sleep(5)  # Taleo sites are slow
+            ) as page:
+                await block_heavy_resources(page)
 
+                logger.info("  [Taleo] Navigating to %s", self.career_url)
+                async with host_semaphore(self.career_url):
+                    await page.goto(self.career_url, wait_until='domcontentloaded', timeout=PAGE_LOAD_TIMEOUT_MS)
+                
+                # Taleo sites are slow; wait for the first job link to render
+                try:
+                    await page.wait_for_selector(
+                        self._JOB_LINK_UNION,
+                        state='attached',
+                        timeout=RENDER_WAIT_TIMEOUT_MS,
+                    )
+                except Exception:
+                    logger.debug("  [Taleo] No job links after %sms, continuing", RENDER_WAIT_TIMEOUT_MS)
+
+                # Raw hrefs of every listing read, matching or not
+                seen_links: set = set()
                 page_count = 0
                 while page_count < MAX_PAGES_PER_COMPANY:
                     page_count += 1
-                    print(f"  [Taleo] Scraping page {page_count}...")
+                    logger.info("  [Taleo] Scraping page %s...", page_count)
 
                     # Extract jobs from current page
-                    page_jobs = await self._extract_jobs(page)
+                    page_jobs, page_links = await self._extract_jobs(page)
                     
-                    new_count = 0
                     for job in page_jobs:
                         if job.job_url not in self.seen_urls:
                             self.seen_urls.add(job.job_url)
                             all_jobs.append(job)
-                            new_count += 1
 
-                    if new_count == 0 and page_count > 1:
+                    # Stop once a page shows no listings we haven't read
+                    new_links = page_links - seen_links
+                    seen_links |= new_links
+                    if not new_links and page_count > 1:
                         break
 
                     # Try pagination
@@ -95,102 +287,81 @@ class TaleoScraper(BaseScraper):
 
                     await asyncio.sleep(SCRAPE_DELAY_SECONDS)
 
-            except Exception as e:
-                print(f"  [Taleo] Error: {e}")
-            finally:
-                await browser.close()
+        except Exception as e:
+            logger.warning("  [Taleo] Error: %s", e)
 
-        # Filter by keywords
-        filtered_jobs = []
-        for job in all_jobs:
-            matched_keywords = self.matches_keywords(job.job_title)
-            if matched_keywords:
-                job.keywords_matched = matched_keywords
-                filtered_jobs.append(job)
+        return all_jobs
 
-        print(f"  [Taleo] Found {len(filtered_jobs)} matching jobs (out of {len(all_jobs)} total)")
-        return filtered_jobs
+    async def _extract_jobs(self, page):
+        """
+        Extract jobs from current page.
 
-    async def _extract_jobs(self, page) -> List[Job]:
-        """Extract jobs from current page."""
+        Returns:
+            (jobs, links): the Jobs matching our keywords, and the raw hrefs
+            of every listing read from the page.
+        """
         jobs: List[Job] = []
 
         # Taleo often uses tables
-        rows = await page.query_selector_all('table tr, .requisitionList tr, #requisitionList tr')
+        rows = await page.eval_on_selector_all(
+            'table tr, .requisitionList tr, #requisitionList tr',
+            _READ_ROWS_JS,
+        )
+        read_before = self.listings_read
         
-        for row in rows:
-            try:
-                # Find job title link in row
-                link = await row.query_selector('a[href*="job"], a.jobTitle-link, td.colTitle a')
-                if not link:
-                    continue
-
-                href = await link.get_attribute('href')
-                if not href:
-                    continue
-
-                job_url = self.normalize_url(href)
-                
-                title = await link.text_content()
-                title = self.clean_text(title) if title else ""
+        for href, title, location in rows:
+            job = self._build_job(href, title, location)
+            if job:
+                jobs.append(job)
+
+        # Fallback to direct selectors, all run in one round-trip
+        if self.listings_read == read_before:
+            results = await page.evaluate(HREF_AND_TEXT_BY_SELECTOR_JS, self.JOB_SELECTORS)
+            for selector_rows in results:
+                for href, title in selector_rows:
+                    job = self._build_job(href, title)
+                    if job:
+                        jobs.append(job)
                 
-                if not title or len(title) < 3:
-                    continue
+                if self.listings_read > read_before:
+                    rows = selector_rows
+                    break
 
-                job_id = self._extract_job_id(job_url)
-
-                # Try to get location from row
-                location = ""
-                loc_cell = await row.query_selector('td.colLocation, td:nth-child(3), .locationColumn')
-                if loc_cell:
-                    location = await loc_cell.text_content()
-                    location = self.clean_text(location) if location else ""
-
-                jobs.append(Job(
-                    job_id=job_id,
-                    job_title=title,
-                    job_url=job_url,
-                    company_name=self.company_name,
-                    company_career_url=self.career_url,
-                    location=location,
-                ))
-            except Exception:
-                continue
+        return jobs, {row[0] for row in rows if row[0]}
 
-        # Fallback to direct selectors
-        if not jobs:
-            for selector in self.JOB_SELECTORS:
-                elements = await page.query_selector_all(selector)
-                for element in elements:
-                    try:
-                        href = await element.get_attribute('href')
-                        if not href:
-                            continue
-
-                        job_url = self.normalize_url(href)
-                        
-                        title = await element.text_content()
-                        title = self.clean_text(title) if title else ""
-                        
-                        if not title or len(title) < 3:
-                            continue
-
-                        job_id = self._extract_job_id(job_url)
-
-                        jobs.append(Job(
-                            job_id=job_id,
-                            job_title=title,
-                            job_url=job_url,
-                            company_name=self.company_name,
-                            company_career_url=self.career_url,
-                        ))
-                    except Exception:
-                        continue
-                
-                if jobs:
-                    break
+    def _build_job(self, href: Optional[str], title: Optional[str], location: Optional[str] = None) -> Optional[Job]:
+        """
+        Build a Job from a link's href/text and optional location text.
 
-        return jobs
+        Returns:
+            The Job, or None if the link has no usable title or the title
+            matches none of our keywords.
+        """
+        if not href:
+            return None
+
+        title = self.clean_text(title) if title else ""
+        
+        if not title or len(title) < 3:
+            return None
+
+        # Skip non-matching titles before building the URL and Job
+        self.listings_read += 1
+        matched_keywords = self.matches_keywords(title)
+        if not matched_keywords:
+            return None
+
+        job_url = self.normalize_url(href)
+
+        return Job(
+            job_id=self._extract_job_id(job_url),
+            job_title=title,
+            job_url=job_url,
+            company_name=self.company_name,
+            company_career_url=self.career_url,
+            location=self.clean_text(location) if location else "",
+            keywords_matched=matched_keywords,
+        )
 
     async def _go_to_next_page(self, page) -> bool:
         """Navigate to next page of results."""
@@ -210,14 +381,13 @@ class TaleoScraper(BaseScraper):
 
     def _extract_job_id(self, url: str) -> str:
         """Extract Taleo job ID from URL."""
-        # Try job= parameter
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-        if 'job' in params:
-            return f"TL_{params['job'][0]}"
+        # Try job= parameter (first non-empty value, as parse_qs would give)
+        match = self._JOB_PARAM_PATTERN.search(url)
+        if match:
+            return f"TL_{unquote_plus(match.group(1))}"
         
         # Try requisition ID pattern
-        match = re.search(r'requisition[=/](\d+)', url, re.IGNORECASE)
+        match = self._REQUISITION_PATTERN.search(url)
         if match:
             return f"TL_{match.group(1)}"
 
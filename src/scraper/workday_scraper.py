@@ -1,14 +1,20 @@
 """
 Workday-specific scraper - handles myworkdayjobs.com career sites.
 Workday sites use a consistent API structure that we can leverage.
+
+Workday URL patterns:
+- {tenant}.wd5.myworkdayjobs.com/{site}
+- {tenant}.wd5.myworkdayjobs.com/{locale}/{site}
+- API: {host}/wday/cxs/{tenant}/{site}/jobs (POST, paged by limit/offset)
 """
 import asyncio
 import json
+import logging
 import re
 from typing import List, Optional
 from urllib.parse import urljoin, urlparse, parse_qs
 
-from playwright.async_api import async_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
+from playwright.async_api import BrowserContext, Page, TimeoutError as PlaywrightTimeout
 
 from config import (
     SCRAPE_DELAY_SECONDS,
@@ -16,6 +22,33 @@ from config import (
     MAX_PAGES_PER_COMPANY,
 )
 from scraper.base_scraper import BaseScraper, Job
+from scraper.browser_pool import block_heavy_resources
+from utils.host_limiter import host_semaphore
+from utils.http_session import get_session, parse_json
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for the wait on the first rendered job link
+RENDER_WAIT_TIMEOUT_MS = 15000
+
+# Runs each job-list selector in one round-trip, returning [href, text,
+# location] rows per selector in priority order. The href falls back to a
+# child link, the location comes from the listing's container.
+_JOB_ROWS_BY_SELECTOR_JS = '''selectors => selectors.map(sel => Array.from(
+    document.querySelectorAll(sel),
+    el => {
+        const link = el.getAttribute("href") ? el : el.querySelector("a");
+        const container = el.closest("li, article, div[data-automation-id]");
+        const location = container
+            ? container.querySelector('[data-automation-id="locationText"], [class*="location"]')
+            : null;
+        return [
+            link ? link.getAttribute("href") : null,
+            el.textContent,
+            location ? location.textContent : null,
+        ];
+    }
+))'''
 
 
 class WorkdayScraper(BaseScraper):
@@ -33,6 +66,8 @@ class WorkdayScraper(BaseScraper):
         'section[data-automation-id="jobResults"] a',
     ]
 
+    _JOB_LIST_UNION = ', '.join(JOB_LIST_SELECTORS)
+
     PAGINATION_SELECTORS = [
         'button[data-automation-id="paginationNextBtn"]',
         'button[aria-label="next"]',
@@ -40,56 +75,254 @@ class WorkdayScraper(BaseScraper):
         'a[data-uxi-element-id="next"]',
     ]
 
-    def __init__(self, company_name: str, career_url: str):
-        super().__init__(company_name, career_url)
-        self.browser: Optional[Browser] = None
+    # The CXS jobs endpoint serves at most 20 postings per request
+    API_PAGE_SIZE = 20
+    API_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
+
+    # Locale segment that may precede the site name (/en-US/{site})
+    _LOCALE_SEGMENT = re.compile(r'^[a-z]{2}-[A-Z]{2}$')
+
+    # CXS jobs endpoint as requested by the career page: (origin, site)
+    _CXS_JOBS_URL = re.compile(r'^(https?://[^/]+)/wday/cxs/[^/]+/([^/]+)/jobs(?:\?|$)')
+
+    # Last path segment under /job/, e.g. "Data-Analyst_JR12345" in
+    # /job/Austin-TX/Data-Analyst_JR12345
+    _JOB_SLUG_PATTERN = re.compile(r'/job/(?:[^/?#]+/)*([^/?#]+)')
+
+    # Fallback job ID patterns for URLs without a /job/ path, tried in order
+    _JOB_ID_PATTERNS = [
+        re.compile(r'jobPostingId=([A-Za-z0-9_-]+)'),
+        re.compile(r'R-(\d+)'),
+    ]
+
+    def __init__(self, company_name: str, career_url: str, context: Optional[BrowserContext] = None):
+        super().__init__(company_name, career_url, context)
         self.page: Optional[Page] = None
         self.seen_urls: set = set()
+        self.listings_read = 0
+        self.api_url, self.site_prefix = self._build_api_url(career_url)
+        self._session = get_session()
+
+    def _build_api_url(self, url: str):
+        """
+        Derive the CXS jobs endpoint from a career site URL.
+
+        Args:
+            url: Career page URL, e.g. https://acme.wd5.myworkdayjobs.com/en-US/External.
+
+        Returns:
+            (api_url, site_prefix) where site_prefix is the scheme, host and
+            path up to the site name (job externalPaths are relative to it),
+            or (None, None) if the URL isn't a myworkdayjobs.com site.
+        """
+        parsed = urlparse(url)
+        host = parsed.netloc
+        if not host.endswith("myworkdayjobs.com"):
+            return None, None
+        
+        tenant = host.split(".", 1)[0]
+        segments = [s for s in parsed.path.split("/") if s]
+        if segments and self._LOCALE_SEGMENT.match(segments[0]):
+            segments = segments[1:]
+        if not segments:
+            return None, None
+        
+        site = segments[0]
+        return f"https://{host}/wday/cxs/{tenant}/{site}/jobs", self._site_prefix(f"https://{host}", site)
+
+    def _site_prefix(self, origin: str, site: str) -> str:
+        """
+        Base URL that a site's job externalPaths are relative to.
+
+        Keeps the career URL's locale segment (/en-US/{site}), so jobs get the
+        same URL whether they came from the API, an intercepted XHR or the DOM.
+        """
+        segments = [s for s in urlparse(self.career_url).path.split("/") if s]
+        if segments and self._LOCALE_SEGMENT.match(segments[0]):
+            return f"{origin}/{segments[0]}/{site}"
+        return f"{origin}/{site}"
 
     async def scrape(self) -> List[Job]:
-        """Scrape all job listings from Workday career page."""
+        """Scrape jobs using the CXS API first, then fallback to browser."""
+        all_jobs: Optional[List[Job]] = None
+        
+        # Try API first (no browser needed)
+        if self.api_url:
+            all_jobs = await self._scrape_via_api()
+            if all_jobs is None:
+                logger.warning("  [Workday] API failed, falling back to browser for %s", self.company_name)
+        
+        # Fallback to browser scraping
+        if all_jobs is None:
+            all_jobs = await self._scrape_via_browser()
+
+        logger.info("  [Workday] Found %s matching jobs (out of %s total)", len(all_jobs), self.listings_read)
+        return all_jobs
+
+    async def _scrape_via_api(self) -> Optional[List[Job]]:
+        """
+        Scrape using the Workday CXS jobs API.
+
+        Returns:
+            Postings matching our keywords, or None if the API failed.
+        """
         all_jobs: List[Job] = []
+        limit = self.API_PAGE_SIZE
+        
+        try:
+            # Only the first page reports the real total; the rest of the
+            # pages are then fetched concurrently
+            first_page = await self._fetch_jobs_page(0, limit)
+            if first_page is None:
+                return None
+            
+            total = min(first_page.get("total", 0), limit * MAX_PAGES_PER_COMPANY)
+            pages = [first_page]
+            pages += await asyncio.gather(
+                *(self._fetch_jobs_page(offset, limit) for offset in range(limit, total, limit))
+            )
+            
+            for data in pages:
+                if not data:
+                    continue
+                for posting in data.get("jobPostings", []):
+                    job = self._job_from_posting(posting)
+                    if job and job.job_url not in self.seen_urls:
+                        self.seen_urls.add(job.job_url)
+                        all_jobs.append(job)
+            
+            logger.info("  [Workday] Got %s postings via API", self.listings_read)
+            return all_jobs
+            
+        except Exception as e:
+            logger.warning("  [Workday] API error: %s", e)
+            return None
 
-        async with async_playwright() as p:
-            self.browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                ]
+    async def _fetch_jobs_page(self, offset: int, limit: int) -> Optional[dict]:
+        """
+        Fetch one page of postings from the CXS API.
+
+        Args:
+            offset: Index of the first posting to return.
+            limit: Page size.
+
+        Returns:
+            The decoded page, or None if the API did not return 200.
+        """
+        payload = {"appliedFacets": {}, "limit": limit, "offset": offset, "searchText": ""}
+        logger.debug("  [Workday] Fetching from API (offset=%s)", offset)
+        
+        # Blocking request runs in a worker thread; the host semaphore caps
+        # how many pages are in flight at once
+        async with host_semaphore(self.api_url):
+            response = await asyncio.to_thread(
+                self._session.post,
+                self.api_url,
+                json=payload,
+                headers=self.API_HEADERS,
+                timeout=30,
             )
+        if response.status_code != 200:
+            logger.warning("  [Workday] API returned %s", response.status_code)
+            return None
+        
+        return parse_json(response.content)
+
+    def _job_from_posting(self, posting: dict, site_prefix: Optional[str] = None) -> Optional[Job]:
+        """
+        Build a Job from one CXS jobPostings entry.
+
+        Args:
+            posting: One jobPostings entry.
+            site_prefix: Base for the posting's externalPath; defaults to the
+                one derived from the career URL.
+
+        Returns:
+            The Job, or None if the posting is incomplete or its title
+            matches none of our keywords.
+        """
+        site_prefix = site_prefix or self.site_prefix
+        title = self.clean_text(posting.get("title", ""))
+        external_path = posting.get("externalPath", "")
+        if not title or not external_path or not site_prefix:
+            return None
+        
+        self.listings_read += 1
+        matched_keywords = self.matches_keywords(title)
+        if not matched_keywords:
+            return None
+        
+        job_url = f"{site_prefix}{external_path}"
+        job_id = self._extract_workday_job_id(job_url) or self.generate_job_id(job_url, title)
+        
+        return Job(
+            job_id=job_id,
+            job_title=title,
+            job_url=job_url,
+            company_name=self.company_name,
+            company_career_url=self.career_url,
+            location=self.clean_text(posting.get("locationsText", "")),
+            keywords_matched=matched_keywords,
+        )
+
+    async def _scrape_via_browser(self) -> List[Job]:
+        """Fallback browser scraping for Workday."""
+        all_jobs: List[Job] = []
 
-            context = await self.browser.new_context(
+        try:
+            async with self.open_page(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            )
-
-            self.page = await context.new_page()
+            ) as page:
+                self.page = page
+                await block_heavy_resources(self.page)
+
+                # The page loads its listings from the CXS jobs endpoint;
+                # keep those responses so each page can be read from JSON
+                jobs_responses: list = []
+                self.page.on(
+                    "response",
+                    lambda response: jobs_responses.append(response)
+                    if self._CXS_JOBS_URL.search(response.url) and response.request.method == "POST"
+                    else None,
+                )
 
-            try:
                 # Navigate to career page
-                await self.page.goto(
-                    self.career_url,
-                    wait_until='networkidle',
-                    timeout=PAGE_LOAD_TIMEOUT_MS,
-                )
-                await asyncio.sleep(2)  # Extra wait for Workday's JS
+                async with host_semaphore(self.career_url):
+                    await self.page.goto(
+                        self.career_url,
+                        wait_until='domcontentloaded',
+                        timeout=PAGE_LOAD_TIMEOUT_MS,
+                    )
+                
+                # Wait for Workday's JS to render the first job links
+                try:
+                    await self.page.wait_for_selector(
+                        self._JOB_LIST_UNION,
+                        state='attached',
+                        timeout=RENDER_WAIT_TIMEOUT_MS,
+                    )
+                except PlaywrightTimeout:
+                    logger.debug("  [Workday] No job links after %sms, continuing", RENDER_WAIT_TIMEOUT_MS)
 
                 # Scrape pages
                 page_count = 0
                 while page_count < MAX_PAGES_PER_COMPANY:
                     page_count += 1
-                    print(f"  [Workday] Scraping page {page_count} for {self.company_name}...")
+                    logger.info("  [Workday] Scraping page %s for %s...", page_count, self.company_name)
 
-                    # Extract jobs from current page
-                    page_jobs = await self._extract_jobs()
-                    all_jobs.extend(page_jobs)
+                    # Extract jobs from the page's XHR data, or its DOM
+                    page_jobs = await self._jobs_from_responses(jobs_responses)
+                    jobs_responses.clear()
+                    if page_jobs is None:
+                        page_jobs = await self._extract_jobs()
 
-                    if not page_jobs:
-                        print(f"  [Workday] No jobs found on page {page_count}")
+                    if page_jobs is None:
+                        logger.info("  [Workday] No jobs found on page %s", page_count)
                         break
 
+                    all_jobs.extend(page_jobs)
+
                     # Try pagination
                     has_more = await self._handle_pagination()
                     if not has_more:
@@ -97,112 +330,128 @@ class WorkdayScraper(BaseScraper):
 
                     await asyncio.sleep(SCRAPE_DELAY_SECONDS)
 
-            except Exception as e:
-                print(f"  [Workday] Error scraping {self.company_name}: {e}")
+        except Exception as e:
+            logger.warning("  [Workday] Error scraping %s: %s", self.company_name, e)
 
-            finally:
-                await self.browser.close()
+        return all_jobs
 
-        # Filter by keywords
-        filtered_jobs = []
-        for job in all_jobs:
-            matched_keywords = self.matches_keywords(job.job_title)
-            if matched_keywords:
-                job.keywords_matched = matched_keywords
-                filtered_jobs.append(job)
+    async def _jobs_from_responses(self, responses: list) -> Optional[List[Job]]:
+        """
+        Build Jobs from intercepted CXS jobs responses.
 
-        print(f"  [Workday] Found {len(filtered_jobs)} matching jobs (out of {len(all_jobs)} total)")
-        return filtered_jobs
+        Args:
+            responses: Playwright Responses for POST .../wday/cxs/{tenant}/{site}/jobs.
 
-    async def _extract_jobs(self) -> List[Job]:
-        """Extract jobs from current Workday page."""
+        Returns:
+            New (not yet seen) matching Jobs, or None if no postings were captured.
+        """
         jobs: List[Job] = []
+        captured = False
 
-        for selector in self.JOB_LIST_SELECTORS:
+        for response in responses:
             try:
-                elements = await self.page.query_selector_all(selector)
-                if not elements:
-                    continue
+                data = await response.json()
+            except Exception:
+                continue
 
-                for element in elements:
-                    job = await self._parse_workday_job(element)
-                    if job and job.job_url not in self.seen_urls:
-                        self.seen_urls.add(job.job_url)
-                        jobs.append(job)
+            # externalPaths are relative to /{site} on the host that served them
+            match = self._CXS_JOBS_URL.search(response.url)
+            site_prefix = self._site_prefix(match.group(1), match.group(2))
 
-                if jobs:
-                    break  # Found jobs with this selector
+            for posting in data.get("jobPostings", []):
+                captured = True
+                job = self._job_from_posting(posting, site_prefix)
+                if job and job.job_url not in self.seen_urls:
+                    self.seen_urls.add(job.job_url)
+                    jobs.append(job)
 
-            except Exception as e:
-                print(f"    Selector {selector} error: {e}")
-                continue
+        return jobs if captured else None
 
-        return jobs
+    async def _extract_jobs(self) -> Optional[List[Job]]:
+        """
+        Extract jobs from current Workday page.
 
-    async def _parse_workday_job(self, element) -> Optional[Job]:
-        """Parse a Workday job element."""
+        Returns:
+            New (not yet seen) matching Jobs from the first selector that finds
+            listings, or None if no selector finds any.
+        """
         try:
-            # Get href - might be on element or child
-            href = await element.get_attribute('href')
-            if not href:
-                link = await element.query_selector('a')
-                if link:
-                    href = await link.get_attribute('href')
-
-            if not href:
-                return None
+            results = await self.page.evaluate(_JOB_ROWS_BY_SELECTOR_JS, self.JOB_LIST_SELECTORS)
+        except Exception as e:
+            logger.debug("    Job list extraction error: %s", e)
+            return None
 
-            job_url = self.normalize_url(href)
+        for rows in results:
+            read_before = self.listings_read
+            jobs: List[Job] = []
+            for row in rows:
+                job = self._parse_workday_job(*row)
+                if job and job.job_url not in self.seen_urls:
+                    self.seen_urls.add(job.job_url)
+                    jobs.append(job)
 
-            # Get title
-            title = await element.text_content()
-            title = self.clean_text(title) if title else ""
+            if self.listings_read > read_before:
+                return jobs  # Found listings with this selector
 
-            if not title or len(title) < 3:
-                return None
+        return None
 
-            # Try to get location from nearby element
-            location = await self._get_workday_location(element)
+    def _parse_workday_job(
+        self,
+        href: Optional[str],
+        title: Optional[str],
+        location: Optional[str],
+    ) -> Optional[Job]:
+        """
+        Parse one row read by _JOB_ROWS_BY_SELECTOR_JS.
+
+        Returns:
+            The Job, or None if the row isn't a job link or its title matches
+            none of our keywords.
+        """
+        if not href:
+            return None
 
-            # Extract job ID from URL if possible
-            job_id = self._extract_workday_job_id(job_url) or self.generate_job_id(job_url, title)
+        # Get title
+        title = self.clean_text(title) if title else ""
 
-            return Job(
-                job_id=job_id,
-                job_title=title,
-                job_url=job_url,
-                company_name=self.company_name,
-                company_career_url=self.career_url,
-                location=location,
-            )
+        if not title or len(title) < 3:
+            return None
 
-        except Exception:
+        # Skip non-matching titles before building the URL and Job
+        self.listings_read += 1
+        matched_keywords = self.matches_keywords(title)
+        if not matched_keywords:
             return None
 
-    async def _get_workday_location(self, element) -> str:
-        """Extract location from Workday job listing."""
-        try:
-            # Look for location in sibling/parent elements
-            parent = await element.evaluate_handle('el => el.closest("li, article, div[data-automation-id]")')
-            if parent:
-                location_el = await parent.query_selector('[data-automation-id="locationText"], [class*="location"]')
-                if location_el:
-                    text = await location_el.text_content()
-                    return self.clean_text(text) if text else ""
-        except Exception:
-            pass
-        return ""
+        job_url = self.normalize_url(href)
+
+        # Extract job ID from URL if possible
+        job_id = self._extract_workday_job_id(job_url) or self.generate_job_id(job_url, title)
+
+        return Job(
+            job_id=job_id,
+            job_title=title,
+            job_url=job_url,
+            company_name=self.company_name,
+            company_career_url=self.career_url,
+            location=self.clean_text(location) if location else "",
+            keywords_matched=matched_keywords,
+        )
 
     def _extract_workday_job_id(self, url: str) -> Optional[str]:
-        """Extract Workday job ID from URL."""
-        # Workday URLs often have job ID in path or query
-        patterns = [
-            r'/job/([A-Za-z0-9_-]+)',
-            r'jobPostingId=([A-Za-z0-9_-]+)',
-            r'R-(\d+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        """
+        Extract Workday job ID from URL.
+
+        The API, intercepted-XHR and DOM paths all derive the ID here from the
+        posting URL, so a posting gets the same ID whichever path found it.
+        """
+        match = self._JOB_SLUG_PATTERN.search(url)
+        if match:
+            # Posting slugs end in _<requisition id>, e.g. _JR12345 or _R-00123-1
+            return f"WD_{match.group(1).rsplit('_', 1)[-1]}"
+
+        for pattern in self._JOB_ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return f"WD_{match.group(1)}"
         return None
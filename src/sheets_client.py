@@ -2,23 +2,129 @@
 Google Sheets API client for reading company URLs and writing job listings.
 Includes retry logic with exponential backoff for reliability.
 """
+import csv
 import json
+import logging
 import os
+import random
+import re
 import time
 import ssl
-from datetime import datetime
-from typing import List, Dict, Any, Optional, Callable
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Callable, Tuple
 
+import httplib2
+import requests
+from google.auth.exceptions import TransportError
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+from requests.adapters import HTTPAdapter
 
 from config import (
     COMPANIES_SHEET_ID,
     JOBS_SHEET_ID,
     COMPANIES_SHEET_NAME,
     JOBS_SHEET_NAME,
+    JOBS_SNAPSHOT_DIR,
 )
+from scraper.base_scraper import Job
+from utils.http_session import parse_json
+
+logger = logging.getLogger(__name__)
+
+# First row number of an A1 range such as "Jobs!A120:K180"
+_RANGE_START_ROW = re.compile(r'![A-Z]+(\d+)')
+
+# Partial-response mask for values.get: only the cell values, without the
+# range/majorDimension envelope
+VALUES_ONLY = "values"
+
+# Rows of a local job-ID snapshot re-read to check it still matches the sheet
+SNAPSHOT_SAMPLE_ROWS = 8
+
+
+def utc_now() -> datetime:
+    """Current UTC time, naive so isoformat() keeps the sheet's timestamp format."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Timeout for each Sheets API request (googleapiclient's default)
+SHEETS_TIMEOUT_SECONDS = 60
+
+
+class SessionHttp:
+    """
+    httplib2.Http stand-in that sends googleapiclient requests through one
+    google-auth AuthorizedSession.
+
+    The session keeps a pool of TCP/TLS connections to sheets.googleapis.com
+    that every call reuses, and unlike httplib2 it is safe to use from the
+    worker thread that writes batches. Credentials are refreshed by the
+    session itself.
+    """
+
+    def __init__(self, credentials, timeout: float = SHEETS_TIMEOUT_SECONDS):
+        self.credentials = credentials
+        self.timeout = timeout
+        self.session = AuthorizedSession(credentials)
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        """Send one request, returning (httplib2.Response, content) like httplib2.Http."""
+        response = self.session.request(method, uri, data=body, headers=headers, timeout=self.timeout)
+        resp = httplib2.Response({"status": response.status_code, **response.headers})
+        resp.reason = response.reason
+        return resp, response.content
+
+    def close(self):
+        """Close the session's pooled connections."""
+        self.session.close()
+
+
+class FastJsonModel(JsonModel):
+    """
+    googleapiclient JsonModel that decodes responses with parse_json.
+
+    Column reads return multi-MB JSON bodies. orjson (when installed) decodes
+    them several times faster than the stdlib json module the default model
+    uses.
+    """
+
+    def deserialize(self, content):
+        try:
+            body = parse_json(content)
+        except ValueError:
+            return super().deserialize(content)  # Non-JSON body, handled as before
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+# Network-level failures worth retrying: TLS errors (EOF, bad record),
+# dropped/reset connections, timeouts, and their requests/google-auth
+# wrappers (SessionHttp sends requests through requests)
+_RETRYABLE_ERRORS = (
+    ssl.SSLError,
+    ConnectionError,
+    TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    TransportError,
+)
+
+
+def _retry_after_seconds(error: HttpError) -> Optional[float]:
+    """Seconds from a response's Retry-After header, or None if absent/not numeric."""
+    resp = getattr(error, "resp", None)
+    value = resp.get("retry-after") if resp is not None else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None  # HTTP-date form; fall back to the computed delay
 
 
 def retry_with_backoff(
@@ -29,43 +135,43 @@ def retry_with_backoff(
 ):
     """
     Execute a function with exponential backoff retry logic.
+
+    Waits a random time up to the exponential delay ("full jitter"), so
+    clients throttled together don't retry in lockstep. A Retry-After header
+    on a 429/5xx response is honored instead, up to max_delay.
     
     Handles common transient errors:
     - SSL/TLS errors (EOF, connection reset)
     - HTTP 5xx errors
     - Rate limiting (429)
-    - Connection errors
+    - Connection errors and timeouts
+    Anything else is raised immediately.
     """
     last_exception = None
     
     for attempt in range(max_retries):
+        retry_after = None
         try:
             return func()
-        except ssl.SSLError as e:
-            last_exception = e
-            print(f"  SSL error on attempt {attempt + 1}/{max_retries}: {e}")
         except HttpError as e:
             last_exception = e
             status = e.resp.status if hasattr(e, 'resp') else 0
             # Retry on 5xx errors and rate limiting
             if status >= 500 or status == 429:
-                print(f"  HTTP {status} error on attempt {attempt + 1}/{max_retries}")
+                logger.warning("  HTTP %s error on attempt %s/%s", status, attempt + 1, max_retries)
+                retry_after = _retry_after_seconds(e)
             else:
                 raise  # Don't retry client errors
-        except (ConnectionError, ConnectionResetError, BrokenPipeError) as e:
+        except _RETRYABLE_ERRORS as e:
             last_exception = e
-            print(f"  Connection error on attempt {attempt + 1}/{max_retries}: {e}")
-        except Exception as e:
-            # Check for SSL-related errors in the message
-            if 'EOF' in str(e) or 'ssl' in str(e).lower() or 'connection' in str(e).lower():
-                last_exception = e
-                print(f"  Transient error on attempt {attempt + 1}/{max_retries}: {e}")
-            else:
-                raise  # Don't retry unknown errors
+            logger.warning("  Transient error on attempt %s/%s: %s", attempt + 1, max_retries, e)
         
         if attempt < max_retries - 1:
-            delay = min(base_delay * (2 ** attempt), max_delay)
-            print(f"  Retrying in {delay:.1f}s...")
+            if retry_after is not None:
+                delay = min(retry_after, max_delay)
+            else:
+                delay = random.uniform(0, min(base_delay * (2 ** attempt), max_delay))
+            logger.warning("  Retrying in %.1fs...", delay)
             time.sleep(delay)
     
     raise last_exception
@@ -75,7 +181,8 @@ class SheetsClient:
     """Client for interacting with Google Sheets API with retry logic."""
 
     SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
-    BATCH_SIZE = 100  # Max rows per API call
+    # Approximate request body size per values.append; larger appends are split
+    APPEND_MAX_BYTES = 2_000_000
 
     def __init__(self, credentials_path: Optional[str] = None):
         """
@@ -86,8 +193,195 @@ class SheetsClient:
                              If None, uses GOOGLE_CREDENTIALS env var.
         """
         self.credentials = self._load_credentials(credentials_path)
-        self.service = build("sheets", "v4", credentials=self.credentials)
+        self.http = SessionHttp(self.credentials)
+        self.service = build("sheets", "v4", http=self.http, model=FastJsonModel())
         self.sheets = self.service.spreadsheets()
+        # Per jobs sheet: job_id -> row numbers, read from column A once per run
+        self._job_rows_cache: Dict[str, Dict[str, List[int]]] = {}
+        # Per jobs sheet: company names with jobs, read from column C once per run
+        self._scraped_companies_cache: Dict[str, set] = {}
+        # Per companies sheet: company name -> 1-indexed row, read once per run
+        self._company_rows_cache: Dict[str, Dict[str, int]] = {}
+        # Per jobs sheet: stored job rows (columns A:F), read once per run
+        self._job_table_cache: Dict[str, List[List[str]]] = {}
+
+    def close(self):
+        """Close the API connections; the client can't be used afterwards."""
+        self.service.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb):
+        self.close()
+
+    def invalidate_cache(self):
+        """Forget cached job rows, e.g. after rows were deleted outside this client."""
+        for sheet_id in self._job_rows_cache:
+            try:
+                os.remove(self._snapshot_path(sheet_id))
+            except OSError:
+                pass
+        self._job_rows_cache.clear()
+        self._scraped_companies_cache.clear()
+        self._company_rows_cache.clear()
+        self._job_table_cache.clear()
+
+    @staticmethod
+    def _snapshot_path(sheet_id: str) -> str:
+        """Path of the local job-ID column snapshot for a jobs sheet."""
+        return os.path.join(JOBS_SNAPSHOT_DIR, f"{sheet_id}_job_ids.csv")
+
+    def _read_job_id_column(self, sheet_id: str) -> List[str]:
+        """
+        Read column A of the jobs sheet (header excluded), one entry per row.
+
+        The jobs sheet is append-only, so a local snapshot from the previous
+        run is reused: only the rows after it are fetched. The same batchGet
+        re-reads the snapshot's last row and SNAPSHOT_SAMPLE_ROWS rows spread
+        across it; if any differs (rows deleted, inserted or sorted), the
+        whole column is read again, since the row numbers are later used to
+        write last_seen.
+
+        Returns:
+            Column A values for rows 2..N ("" for blank rows).
+        """
+        snapshot: List[str] = []
+        try:
+            with open(self._snapshot_path(sheet_id), newline="") as f:
+                snapshot = [row[0] if row else "" for row in csv.reader(f)]
+        except OSError:
+            pass
+
+        def _fetch():
+            return self.sheets.values().get(
+                spreadsheetId=sheet_id,
+                range=f"{JOBS_SHEET_NAME}!A2:A",
+                fields=VALUES_ONLY,
+            ).execute().get("values", [])
+
+        column = None
+        if snapshot:
+            column = self._extend_snapshot(sheet_id, snapshot)
+            if column is None:
+                logger.info("Jobs sheet changed since the last snapshot, re-reading job IDs")
+
+        if column is None:
+            values = retry_with_backoff(_fetch)
+            column = [row[0] if row else "" for row in values]
+
+        try:
+            os.makedirs(JOBS_SNAPSHOT_DIR, exist_ok=True)
+            with open(self._snapshot_path(sheet_id), "w", newline="") as f:
+                csv.writer(f).writerows([job_id] for job_id in column)
+        except OSError as e:
+            logger.debug("Could not write jobs snapshot: %s", e)
+
+        return column
+
+    def _extend_snapshot(self, sheet_id: str, snapshot: List[str]) -> Optional[List[str]]:
+        """
+        Check a job-ID snapshot against the sheet and append the rows added since.
+
+        Returns:
+            The full column A, or None if the sheet no longer matches the snapshot.
+        """
+        step = max(1, len(snapshot) // SNAPSHOT_SAMPLE_ROWS)
+        sampled = list(range(0, len(snapshot) - 1, step))[:SNAPSHOT_SAMPLE_ROWS]
+        # Snapshot index i is sheet row i + 2; the last range starts at the snapshot's last row
+        ranges = [f"{JOBS_SHEET_NAME}!A{i + 2}" for i in sampled]
+        ranges.append(f"{JOBS_SHEET_NAME}!A{len(snapshot) + 1}:A")
+
+        def _fetch():
+            return self.sheets.values().batchGet(
+                spreadsheetId=sheet_id,
+                ranges=ranges,
+                fields="valueRanges(values)",
+            ).execute().get("valueRanges", [])
+
+        value_ranges = retry_with_backoff(_fetch)
+        if len(value_ranges) != len(ranges):
+            return None
+        columns = [[row[0] if row else "" for row in vr.get("values", [])] for vr in value_ranges]
+
+        for i, cells in zip(sampled, columns):
+            if (cells[0] if cells else "") != snapshot[i]:
+                return None
+
+        tail = columns[-1]
+        if not tail or tail[0] != snapshot[-1]:
+            return None
+        return snapshot + tail[1:]
+
+    def _get_job_rows(self, sheet_id: str) -> Dict[str, List[int]]:
+        """
+        Get the row numbers of every job ID in the jobs sheet.
+
+        Column A is read on first use (see _read_job_id_column) and then kept
+        up to date by append_jobs, so later lookups don't re-read it.
+
+        Returns:
+            Dict of job_id -> 1-indexed row numbers (header excluded).
+        """
+        job_rows = self._job_rows_cache.get(sheet_id)
+        if job_rows is not None:
+            return job_rows
+
+        job_rows = {}
+        for i, job_id in enumerate(self._read_job_id_column(sheet_id), start=2):  # Skip header, 1-indexed
+            if job_id:
+                job_rows.setdefault(job_id, []).append(i)
+
+        self._job_rows_cache[sheet_id] = job_rows
+        return job_rows
+
+    def _record_appended_rows(self, sheet_id: str, result: Dict[str, Any], job_ids: List[str]):
+        """Add freshly appended job IDs to the row cache, using the range the API reports."""
+        job_rows = self._job_rows_cache.get(sheet_id)
+        if job_rows is None:
+            return
+
+        updated_range = result.get("updates", {}).get("updatedRange", "")
+        match = _RANGE_START_ROW.search(updated_range)
+        if not match:
+            # Row positions unknown; re-read column A on next use
+            del self._job_rows_cache[sheet_id]
+            return
+
+        for row_number, job_id in enumerate(job_ids, start=int(match.group(1))):
+            job_rows.setdefault(job_id, []).append(row_number)
+
+    @staticmethod
+    def _company_rows(values: List[List[str]]) -> Dict[str, int]:
+        """Map company name -> 1-indexed row (first occurrence) from column A values."""
+        company_rows: Dict[str, int] = {}
+        for i, row in enumerate(values, start=1):
+            if row and row[0]:
+                company_rows.setdefault(row[0], i)
+        return company_rows
+
+    def _get_company_rows(self, sheet_id: str) -> Dict[str, int]:
+        """
+        Get the row number of every company in the companies sheet.
+
+        Filled by get_companies, or read from column A on first use.
+        """
+        company_rows = self._company_rows_cache.get(sheet_id)
+        if company_rows is None:
+            result = self.sheets.values().get(
+                spreadsheetId=sheet_id,
+                range=f"{COMPANIES_SHEET_NAME}!A:A",
+                fields=VALUES_ONLY,
+            ).execute()
+            company_rows = self._company_rows(result.get("values", []))
+            self._company_rows_cache[sheet_id] = company_rows
+        return company_rows
+
+    def _record_scraped_companies(self, sheet_id: str, company_names: set):
+        """Add companies that just had jobs appended to the scraped-companies cache."""
+        companies = self._scraped_companies_cache.get(sheet_id)
+        if companies is not None:
+            companies.update(name for name in company_names if name)
 
     def _load_credentials(self, credentials_path: Optional[str] = None):
         """Load Google credentials from file or environment variable."""
@@ -123,6 +417,7 @@ class SheetsClient:
             result = self.sheets.values().get(
                 spreadsheetId=sheet_id,
                 range=f"{COMPANIES_SHEET_NAME}!A:E",
+                fields=VALUES_ONLY,
             ).execute()
             return result
 
@@ -132,6 +427,9 @@ class SheetsClient:
             if not values:
                 return []
 
+            # Remember each company's row for update_company_status
+            self._company_rows_cache[sheet_id] = self._company_rows(values)
+
             # Skip header row
             companies = []
             for row in values[1:]:
@@ -147,7 +445,7 @@ class SheetsClient:
             return companies
 
         except Exception as e:
-            print(f"Error fetching companies: {e}")
+            logger.error("Error fetching companies: %s", e)
             raise
 
     def get_existing_job_ids(self, sheet_id: Optional[str] = None) -> set:
@@ -161,21 +459,11 @@ class SheetsClient:
         if not sheet_id:
             raise ValueError("JOBS_SHEET_ID not configured")
 
-        def _fetch():
-            result = self.sheets.values().get(
-                spreadsheetId=sheet_id,
-                range=f"{JOBS_SHEET_NAME}!A:A",
-            ).execute()
-            return result
-
         try:
-            result = retry_with_backoff(_fetch)
-            values = result.get("values", [])
-            # Skip header, extract job IDs
-            return {row[0] for row in values[1:] if row}
+            return set(self._get_job_rows(sheet_id))
 
         except Exception as e:
-            print(f"Error fetching existing jobs: {e}")
+            logger.error("Error fetching existing jobs: %s", e)
             raise
 
     def get_scraped_companies(self, sheet_id: Optional[str] = None) -> set:
@@ -183,6 +471,9 @@ class SheetsClient:
         Get the set of company names that already have jobs in the sheet.
         Used to determine if a company is being scraped for the first time.
 
+        Column C is read on first use and then kept up to date by the append
+        methods, so later calls don't re-read it.
+
         Returns:
             Set of company names that have at least one job in the sheet.
         """
@@ -190,75 +481,118 @@ class SheetsClient:
         if not sheet_id:
             return set()
 
+        companies = self._scraped_companies_cache.get(sheet_id)
+        if companies is not None:
+            return set(companies)
+
         def _fetch():
             result = self.sheets.values().get(
                 spreadsheetId=sheet_id,
-                range=f"{JOBS_SHEET_NAME}!C:C",  # Company name column
+                range=f"{JOBS_SHEET_NAME}!C2:C",  # Company name column, header skipped
+                fields=VALUES_ONLY,
             ).execute()
             return result
 
         try:
             result = retry_with_backoff(_fetch)
             values = result.get("values", [])
-            # Skip header, extract company names, ignore separator rows
-            companies = set()
-            for row in values[1:]:
-                if row and row[0] and not row[0].startswith("==="):
-                    companies.add(row[0])
-            return companies
+            # Extract company names, ignore separator rows
+            companies = {
+                row[0] for row in values
+                if row and row[0] and row[0][:3] != "==="
+            }
+            self._scraped_companies_cache[sheet_id] = companies
+            return set(companies)
 
         except Exception as e:
-            print(f"Warning: Could not fetch scraped companies: {e}")
+            logger.warning("Could not fetch scraped companies: %s", e)
             return set()
 
 
-    def append_jobs(
-        self, 
-        jobs: List[Dict[str, Any]], 
-        sheet_id: Optional[str] = None,
-        is_initial_load: bool = False,
-        company_name: str = "",
-    ) -> int:
+    def _get_job_table(self, sheet_id: str) -> List[List[str]]:
         """
-        Append new jobs to the jobs sheet in batches with retry logic.
-        Adds a timestamp separator row before the jobs for easy identification.
+        Read columns A:F of the jobs sheet (header excluded) once per run.
 
-        Args:
-            jobs: List of job dicts with keys matching sheet columns.
-            sheet_id: Optional sheet ID override.
-            is_initial_load: True if this is the first scrape for a company.
-            company_name: Company name for initial load separator.
+        Returns:
+            One row per job, padded to six columns; separator and blank rows
+            are dropped. Empty if the read fails.
+        """
+        rows = self._job_table_cache.get(sheet_id)
+        if rows is not None:
+            return rows
+
+        def _fetch():
+            return self.sheets.values().get(
+                spreadsheetId=sheet_id,
+                range=f"{JOBS_SHEET_NAME}!A2:F",  # ID through location, header skipped
+                fields=VALUES_ONLY,
+            ).execute()
+
+        try:
+            values = retry_with_backoff(_fetch).get("values", [])
+        except Exception as e:
+            logger.warning("Could not fetch existing job rows: %s", e)
+            return []
+
+        rows = []
+        for row in values:
+            # A id, B title, C company, D job URL, E career URL, F location (trailing blanks are omitted)
+            row = row + [""] * (6 - len(row))
+            if row[1] and row[2]:
+                rows.append(row)
+        self._job_table_cache[sheet_id] = rows
+        return rows
+
+    def get_existing_job_contents(self, sheet_id: Optional[str] = None) -> List[Tuple[str, str, str, str]]:
+        """
+        Get the company, title, location and career URL of every job in the sheet.
+        Used to seed near-duplicate detection with the jobs stored by earlier runs.
 
         Returns:
-            Number of jobs appended.
+            List of (company_name, job_title, location, company_career_url),
+            separator rows excluded.
         """
         sheet_id = sheet_id or JOBS_SHEET_ID
         if not sheet_id:
-            raise ValueError("JOBS_SHEET_ID not configured")
+            return []
+        return [(row[2], row[1], row[5], row[4]) for row in self._get_job_table(sheet_id)]
 
-        if not jobs:
-            return 0
+    def get_job_ids_by_url(self, prefix: str, sheet_id: Optional[str] = None) -> Dict[str, str]:
+        """
+        Map job URL -> stored job ID for the jobs whose ID starts with prefix.
+        Used to keep rows written under an older job ID scheme matched to
+        their postings.
 
-        now = datetime.utcnow()
-        now_str = now.isoformat()
-        
+        Returns:
+            Dict of job_url -> job_id.
+        """
+        sheet_id = sheet_id or JOBS_SHEET_ID
+        if not sheet_id:
+            return {}
+        return {
+            row[3]: row[0] for row in self._get_job_table(sheet_id)
+            if row[3] and row[0].startswith(prefix)
+        }
+
+    @staticmethod
+    def _separator_row(now: datetime, job_count: int, is_initial_load: bool, company_name: str) -> List[str]:
+        """Build the timestamp separator row written above each group of new jobs."""
         # Calculate quarter time range (6-hour blocks)
         hour = now.hour
         quarter_start = (hour // 6) * 6
         quarter_end = quarter_start + 6
         quarter_name = f"Q{(hour // 6) + 1}"  # Q1, Q2, Q3, Q4
         
-        # Create timestamp separator row
         # Using '---' prefix instead of '===' to avoid Google Sheets formula error
         # Different text for initial load vs new jobs
         if is_initial_load:
-            separator_text = f"--- INITIAL LOAD: {company_name} | {len(jobs)} existing roles | {now.strftime('%b %d, %Y')} {quarter_start:02d}:00-{quarter_end:02d}:00 UTC ({quarter_name}) ---"
+            separator_text = f"--- INITIAL LOAD: {company_name} | {job_count} existing roles | {now.strftime('%b %d, %Y')} {quarter_start:02d}:00-{quarter_end:02d}:00 UTC ({quarter_name}) ---"
             status_marker = "initial_load"
         else:
-            separator_text = f"--- NEW JOBS {quarter_name}: {now.strftime('%b %d, %Y')} {quarter_start:02d}:00-{quarter_end:02d}:00 UTC | {len(jobs)} new postings ---"
+            separator_text = f"--- NEW JOBS {quarter_name}: {now.strftime('%b %d, %Y')} {quarter_start:02d}:00-{quarter_end:02d}:00 UTC | {job_count} new postings ---"
             status_marker = "separator"
         
-        separator_row = [[
+        return [
             separator_text,  # job_id column - visible marker
             "",  # job_title
             "",  # company_name
@@ -266,53 +600,130 @@ class SheetsClient:
             "",  # career_url
             "",  # location
             "",  # posted_date
-            now_str,  # date_added
+            now.isoformat(),  # date_added
             "",  # last_seen
             "",  # keywords
             status_marker,  # status - marks this as a separator row
-        ]]
+        ]
+
+    @staticmethod
+    def _job_row(job: Job, now_str: str) -> List[str]:
+        """Build the sheet row (columns A:K) for one Job."""
+        return [
+            job.job_id,
+            job.job_title,
+            job.company_name,
+            job.job_url,
+            job.company_career_url,
+            job.location,
+            job.posted_date or "Not Available",  # posted_date
+            now_str,  # date_added
+            now_str,  # last_seen
+            ", ".join(job.keywords_matched),
+            "active",
+        ]
+
+    def append_jobs(
+        self, 
+        jobs: List[Job], 
+        sheet_id: Optional[str] = None,
+        is_initial_load: bool = False,
+        company_name: str = "",
+        now: Optional[datetime] = None,
+    ) -> int:
+        """
+        Append new jobs to the jobs sheet with retry logic.
+        Adds a timestamp separator row before the jobs for easy identification.
+
+        Args:
+            jobs: Jobs to append.
+            sheet_id: Optional sheet ID override.
+            is_initial_load: True if this is the first scrape for a company.
+            company_name: Company name for initial load separator.
+            now: Timestamp for date_added/last_seen; defaults to the current time.
+
+        Returns:
+            Number of jobs appended.
+        """
+        sheet_id = sheet_id or JOBS_SHEET_ID
+        if not sheet_id:
+            raise ValueError("JOBS_SHEET_ID not configured")
+
+        if not jobs:
+            return 0
+
+        now = now or utc_now()
+        separator_row = self._separator_row(now, len(jobs), is_initial_load, company_name)
+        logger.info("    Adding timestamp separator: %s", separator_row[0])
+
+        # Separator and jobs go out together, in as few appends as possible
+        now_str = now.isoformat()
+        rows = [separator_row] + [self._job_row(job, now_str) for job in jobs]
+        total_appended = self._append_rows(sheet_id, rows)
+
+        self._record_scraped_companies(sheet_id, {job.company_name for job in jobs})
+        return max(total_appended - 1, 0)  # Jobs only, not the separator
+
+    def append_jobs_bulk(
+        self,
+        jobs_by_company: Dict[str, List[Job]],
+        initial_load_companies: Optional[set] = None,
+        sheet_id: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> int:
+        """
+        Append new jobs for several companies with as few API calls as possible.
+
+        Writes the same layout as calling append_jobs once per company (a
+        separator row followed by that company's jobs), but packs all the
+        rows into a single append (split only for very large bodies) instead
+        of one call per company.
+
+        Args:
+            jobs_by_company: Company name -> list of new Jobs.
+            initial_load_companies: Companies being scraped for the first time.
+            sheet_id: Optional sheet ID override.
+            now: Timestamp for date_added/last_seen; defaults to the current time.
+
+        Returns:
+            Number of rows appended, separators included.
+        """
+        sheet_id = sheet_id or JOBS_SHEET_ID
+        if not sheet_id:
+            raise ValueError("JOBS_SHEET_ID not configured")
+
+        initial_load_companies = initial_load_companies or set()
+        now = now or utc_now()
+        now_str = now.isoformat()
 
-        # Convert jobs to rows
         rows = []
-        for job in jobs:
-            posted_date = job.get("posted_date", "")
-            rows.append([
-                job.get("job_id", ""),
-                job.get("job_title", ""),
-                job.get("company_name", ""),
-                job.get("job_url", ""),
-                job.get("company_career_url", ""),
-                job.get("location", ""),
-                posted_date if posted_date else "Not Available",  # posted_date
-                now_str,  # date_added
-                now_str,  # last_seen
-                ", ".join(job.get("keywords_matched", [])),
-                "active",
-            ])
-
-        # First, append the separator row
-        def _append_separator():
-            result = self.sheets.values().append(
-                spreadsheetId=sheet_id,
-                range=f"{JOBS_SHEET_NAME}!A:K",
-                valueInputOption="USER_ENTERED",
-                insertDataOption="INSERT_ROWS",
-                body={"values": separator_row},
-            ).execute()
-            return result
-        
-        try:
-            retry_with_backoff(_append_separator)
-            print(f"    Added timestamp separator: {separator_text}")
-        except Exception as e:
-            print(f"    Warning: Could not add separator row: {e}")
+        companies_written = {company_name for company_name, jobs in jobs_by_company.items() if jobs}
+        for company_name, jobs in jobs_by_company.items():
+            if not jobs:
+                continue
+            rows.append(self._separator_row(
+                now, len(jobs), company_name in initial_load_companies, company_name,
+            ))
+            rows.extend(self._job_row(job, now_str) for job in jobs)
+
+        total_appended = self._append_rows(sheet_id, rows)
+
+        self._record_scraped_companies(sheet_id, companies_written)
+        return total_appended
+
+    def _append_rows(self, sheet_id: str, rows: List[List[str]]) -> int:
+        """
+        Append rows to the jobs sheet in as few values.append calls as possible.
 
+        Rows are only split when a request body would exceed APPEND_MAX_BYTES.
+        A chunk that still fails after retries is logged and skipped.
+
+        Returns:
+            Number of rows appended.
+        """
         total_appended = 0
-        
-        # Process jobs in batches to avoid timeouts
-        for i in range(0, len(rows), self.BATCH_SIZE):
-            batch = rows[i:i + self.BATCH_SIZE]
-            
+
+        for batch_num, batch in enumerate(self._chunk_rows(rows), start=1):
             def _append_batch():
                 result = self.sheets.values().append(
                     spreadsheetId=sheet_id,
@@ -325,93 +736,127 @@ class SheetsClient:
 
             try:
                 result = retry_with_backoff(_append_batch)
-                updates = result.get("updates", {})
-                batch_count = updates.get("updatedRows", 0)
+                self._record_appended_rows(sheet_id, result, [row[0] for row in batch])
+                batch_count = result.get("updates", {}).get("updatedRows", 0)
                 total_appended += batch_count
-                print(f"    Wrote batch {i // self.BATCH_SIZE + 1}: {batch_count} jobs")
+                logger.info("    Wrote batch %s: %s rows", batch_num, batch_count)
             except Exception as e:
-                print(f"    Error writing batch {i // self.BATCH_SIZE + 1}: {e}")
+                logger.error("    Error writing batch %s: %s", batch_num, e)
                 # Continue with next batch even if this one fails
                 continue
 
         return total_appended
 
+    @classmethod
+    def _chunk_rows(cls, rows: List[List[str]]):
+        """Split rows into chunks whose JSON body stays under APPEND_MAX_BYTES (approximately)."""
+        chunk: List[List[str]] = []
+        size = 0
+        for row in rows:
+            # Cell text plus quotes and separators
+            row_size = sum(len(cell) for cell in row) + 3 * len(row) + 2
+            if chunk and size + row_size > cls.APPEND_MAX_BYTES:
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(row)
+            size += row_size
+        if chunk:
+            yield chunk
+
     def update_company_status(
         self,
         company_name: str,
         status: str,
         sheet_id: Optional[str] = None,
+        now: Optional[datetime] = None,
     ):
-        """Update the status and last_scraped time for a company."""
+        """Update the status and last_scraped time (now, default current time) for a company."""
+        self.update_company_statuses([(company_name, status)], sheet_id=sheet_id, now=now)
+
+    def update_company_statuses(
+        self,
+        statuses: List[tuple],
+        sheet_id: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ):
+        """
+        Update the status and last_scraped time for several companies in one call.
+
+        Args:
+            statuses: (company_name, status) pairs.
+            sheet_id: Optional sheet ID override.
+            now: Timestamp for last_scraped; defaults to the current time.
+        """
         sheet_id = sheet_id or COMPANIES_SHEET_ID
-        if not sheet_id:
+        if not sheet_id or not statuses:
             return
+        now_str = (now or utc_now()).isoformat()
 
         def _update():
-            # First, find the row for this company
-            result = self.sheets.values().get(
-                spreadsheetId=sheet_id,
-                range=f"{COMPANIES_SHEET_NAME}!A:A",
-            ).execute()
+            # Row numbers come from the cached company column
+            company_rows = self._get_company_rows(sheet_id)
+
+            value_ranges = []
+            for company_name, status in statuses:
+                row_index = company_rows.get(company_name)
+                if row_index:
+                    value_ranges.append({
+                        "range": f"{COMPANIES_SHEET_NAME}!D{row_index}:E{row_index}",
+                        "values": [[now_str, status]],
+                    })
 
-            values = result.get("values", [])
-            row_index = None
-            for i, row in enumerate(values):
-                if row and row[0] == company_name:
-                    row_index = i + 1  # 1-indexed
-                    break
-
-            if row_index:
-                now = datetime.utcnow().isoformat()
-                self.sheets.values().update(
+            if value_ranges:
+                self.sheets.values().batchUpdate(
                     spreadsheetId=sheet_id,
-                    range=f"{COMPANIES_SHEET_NAME}!D{row_index}:E{row_index}",
-                    valueInputOption="USER_ENTERED",
-                    body={"values": [[now, status]]},
+                    body={
+                        "valueInputOption": "USER_ENTERED",
+                        "data": value_ranges,
+                    },
                 ).execute()
 
         try:
             retry_with_backoff(_update)
         except Exception as e:
-            print(f"Error updating company status: {e}")
+            logger.error("Error updating company status: %s", e)
 
     def update_job_last_seen(
-        self, job_ids: List[str], sheet_id: Optional[str] = None
+        self, job_ids: List[str], sheet_id: Optional[str] = None, now: Optional[datetime] = None
     ):
-        """Update the last_seen timestamp for existing jobs."""
+        """Update the last_seen timestamp (now, default current time) for existing jobs."""
         sheet_id = sheet_id or JOBS_SHEET_ID
         if not sheet_id or not job_ids:
             return
+        now_str = (now or utc_now()).isoformat()
 
         def _update():
-            # Get all job IDs with their row numbers
-            result = self.sheets.values().get(
-                spreadsheetId=sheet_id,
-                range=f"{JOBS_SHEET_NAME}!A:A",
-            ).execute()
-
-            values = result.get("values", [])
-            now = datetime.utcnow().isoformat()
-
-            # Build batch update
-            requests = []
-            for i, row in enumerate(values[1:], start=2):  # Skip header, 1-indexed
-                if row and row[0] in job_ids:
-                    requests.append({
-                        "range": f"{JOBS_SHEET_NAME}!H{i}",
-                        "values": [[now]],
+            # Row numbers come from the cached column A
+            job_rows = self._get_job_rows(sheet_id)
+
+            rows = sorted({i for job_id in job_ids for i in job_rows.get(job_id, ())})
+
+            # Build batch update, one range per run of consecutive rows
+            # (last_seen is column I)
+            value_ranges = []
+            run_start = 0
+            for k in range(1, len(rows) + 1):
+                if k == len(rows) or rows[k] != rows[k - 1] + 1:
+                    first, last = rows[run_start], rows[k - 1]
+                    value_ranges.append({
+                        "range": f"{JOBS_SHEET_NAME}!I{first}:I{last}",
+                        "values": [[now_str]] * (last - first + 1),
                     })
+                    run_start = k
 
-            if requests:
+            if value_ranges:
                 self.sheets.values().batchUpdate(
                     spreadsheetId=sheet_id,
                     body={
                         "valueInputOption": "USER_ENTERED",
-                        "data": requests,
+                        "data": value_ranges,
                     },
                 ).execute()
 
         try:
             retry_with_backoff(_update)
         except Exception as e:
-            print(f"Error updating job last_seen: {e}")
+            logger.error("Error updating job last_seen: %s", e)
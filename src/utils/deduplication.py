@@ -2,7 +2,14 @@
 Deduplication utilities for job listings.
 """
 import hashlib
-from typing import List, Set, Dict, Any
+import re
+from typing import Iterable, List, Set, Dict, Any, Tuple
+
+from scraper.base_scraper import Job
+
+# Runs of punctuation and whitespace, collapsed when normalizing text.
+# Digits are kept: "Analyst 2" and "Analyst 3" are different roles.
+_NOISE = re.compile(r"[\W_]+")
 
 
 def generate_job_hash(job_url: str, company_name: str) -> str:
@@ -14,10 +21,10 @@ def generate_job_hash(job_url: str, company_name: str) -> str:
         company_name: The company name.
 
     Returns:
-        16-character hash string.
+        16-character hash string (64-bit BLAKE2b digest).
     """
     content = f"{company_name}:{job_url}".lower()
-    return hashlib.md5(content.encode()).hexdigest()[:16]
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
 
 
 def filter_new_jobs(
@@ -52,3 +59,126 @@ def find_existing_jobs(
         List of job IDs that exist in both.
     """
     return [job["job_id"] for job in jobs if job.get("job_id") in existing_ids]
+
+
+def partition_jobs(
+    jobs: List[Job],
+    existing_ids: Set[str],
+) -> Tuple[List[Job], List[str]]:
+    """
+    Split jobs into new ones and IDs of existing ones in a single pass.
+
+    Same result as filter_new_jobs and find_existing_jobs together, with one
+    membership test per job.
+
+    Args:
+        jobs: List of scraped Jobs to check.
+        existing_ids: Set of existing job IDs.
+
+    Returns:
+        (new_jobs, existing_job_ids).
+    """
+    new_jobs = []
+    existing_job_ids = []
+    for job in jobs:
+        job_id = job.job_id
+        if job_id in existing_ids:
+            existing_job_ids.append(job_id)
+        else:
+            new_jobs.append(job)
+    return new_jobs, existing_job_ids
+
+
+def adopt_stored_job_ids(jobs: List[Job], stored_ids_by_url: Dict[str, str]) -> None:
+    """
+    Give jobs whose URL is already stored the job ID of the stored row.
+
+    Carries rows written under an older job ID scheme over to the current
+    one: the posting is matched as existing (and its last_seen updated)
+    instead of being appended again under its new ID.
+
+    Args:
+        jobs: Scraped Jobs; their job_id is updated in place.
+        stored_ids_by_url: Dict of job_url -> job_id of stored rows.
+    """
+    for job in jobs:
+        stored_id = stored_ids_by_url.get(job.job_url)
+        if stored_id:
+            job.job_id = stored_id
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for near-duplicate comparison.
+
+    Lowercases and replaces punctuation with single spaces, so
+    "Data Analyst (Remote)" and "data analyst - remote" compare equal.
+    """
+    return " ".join(_NOISE.sub(" ", text.lower()).split())
+
+
+def generate_content_key(company_name: str, job_title: str, location: str = "") -> bytes:
+    """
+    Generate a key identifying a job by its content rather than its URL.
+
+    The same posting listed under several career URLs (reposts, regional
+    mirrors) gets different job IDs but the same content key.
+
+    Args:
+        company_name: The company name.
+        job_title: The job title.
+        location: The job location.
+
+    Returns:
+        8-byte digest of the normalized company, title and location.
+    """
+    content = "|".join((normalize_text(company_name), normalize_text(job_title), normalize_text(location)))
+    return hashlib.blake2b(content.encode(), digest_size=8).digest()
+
+
+def content_keys_from_rows(rows: Iterable[Tuple[str, str, str, str]]) -> Dict[bytes, Set[str]]:
+    """
+    Build the near-duplicate index from jobs already stored.
+
+    Args:
+        rows: (company_name, job_title, location, company_career_url) per stored job.
+
+    Returns:
+        Dict of content key -> career URLs the content was found under.
+    """
+    seen_keys: Dict[bytes, Set[str]] = {}
+    for company_name, job_title, location, career_url in rows:
+        key = generate_content_key(company_name, job_title, location)
+        seen_keys.setdefault(key, set()).add(career_url)
+    return seen_keys
+
+
+def filter_near_duplicates(
+    jobs: List[Job],
+    seen_keys: Dict[bytes, Set[str]],
+) -> List[Job]:
+    """
+    Drop jobs already found under a different career URL.
+
+    A job is a near-duplicate when its content key was seen before, but only
+    from other career URLs: the same posting reached through a second career
+    page. Jobs with the same content from the same career URL are distinct
+    openings (e.g. separate requisitions) and are kept.
+
+    Args:
+        jobs: List of scraped Jobs to filter.
+        seen_keys: Content key -> career URLs, seeded from the stored jobs
+            (see content_keys_from_rows); updated with the kept jobs.
+
+    Returns:
+        Jobs that are not a repost of a job from another career URL.
+    """
+    unique = []
+    for job in jobs:
+        key = generate_content_key(job.company_name, job.job_title, job.location)
+        career_urls = seen_keys.setdefault(key, set())
+        if career_urls and job.company_career_url not in career_urls:
+            continue
+        career_urls.add(job.company_career_url)
+        unique.append(job)
+    return unique
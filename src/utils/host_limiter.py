@@ -0,0 +1,36 @@
+"""
+Per-host concurrency limits shared by all scrapers.
+
+Many companies sit on the same ATS host (boards.greenhouse.io, *.icims.com,
+api.lever.co, ...), so concurrency is capped per hostname rather than per
+scraper to avoid tripping rate limits when companies are scraped in parallel.
+"""
+import asyncio
+from typing import Dict
+from urllib.parse import urlparse
+
+from config import MAX_CONCURRENT_PER_HOST
+
+_HOST_SEMS: Dict[str, asyncio.Semaphore] = {}
+
+
+def sem_for(host: str, limit: int = MAX_CONCURRENT_PER_HOST) -> asyncio.Semaphore:
+    """
+    Get (or lazily create) the semaphore guarding a hostname.
+
+    Args:
+        host: Hostname (netloc) to limit.
+        limit: Maximum concurrent requests when the semaphore is created.
+
+    Returns:
+        Semaphore shared by every request to this host.
+    """
+    sem = _HOST_SEMS.get(host)
+    if sem is None:
+        sem = _HOST_SEMS[host] = asyncio.Semaphore(limit)
+    return sem
+
+
+def host_semaphore(url: str) -> asyncio.Semaphore:
+    """Get the semaphore for the host of a URL."""
+    return sem_for(urlparse(url).netloc.lower())
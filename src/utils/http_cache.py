@@ -0,0 +1,97 @@
+"""
+On-disk cache for ATS API responses with HTTP revalidation.
+
+Each entry stores the raw response body next to its ETag / Last-Modified
+validators, so repeat runs can send a conditional GET and reuse the cached
+body when the server answers 304 Not Modified. With HTTP_CACHE_TTL_SECONDS
+set, entries younger than the TTL are reused without any request at all.
+"""
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, Optional
+
+from config import HTTP_CACHE_DIR, HTTP_CACHE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def _paths(key: str):
+    """Get the (body, metadata) file paths for a cache key."""
+    safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+    base = os.path.join(HTTP_CACHE_DIR, safe_key)
+    return base + ".body", base + ".meta.json"
+
+
+def load(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached response.
+
+    Args:
+        key: Cache key (e.g. "lever_acme").
+
+    Returns:
+        Dict with etag, last_modified, fetched_at and body (bytes),
+        or None if nothing usable is cached.
+    """
+    body_path, meta_path = _paths(key)
+    try:
+        with open(meta_path, "r") as f:
+            entry = json.load(f)
+        with open(body_path, "rb") as f:
+            entry["body"] = f.read()
+        return entry
+    except (OSError, ValueError):
+        return None
+
+
+def is_fresh(entry: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a cached entry is young enough to use without a request."""
+    if not entry or HTTP_CACHE_TTL_SECONDS <= 0:
+        return False
+    return time.time() - entry.get("fetched_at", 0) < HTTP_CACHE_TTL_SECONDS
+
+
+def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from a cached entry."""
+    headers: Dict[str, str] = {}
+    if not entry:
+        return headers
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def save(key: str, response) -> None:
+    """
+    Store a 200 response body and its validators.
+
+    Responses without an ETag or Last-Modified header are only cached when
+    a TTL is configured, since otherwise they could never be reused.
+
+    Args:
+        key: Cache key.
+        response: A requests.Response with status 200.
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified and HTTP_CACHE_TTL_SECONDS <= 0:
+        return
+
+    body_path, meta_path = _paths(key)
+    try:
+        os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+        with open(body_path, "wb") as f:
+            f.write(response.content)
+        with open(meta_path, "w") as f:
+            json.dump({
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time(),
+            }, f)
+    except OSError as e:
+        logger.debug("Could not write HTTP cache entry %s: %s", key, e)
@@ -0,0 +1,56 @@
+"""
+Shared HTTP session for ATS JSON API calls.
+
+One requests.Session is reused by every scraper so TCP connections and TLS
+sessions to the same API host are kept alive across companies.
+"""
+import json
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # Optional: much faster parsing of large API responses
+except ImportError:
+    orjson = None
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Connection pool sizing: a handful of API hosts, several requests in flight each
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 16
+
+_SESSION: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Get the process-wide HTTP session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.headers.update({"User-Agent": USER_AGENT})
+        _SESSION = session
+    return _SESSION
+
+
+def parse_json(content: bytes) -> Any:
+    """
+    Parse a JSON response body.
+
+    Uses orjson when it is installed, otherwise the stdlib json module.
+
+    Args:
+        content: Raw response bytes (response.content).
+
+    Returns:
+        The decoded JSON value.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
@@ -2,10 +2,68 @@
 Keyword filtering utilities.
 """
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from config import KEYWORDS
 
+_WORD_CHAR = re.compile(r"\w")
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Whether \\b matches at text[index] (between index - 1 and index)."""
+    before = index > 0 and _WORD_CHAR.match(text[index - 1]) is not None
+    after = index < len(text) and _WORD_CHAR.match(text[index]) is not None
+    return before != after
+
+
+def _compile_keywords(keywords: List[str]):
+    """
+    Build a single-pass matcher for whole-word keyword matching.
+
+    One regex scans the title once. At every word start, a lookahead picks
+    the longest keyword there. Shorter keywords that match at the same
+    position (e.g. "data" inside "data analyst") are then added from a
+    precomputed table, so overlapping matches are still reported.
+
+    Returns:
+        (pattern, expansions, keywords): the compiled regex, a map from each
+        lowercased keyword to the input positions of every keyword it
+        implies, and the keywords as a tuple.
+    """
+    by_lower = {}
+    for i, keyword in enumerate(keywords):
+        by_lower.setdefault(keyword.lower(), []).append(i)
+
+    if not by_lower:
+        # Nothing to match: a pattern that never matches (an empty alternation would match everywhere)
+        return re.compile(r"(?!)()"), {}, ()
+
+    # Longest first so the alternation prefers the longest keyword at a position
+    alternatives = sorted(by_lower, key=len, reverse=True)
+    pattern = re.compile(r"(?=\b(" + "|".join(map(re.escape, alternatives)) + r")\b)")
+
+    expansions = {
+        longer: [
+            i
+            for shorter, positions in by_lower.items()
+            if shorter == longer
+            or (longer.startswith(shorter) and _is_word_boundary(longer, len(shorter)))
+            for i in positions
+        ]
+        for longer in alternatives
+    }
+    return pattern, expansions, tuple(keywords)
+
+
+@lru_cache(maxsize=32)
+def _matcher_for(keywords: Tuple[str, ...]):
+    """Compiled matcher for a keyword list (cached, so custom lists compile once)."""
+    return _compile_keywords(list(keywords))
+
+
+_DEFAULT_MATCHER = _compile_keywords(KEYWORDS)
+
 
 def matches_any_keyword(text: str, keywords: List[str] = None) -> List[str]:
     """
@@ -19,18 +77,17 @@ def matches_any_keyword(text: str, keywords: List[str] = None) -> List[str]:
         List of matched keywords.
     """
     if keywords is None:
-        keywords = KEYWORDS
-
-    text_lower = text.lower()
-    matched = []
+        pattern, expansions, keywords = _DEFAULT_MATCHER
+    else:
+        pattern, expansions, keywords = _matcher_for(tuple(keywords))
 
-    for keyword in keywords:
-        # Word boundary matching for accuracy
-        pattern = r"\b" + re.escape(keyword.lower()) + r"\b"
-        if re.search(pattern, text_lower):
-            matched.append(keyword)
+    # Word boundary matching for accuracy, all keywords in one scan.
+    # Positions rather than keywords, so duplicates in the list are reported like before.
+    matched = set()
+    for match in pattern.finditer(text.lower()):
+        matched.update(expansions[match.group(1)])
 
-    return matched
+    return [keywords[i] for i in sorted(matched)]
 
 
 def is_relevant_job(job_title: str) -> bool:
@@ -43,4 +100,5 @@ def is_relevant_job(job_title: str) -> bool:
     Returns:
         True if matches any keyword, False otherwise.
     """
-    return len(matches_any_keyword(job_title)) > 0
+    # Stop at the first hit; which keywords matched doesn't matter here
+    return _DEFAULT_MATCHER[0].search(job_title.lower()) is not None
@@ -10,7 +10,17 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from utils.job_filter import matches_any_keyword, is_relevant_job
-from utils.deduplication import generate_job_hash, filter_new_jobs
+from utils.deduplication import (
+    adopt_stored_job_ids, content_keys_from_rows, generate_job_hash, filter_new_jobs, filter_near_duplicates, partition_jobs,
+)
+from utils.host_limiter import host_semaphore
+from utils.http_session import parse_json
+from utils import http_cache
+from scraper.base_scraper import Job
+from scraper.lever_scraper import LeverScraper
+from scraper.workday_scraper import WorkdayScraper
+import sheets_client
+from sheets_client import SheetsClient
 
 
 class TestKeywordFilter:
@@ -37,6 +47,11 @@ class TestKeywordFilter:
         result = matches_any_keyword("Machine Learning Engineer")
         assert "machine learning" in result
 
+    def test_custom_keyword_lists(self):
+        """An empty list should match nothing; duplicates should be reported like any keyword."""
+        assert matches_any_keyword("Data Analyst", []) == []
+        assert matches_any_keyword("Data Analyst", ["data", "analyst", "data"]) == ["data", "analyst", "data"]
+
     def test_is_relevant_data_engineer(self):
         """Data engineer should be relevant."""
         assert is_relevant_job("Senior Data Engineer")
@@ -45,6 +60,13 @@ class TestKeywordFilter:
         """Sales role should not be relevant."""
         assert not is_relevant_job("Sales Representative")
 
+    def test_scraper_reports_overlapping_keywords(self):
+        """Scrapers should report every keyword, including overlapping ones."""
+        scraper = LeverScraper("Acme", "https://jobs.lever.co/acme")
+        result = scraper.matches_keywords("Senior Data Analyst (AI)")
+        assert result == ["data", "analyst", "data analyst", "ai"]
+        assert scraper.matches_keywords("Maintenance Lead") == []
+
 
 class TestDeduplication:
     """Tests for deduplication utilities."""
@@ -61,6 +83,12 @@ class TestDeduplication:
         hash2 = generate_job_hash("https://example.com/job/456", "Company A")
         assert hash1 != hash2
 
+    def test_fallback_job_id_is_stable(self):
+        """Fallback job IDs are stored in the sheet and must keep their derivation."""
+        scraper = LeverScraper("Acme", "https://jobs.lever.co/acme")
+        job_id = scraper.generate_job_id("https://acme.com/careers/data-analyst?src=x", "Data Analyst")
+        assert job_id == "844bb28f438eac33"
+
     def test_filter_new_jobs(self):
         """Should filter out existing jobs."""
         jobs = [
@@ -75,6 +103,288 @@ class TestDeduplication:
         assert len(new_jobs) == 1
         assert new_jobs[0]["job_id"] == "def456"
 
+    def test_partition_jobs(self):
+        """Should split jobs into new jobs and existing IDs in one pass."""
+        jobs = [Job(job_id, "Data Analyst", "", "Acme", "") for job_id in ("abc123", "def456", "ghi789")]
+
+        new_jobs, existing_job_ids = partition_jobs(jobs, {"abc123", "ghi789"})
+
+        assert new_jobs == [jobs[1]]
+        assert existing_job_ids == ["abc123", "ghi789"]
+
+    def test_adopt_stored_job_ids(self):
+        """Jobs whose URL is already stored should take the stored row's ID."""
+        jobs = [
+            Job("WD_R1", "Data Analyst", "https://acme.com/job/Austin/Data-Analyst_R1", "Acme", ""),
+            Job("WD_R2", "Data Analyst", "https://acme.com/job/Austin/Data-Analyst_R2", "Acme", ""),
+        ]
+
+        adopt_stored_job_ids(jobs, {"https://acme.com/job/Austin/Data-Analyst_R1": "WD_Austin"})
+
+        assert [job.job_id for job in jobs] == ["WD_Austin", "WD_R2"]
+
+    def test_filter_near_duplicates(self):
+        """Should drop a posting reached through a second career URL, but keep distinct openings."""
+        jobs = [
+            Job("a", "Data Analyst", "https://acme.com/1", "Acme", "https://acme.com", "Remote"),
+            Job("b", "Data Analyst (Remote)", "https://acme.com/2", "Acme", "https://acme.com", "remote"),
+            Job("c", "Data Analyst 2", "https://acme.com/3", "Acme", "https://acme.com", "Remote"),
+            Job("d", "Data Analyst", "https://mirror.com/1", "Acme", "https://mirror.com", "Remote"),
+        ]
+
+        unique = filter_near_duplicates(jobs, {})
+
+        assert [job.job_id for job in unique] == ["a", "b", "c"]
+
+    def test_near_duplicates_across_runs(self):
+        """A repost dropped in one run should stay dropped once the original is in the sheet."""
+        original = Job("a", "Data Analyst", "https://acme.com/1", "Acme", "https://acme.com", "Remote")
+        repost = Job("b", "Data Analyst", "https://mirror.com/1", "Acme", "https://mirror.com", "Remote")
+        sheet = []
+
+        for _ in range(3):
+            seen = content_keys_from_rows(
+                (job.company_name, job.job_title, job.location, job.company_career_url) for job in sheet
+            )
+            new_jobs, _ = partition_jobs([original, repost], {job.job_id for job in sheet})
+            sheet.extend(filter_near_duplicates(new_jobs, seen))
+
+        assert sheet == [original]
+
+
+class TestHostLimiter:
+    """Tests for per-host concurrency limits."""
+
+    def test_same_host_shares_semaphore(self):
+        """URLs on the same host should share one semaphore."""
+        sem1 = host_semaphore("https://boards.greenhouse.io/acme")
+        sem2 = host_semaphore("https://BOARDS.greenhouse.io/other/jobs/1")
+        assert sem1 is sem2
+
+    def test_different_hosts_are_independent(self):
+        """Different hosts should get different semaphores."""
+        sem1 = host_semaphore("https://jobs.lever.co/acme")
+        sem2 = host_semaphore("https://acme.icims.com/jobs")
+        assert sem1 is not sem2
+
+
+class TestHttpSession:
+    """Tests for shared HTTP helpers."""
+
+    def test_parse_json_bytes(self):
+        """Should decode a JSON response body."""
+        result = parse_json(b'[{"id": "abc", "text": "Data Analyst"}]')
+        assert result == [{"id": "abc", "text": "Data Analyst"}]
+
+
+class TestHttpCache:
+    """Tests for the conditional-GET response cache."""
+
+    def test_save_and_revalidate(self, tmp_path, monkeypatch):
+        """Saved responses should come back with their validators."""
+        monkeypatch.setattr(http_cache, "HTTP_CACHE_DIR", str(tmp_path))
+        response = Mock(headers={"ETag": '"v1"'}, content=b"[]")
+
+        http_cache.save("lever_acme", response)
+        entry = http_cache.load("lever_acme")
+
+        assert entry["body"] == b"[]"
+        assert http_cache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+
+    def test_fresh_within_ttl(self, tmp_path, monkeypatch):
+        """With a TTL, recent responses are reusable even without validators."""
+        monkeypatch.setattr(http_cache, "HTTP_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(http_cache, "HTTP_CACHE_TTL_SECONDS", 3600)
+        response = Mock(headers={}, content=b'{"content": []}')
+
+        http_cache.save("smartrecruiters_acme_0_100", response)
+        entry = http_cache.load("smartrecruiters_acme_0_100")
+
+        assert http_cache.is_fresh(entry)
+        monkeypatch.setattr(http_cache, "HTTP_CACHE_TTL_SECONDS", 0)
+        assert not http_cache.is_fresh(entry)
+
+
+class TestSharedContext:
+    """Tests for scraping with an injected BrowserContext."""
+
+    @pytest.mark.asyncio
+    async def test_open_page_uses_injected_context(self):
+        """Should open pages in the given context and close only the page."""
+        page = AsyncMock()
+        context = Mock(new_page=AsyncMock(return_value=page), close=AsyncMock())
+        scraper = LeverScraper("Acme", "https://jobs.lever.co/acme", context=context)
+
+        async with scraper.open_page() as opened:
+            assert opened is page
+
+        page.close.assert_awaited_once()
+        context.close.assert_not_called()
+
+
+class TestWorkdayApi:
+    """Tests for mapping Workday career URLs to the CXS jobs API."""
+
+    def test_api_url_skips_locale(self):
+        """Should find tenant and site, keeping the locale in job URLs."""
+        scraper = WorkdayScraper("Acme", "https://acme.wd5.myworkdayjobs.com/en-US/External")
+        assert scraper.api_url == "https://acme.wd5.myworkdayjobs.com/wday/cxs/acme/External/jobs"
+
+        job = scraper._job_from_posting({
+            "title": "Data Analyst",
+            "externalPath": "/job/Remote/Data-Analyst_R42",
+            "bulletFields": ["R42"],
+        })
+        assert job.job_url == "https://acme.wd5.myworkdayjobs.com/en-US/External/job/Remote/Data-Analyst_R42"
+        assert job.job_id == "WD_R42"
+        assert job.keywords_matched
+
+    @pytest.mark.asyncio
+    async def test_intercepted_jobs_keep_locale(self):
+        """Jobs from intercepted XHRs should get the same URL as jobs from the API."""
+        scraper = WorkdayScraper("Acme", "https://acme.wd5.myworkdayjobs.com/en-US/External")
+        response = Mock(
+            url="https://acme.wd5.myworkdayjobs.com/wday/cxs/acme/External/jobs",
+            json=AsyncMock(return_value={"jobPostings": [
+                {"title": "Data Analyst", "externalPath": "/job/Remote/Data-Analyst_R42"},
+            ]}),
+        )
+
+        jobs = await scraper._jobs_from_responses([response])
+
+        assert jobs[0].job_url == "https://acme.wd5.myworkdayjobs.com/en-US/External/job/Remote/Data-Analyst_R42"
+
+    def test_job_id_same_on_every_path(self):
+        """API postings and DOM rows for one posting should get the same requisition-based ID."""
+        scraper = WorkdayScraper("Acme", "https://acme.wd5.myworkdayjobs.com/en-US/External")
+
+        api_job = scraper._job_from_posting({
+            "title": "Data Analyst",
+            "externalPath": "/job/Austin-TX/Data-Analyst_JR12345-1",
+            "bulletFields": ["JR12345"],
+        })
+        dom_job = scraper._parse_workday_job(
+            "/en-US/External/job/Austin-TX/Data-Analyst_JR12345-1", "Data Analyst", "Austin, TX"
+        )
+
+        assert api_job.job_id == dom_job.job_id == "WD_JR12345-1"
+
+    def test_non_matching_posting_skipped(self):
+        """Should drop postings whose title matches no keyword before building a Job."""
+        scraper = WorkdayScraper("Acme", "https://acme.wd5.myworkdayjobs.com/External")
+        assert scraper._job_from_posting({"title": "Forklift Operator", "externalPath": "/job/X_R1"}) is None
+        assert scraper.listings_read == 1
+
+
+class TestSheetsJobRowCache:
+    """Tests for the cached job-ID column in SheetsClient."""
+
+    def _client(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sheets_client, "JOBS_SNAPSHOT_DIR", str(tmp_path))
+        client = SheetsClient.__new__(SheetsClient)
+        client._job_rows_cache = {}
+        client._scraped_companies_cache = {}
+        client._company_rows_cache = {}
+        client.sheets = Mock()
+        return client
+
+    def test_column_a_read_once(self, tmp_path, monkeypatch):
+        """Lookups and last_seen updates should share one read of column A."""
+        client = self._client(tmp_path, monkeypatch)
+        values = client.sheets.values.return_value
+        values.get.return_value.execute.return_value = {"values": [["a"], ["b"]]}
+        values.append.return_value.execute.return_value = {
+            "updates": {"updatedRange": "Sheet1!A4:K4", "updatedRows": 1},
+        }
+
+        assert client.get_existing_job_ids("sheet") == {"a", "b"}
+        client._record_appended_rows("sheet", values.append().execute(), ["c"])
+        client.update_job_last_seen(["b", "c"], sheet_id="sheet")
+
+        values.get.assert_called_once()
+        data = values.batchUpdate.call_args.kwargs["body"]["data"]
+        assert [d["range"] for d in data] == ["Sheet1!I3:I4"]
+        assert data[0]["values"] == [[data[0]["values"][0][0]]] * 2
+
+    def test_snapshot_fetches_only_new_rows(self, tmp_path, monkeypatch):
+        """A later run should read from the snapshot's last row onwards."""
+        client = self._client(tmp_path, monkeypatch)
+        values = client.sheets.values.return_value
+        values.get.return_value.execute.return_value = {"values": [["a"], ["b"]]}
+        client.get_existing_job_ids("sheet")
+
+        client = self._client(tmp_path, monkeypatch)
+        values = client.sheets.values.return_value
+        values.batchGet.return_value.execute.return_value = {"valueRanges": [
+            {"values": [["a"]]},  # Sampled row 2
+            {"values": [["b"], ["c"]]},  # Snapshot's last row onwards
+        ]}
+
+        assert client.get_existing_job_ids("sheet") == {"a", "b", "c"}
+        assert values.batchGet.call_args.kwargs["ranges"] == ["Sheet1!A2", "Sheet1!A3:A"]
+        values.get.assert_not_called()
+
+    def test_snapshot_rejected_when_rows_move(self, tmp_path, monkeypatch):
+        """A snapshot whose sampled rows no longer match should trigger a full re-read."""
+        client = self._client(tmp_path, monkeypatch)
+        values = client.sheets.values.return_value
+        values.get.return_value.execute.return_value = {"values": [["a"], ["b"]]}
+        client.get_existing_job_ids("sheet")
+
+        client = self._client(tmp_path, monkeypatch)
+        values = client.sheets.values.return_value
+        # Row 2 now holds "x" (rows sorted or inserted), though row 3 still reads "b"
+        values.batchGet.return_value.execute.return_value = {"valueRanges": [
+            {"values": [["x"]]},
+            {"values": [["b"]]},
+        ]}
+        values.get.return_value.execute.return_value = {"values": [["x"], ["b"], ["a"]]}
+
+        assert client._get_job_rows("sheet") == {"x": [2], "b": [3], "a": [4]}
+        assert values.get.call_args.kwargs["range"] == "Sheet1!A2:A"
+
+    def test_scraped_companies_read_once(self, tmp_path, monkeypatch):
+        """Column C should be read once, then updated by appends."""
+        client = self._client(tmp_path, monkeypatch)
+        values = client.sheets.values.return_value
+        values.get.return_value.execute.return_value = {"values": [["Acme"]]}
+        values.append.return_value.execute.return_value = {"updates": {"updatedRows": 2}}
+
+        assert client.get_scraped_companies("sheet") == {"Acme"}
+        client.append_jobs_bulk({"Globex": [Job("g1", "Data Analyst", "", "Globex", "")]}, sheet_id="sheet")
+
+        assert client.get_scraped_companies("sheet") == {"Acme", "Globex"}
+        values.get.assert_called_once()
+
+    def test_company_rows_read_once(self, tmp_path, monkeypatch):
+        """Status updates should share one read of the companies column."""
+        client = self._client(tmp_path, monkeypatch)
+        values = client.sheets.values.return_value
+        values.get.return_value.execute.return_value = {"values": [["company_name"], ["Acme"], ["Globex"]]}
+
+        client.update_company_status("Acme", "active", sheet_id="companies")
+        client.update_company_status("Globex", "error", sheet_id="companies")
+
+        values.get.assert_called_once()
+        assert values.batchUpdate.call_args.kwargs["body"]["data"][0]["range"].endswith("!D3:E3")
+
+
+class TestSheetsSessionHttp:
+    """Tests for sending Sheets API calls through a pooled session."""
+
+    def test_request_through_session(self):
+        """googleapiclient requests should go through the session and decode normally."""
+        response = Mock(status_code=200, reason="OK", headers={"Content-Type": "application/json"},
+                        content=b'{"values": [["a"]]}')
+        http = sheets_client.SessionHttp(Mock(universe_domain="googleapis.com"))
+        http.session = Mock(request=Mock(return_value=response))
+        service = sheets_client.build("sheets", "v4", http=http, model=sheets_client.FastJsonModel())
+
+        result = service.spreadsheets().values().get(spreadsheetId="sheet", range="Sheet1!A2:A").execute()
+
+        assert result == {"values": [["a"]]}
+        assert http.session.request.call_args.args[0] == "GET"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,124 +3,356 @@
 Verify which company career URLs are working.
 Uses requests library for simple HTTP HEAD/GET checks.
 """
+import asyncio
 import csv
+import json
+import logging
+import logging.handlers
+import os
 import sys
 import time
-from typing import List, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
+try:
+    import uvloop  # Optional: faster event loop for many concurrent checks
+except ImportError:
+    uvloop = None
 
-def verify_url(url: str, timeout: int = 10) -> Tuple[str, bool, str]:
+logger = logging.getLogger(__name__)
+
+# How many URLs are checked at once
+MAX_CONCURRENT_CHECKS = 20
+# How many of those may hit the same host, so one slow host can't hog every slot
+MAX_CHECKS_PER_HOST = 2
+# Minimum gap between checks against the same host, to be respectful
+REQUEST_DELAY_SECONDS = 0.2
+
+# Sent with every check; copied, never mutated, when conditional headers are added
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+# HEAD responses that get a second look with a ranged GET
+HEAD_REJECTED_STATUSES = (403, 405)
+
+# URLs that verified as working are not re-checked on runs within the TTL,
+# and are revalidated with their ETag / Last-Modified after it
+VERIFY_CACHE_PATH = os.getenv("VERIFY_CACHE_PATH", ".cache/verify_urls.json")
+VERIFY_CACHE_TTL_SECONDS = int(os.getenv("VERIFY_CACHE_TTL_SECONDS", str(24 * 3600)))
+
+# Progress lines are buffered and written out this many at a time
+LOG_FLUSH_EVERY = 50
+
+RESULT_FIELDS = ['Company Name', 'Career Search URL', 'Platform Type', 'Status', 'Details']
+VERIFIED_FIELDS = ['Company Name', 'Career Search URL', 'Platform Type']
+
+# (name, url, platform), in VERIFIED_FIELDS order
+Company = Tuple[str, str, str]
+
+
+def configure_logging() -> logging.Handler:
     """
-    Verify if a URL is accessible.
+    Send log lines to stdout through a buffer flushed every LOG_FLUSH_EVERY records.
     
-    Returns:
-        Tuple of (url, is_working, status_message)
+    Warnings and errors flush the buffer immediately. Close the returned
+    handler when done to write out whatever is still buffered.
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    buffered = logging.handlers.MemoryHandler(
+        LOG_FLUSH_EVERY, flushLevel=logging.WARNING, target=stream_handler)
+    
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(buffered)
+    return buffered
+
+
+def _new_session() -> requests.Session:
+    """Session whose connection pool keeps a warm connection for every in-flight host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_CHECKS, pool_maxsize=MAX_CHECKS_PER_HOST)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _load_cache() -> Dict[str, Dict]:
+    """Load cached verification results keyed by URL, or an empty cache if there is none."""
+    try:
+        with open(VERIFY_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: Dict[str, Dict]):
+    """Write the verification cache, dropping expired entries that can't be revalidated."""
+    cutoff = time.time() - VERIFY_CACHE_TTL_SECONDS
+    fresh = {
+        url: entry for url, entry in cache.items()
+        if entry.get('checked_at', 0) > cutoff or entry.get('etag') or entry.get('last_modified')
     }
+    try:
+        os.makedirs(os.path.dirname(VERIFY_CACHE_PATH) or '.', exist_ok=True)
+        with open(VERIFY_CACHE_PATH, 'w') as f:
+            json.dump(fresh, f)
+    except OSError as e:
+        logger.warning("Could not write verification cache: %s", e)
+
+
+def _validators(response: requests.Response) -> Dict[str, str]:
+    """Pick the ETag / Last-Modified validators out of a response."""
+    validators = {}
+    if response.headers.get('ETag'):
+        validators['etag'] = response.headers['ETag']
+    if response.headers.get('Last-Modified'):
+        validators['last_modified'] = response.headers['Last-Modified']
+    return validators
+
+
+def _check_url(url: str, timeout: int = 10, session: Optional[requests.Session] = None,
+               cached: Optional[Dict] = None) -> Tuple[Tuple[str, bool, str], Dict[str, str]]:
+    """
+    Verify if a URL is accessible, revalidating against a previous result if there is one.
+    
+    Args:
+        url: URL to check
+        timeout: Request timeout in seconds
+        session: Shared session to reuse connections; plain requests if None
+        cached: Previous cache entry; its ETag / Last-Modified are sent as
+            If-None-Match / If-Modified-Since so an unchanged page answers 304
+    
+    Returns:
+        Tuple of ((url, is_working, status_message), validators), where
+        validators holds the etag / last_modified to cache for next time
+    """
+    headers = REQUEST_HEADERS
+    validators = {}
+    if cached:
+        validators = {k: cached[k] for k in ('etag', 'last_modified') if cached.get(k)}
+        if validators:
+            headers = dict(REQUEST_HEADERS)
+        if 'etag' in validators:
+            headers['If-None-Match'] = validators['etag']
+        if 'last_modified' in validators:
+            headers['If-Modified-Since'] = validators['last_modified']
+    
+    http = session or requests
     
     try:
         # First try HEAD request (faster)
-        response = requests.head(url, headers=headers, timeout=timeout, allow_redirects=True)
+        response = http.head(url, headers=headers, timeout=timeout, allow_redirects=True)
+        
+        if response.status_code in HEAD_REJECTED_STATUSES:  # Some servers refuse HEAD, try GET
+            # Only the status line is needed: ask for a single byte and never read the body
+            response = http.get(url, headers={**headers, 'Range': 'bytes=0-0'}, timeout=timeout,
+                                allow_redirects=True, stream=True)
+            response.close()
         
-        if response.status_code == 405:  # Method not allowed, try GET
-            response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+        # 304 Not Modified: unchanged since the cached check, keep its validators
+        if response.status_code != 304:
+            validators = _validators(response)
         
         if response.ok:
-            return (url, True, f"OK - HTTP {response.status_code}")
+            return (url, True, f"OK - HTTP {response.status_code}"), validators
         else:
-            return (url, False, f"Error - HTTP {response.status_code}")
+            return (url, False, f"Error - HTTP {response.status_code}"), validators
             
+    # SSLError subclasses ConnectionError, so it has to be caught first
+    except requests.exceptions.SSLError:
+        return (url, False, "Error - SSL error"), validators
     except requests.exceptions.Timeout:
-        return (url, False, "Error - Timeout")
+        return (url, False, "Error - Timeout"), validators
     except requests.exceptions.ConnectionError:
-        return (url, False, "Error - Connection failed")
-    except requests.exceptions.SSLError:
-        return (url, False, "Error - SSL error")
+        return (url, False, "Error - Connection failed"), validators
     except Exception as e:
-        error_msg = str(e)[:50]
-        return (url, False, f"Error - {error_msg}")
+        # Tag by type; str(e) can drag in whole URLs and chained causes
+        return (url, False, f"Error - {type(e).__name__}"), validators
 
 
-def verify_companies_csv(input_csv: str, output_csv: str):
-    """Verify all URLs in a companies CSV and output results."""
+def verify_url(url: str, timeout: int = 10,
+               session: Optional[requests.Session] = None) -> Tuple[str, bool, str]:
+    """
+    Verify if a URL is accessible.
     
-    # Read input CSV
-    companies = []
-    with open(input_csv, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            companies.append(row)
+    Args:
+        url: URL to check
+        timeout: Request timeout in seconds
+        session: Shared session to reuse connections; plain requests if None
     
-    print(f"Verifying {len(companies)} URLs...")
-    print("=" * 60)
+    Returns:
+        Tuple of (url, is_working, status_message)
+    """
+    return _check_url(url, timeout, session)[0]
+
+
+async def _verify_all(companies: List[Company],
+                      cache: Dict[str, Dict]) -> AsyncIterator[Tuple[int, Company, Tuple[str, bool, str]]]:
+    """
+    Check every company URL with MAX_CONCURRENT_CHECKS workers pulling from a shared iterator.
     
-    results = []
-    working_count = 0
+    URLs with a fresh working entry in the cache are answered from it, and
+    stale entries are revalidated with a conditional request; new working
+    results are added to the cache.
     
-    for i, company in enumerate(companies):
-        name = company.get('Company Name', '')
-        url = company.get('Career Search URL', '')
-        platform = company.get('Platform Type', '')
-        
-        if not url:
-            continue
+    Yields:
+        (index, company, (url, is_working, status_message)) as each check
+        finishes, index being the company's position in companies
+    """
+    host_semaphores = defaultdict(lambda: asyncio.Semaphore(MAX_CHECKS_PER_HOST))
+    next_slot: Dict[str, float] = {}
+    loop = asyncio.get_running_loop()
+    
+    async def wait_turn(host: str):
+        # Reserve this host's next slot before sleeping so concurrent checks queue up behind it
+        now = loop.time()
+        slot = max(now, next_slot.get(host, now))
+        next_slot[host] = slot + REQUEST_DELAY_SECONDS
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    # One thread per worker; asyncio.to_thread's default pool is only cpu_count + 4 wide
+    with _new_session() as session, ThreadPoolExecutor(
+            MAX_CONCURRENT_CHECKS, thread_name_prefix='verify') as executor:
+        async def check(company: Company):
+            url = company[1]
+            entry = cache.get(url)
+            if entry and time.time() - entry.get('checked_at', 0) < VERIFY_CACHE_TTL_SECONDS:
+                return company, (url, True, entry['status'])
+            
+            host = urlparse(url).netloc
+            async with host_semaphores[host]:
+                await wait_turn(host)
+                result, validators = await loop.run_in_executor(
+                    executor, partial(_check_url, url, session=session, cached=entry))
+            
+            # Only working results are cached, so failures are always re-checked
+            if result[1]:
+                cache[url] = {'status': result[2], 'checked_at': time.time(), **validators}
+            else:
+                cache.pop(url, None)
+            return company, result
         
-        print(f"  [{i+1:3d}/{len(companies)}] {name[:30]:30s}", end=' ', flush=True)
+        # Only one check per worker is ever in flight, however long the company list is
+        pending = iter(enumerate(companies))
+        finished: asyncio.Queue = asyncio.Queue()
         
-        _, is_working, status = verify_url(url)
+        async def worker():
+            for index, company in pending:
+                finished.put_nowait((index, *await check(company)))
         
+        async with asyncio.TaskGroup() as workers:
+            for _ in range(min(MAX_CONCURRENT_CHECKS, len(companies))):
+                workers.create_task(worker())
+            for _ in companies:
+                yield await finished.get()
+
+
+async def _write_results(companies: List[Company], cache: Dict[str, Dict],
+                         full_writer, verified_writer) -> int:
+    """
+    Write results to both CSVs in input order while checks finish out of order.
+    
+    Progress is logged as each check finishes; its rows are written as soon as
+    every earlier company's result is in. Returns the working count.
+    """
+    working_count = 0
+    done = 0
+    # Finished results waiting for an earlier company's check, by input index
+    held: Dict[int, Tuple[Company, bool, str]] = {}
+    next_index = 0
+    
+    async for index, company, (_, is_working, status) in _verify_all(companies, cache):
+        done += 1
+        name = company[0]
         if is_working:
             working_count += 1
-            print("✓ Working")
+            logger.info("  [%3d/%d] %-30.30s ✓ Working", done, len(companies), name)
         else:
-            print(f"✗ {status}")
+            logger.info("  [%3d/%d] %-30.30s ✗ %s", done, len(companies), name, status)
         
-        results.append({
-            'Company Name': name,
-            'Career Search URL': url,
-            'Platform Type': platform,
-            'Status': 'Working' if is_working else 'Not Working',
-            'Details': status,
-        })
+        held[index] = (company, is_working, status)
+        while next_index in held:
+            company, is_working, status = held.pop(next_index)
+            full_writer.writerow((*company, 'Working' if is_working else 'Not Working', status))
+            if is_working:
+                verified_writer.writerow(company)
+            next_index += 1
+    
+    return working_count
+
+
+def _read_companies(input_csv: str) -> List[Company]:
+    """
+    Read the companies that have a career URL from an input CSV.
+    
+    Columns are looked up by header once and read by position; Platform Type
+    is optional.
+    
+    Raises:
+        ValueError: If the Company Name or Career Search URL column is missing
+    """
+    companies = []
+    with open(input_csv, 'r', newline='', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        try:
+            name_i = header.index('Company Name')
+            url_i = header.index('Career Search URL')
+        except ValueError:
+            raise ValueError(f"{input_csv} needs 'Company Name' and 'Career Search URL' columns")
+        platform_i = header.index('Platform Type') if 'Platform Type' in header else None
+        width = len(header)
         
-        # Small delay to be respectful
-        time.sleep(0.2)
-    
-    # Write output CSV with all results
-    print("\n" + "=" * 60)
-    with open(output_csv, 'w', newline='') as f:
-        fieldnames = ['Company Name', 'Career Search URL', 'Platform Type', 'Status', 'Details']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
-    
-    print(f"=== SUMMARY ===")
-    print(f"Total: {len(results)}")
-    print(f"Working: {working_count}")
-    print(f"Not Working: {len(results) - working_count}")
-    print(f"\nFull results: {output_csv}")
-    
-    # Also output a verified-only CSV (for direct import)
+        for row in reader:
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            if row[url_i]:
+                platform = row[platform_i] if platform_i is not None else ''
+                companies.append((row[name_i], row[url_i], platform))
+    
+    return companies
+
+
+def verify_companies_csv(input_csv: str, output_csv: str):
+    """Verify all URLs in a companies CSV and output results."""
+    
+    companies = _read_companies(input_csv)
+    
+    logger.info("Verifying %d URLs...", len(companies))
+    logger.info("=" * 60)
+    
+    # Full results plus a verified-only CSV (for direct import), both in input order, streamed as results come in
     verified_csv = output_csv.replace('.csv', '_verified_only.csv')
-    with open(verified_csv, 'w', newline='') as f:
-        fieldnames = ['Company Name', 'Career Search URL', 'Platform Type']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in results:
-            if r['Status'] == 'Working':
-                writer.writerow({
-                    'Company Name': r['Company Name'],
-                    'Career Search URL': r['Career Search URL'],
-                    'Platform Type': r['Platform Type'],
-                })
-    
-    print(f"Verified URLs only: {verified_csv}")
-    print("=" * 60)
+    with open(output_csv, 'w', newline='') as full_f, open(verified_csv, 'w', newline='') as verified_f:
+        full_writer = csv.writer(full_f)
+        verified_writer = csv.writer(verified_f)
+        full_writer.writerow(RESULT_FIELDS)
+        verified_writer.writerow(VERIFIED_FIELDS)
+        cache = _load_cache()
+        try:
+            loop_factory = uvloop.new_event_loop if uvloop else None
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                working_count = runner.run(_write_results(companies, cache, full_writer, verified_writer))
+        finally:
+            _save_cache(cache)
+    
+    logger.info("\n" + "=" * 60)
+    logger.info("=== SUMMARY ===")
+    logger.info("Total: %d", len(companies))
+    logger.info("Working: %d", working_count)
+    logger.info("Not Working: %d", len(companies) - working_count)
+    logger.info("\nFull results: %s", output_csv)
+    logger.info("Verified URLs only: %s", verified_csv)
+    logger.info("=" * 60)
 
 
 if __name__ == '__main__':
@@ -132,4 +364,8 @@ if __name__ == '__main__':
     input_csv = sys.argv[1]
     output_csv = sys.argv[2] if len(sys.argv) > 2 else 'companies_verification_results.csv'
     
-    verify_companies_csv(input_csv, output_csv)
+    log_handler = configure_logging()
+    try:
+        verify_companies_csv(input_csv, output_csv)
+    finally:
+        log_handler.close()